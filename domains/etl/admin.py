@@ -8,6 +8,7 @@ from domains.etl.models import (
     TaskMapping,
     TaskMappingPath,
     TaskRun,
+    TaskRunRetentionPolicy,
 )
 from hydroserver.admin import VocabularyAdmin
 
@@ -45,7 +46,8 @@ class DataConnectionNotificationRecipientAdmin(admin.ModelAdmin):
 
 class TaskAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "data_connection__name", "orchestration_system__name",
-                    "data_connection__workspace__name")
+                    "data_connection__workspace__name", "latest_run_status", "latest_run_started_at")
+    readonly_fields = ("latest_run", "latest_run_status", "latest_run_started_at", "latest_run_finished_at")
 
 
 class TaskMappingAdmin(admin.ModelAdmin):
@@ -59,7 +61,13 @@ class TaskMappingPathAdmin(admin.ModelAdmin):
 
 
 class TaskRunAdmin(admin.ModelAdmin):
-    list_display = ("id", "status", "started_at", "finished_at", "result")
+    list_display = (
+        "id", "status", "started_at", "finished_at", "message", "failure_count", "values_loaded", "duration"
+    )
+
+
+class TaskRunRetentionPolicyAdmin(admin.ModelAdmin):
+    list_display = ("workspace__name", "days")
 
 
 admin.site.register(OrchestrationSystem, OrchestrationSystemAdmin)
@@ -69,3 +77,4 @@ admin.site.register(Task, TaskAdmin)
 admin.site.register(TaskMapping, TaskMappingAdmin)
 admin.site.register(TaskMappingPath, TaskMappingPathAdmin)
 admin.site.register(TaskRun, TaskRunAdmin)
+admin.site.register(TaskRunRetentionPolicy, TaskRunRetentionPolicyAdmin)
@@ -0,0 +1,198 @@
+import json
+import uuid
+import hashlib
+import pandas as pd
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Optional
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.db import connection
+from django.utils import timezone
+
+
+EXTRACTION_CACHE_PREFIX = "v1"
+STAGED_LOAD_PREFIX = "staged-loads"
+
+
+def get_extraction_cache_storage():
+    """
+    Returns the private storage backend for cached extraction payloads. Payloads may hold data from authenticated
+    sources, so they are kept out of the default storage that file attachments are served from.
+    """
+
+    return storages["etl_extraction_cache"]
+
+
+def get_extraction_cache_timeout() -> int:
+    return max(
+        int(getattr(settings, "ETL_EXTRACTION_CACHE_TIMEOUT", 60)),
+        0,
+    )
+
+
+def build_extraction_cache_key(request: dict) -> str:
+    return hashlib.sha256(
+        json.dumps(request, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+@contextmanager
+def extraction_cache_lock(cache_key: str):
+    """
+    Serializes fetches of the same extractor request across workers with a PostgreSQL advisory lock, so
+    co-scheduled tasks wait for the first fetch and then read its cached payload.
+    """
+
+    lock_id = int.from_bytes(bytes.fromhex(cache_key[:16]), "big", signed=True)
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+def get_extraction_cache(cache_key: str) -> Optional[dict]:
+    storage = get_extraction_cache_storage()
+    metadata_path = f"{EXTRACTION_CACHE_PREFIX}/{cache_key}.json"
+
+    if not storage.exists(metadata_path):
+        return None
+
+    with storage.open(metadata_path, "rb") as metadata_file:
+        entry = json.loads(metadata_file.read())
+
+    entry["fetched_at"] = datetime.fromisoformat(entry["fetched_at"])
+
+    return entry
+
+
+def get_extraction_cache_payload(cache_key: str) -> bytes:
+    with get_extraction_cache_storage().open(f"{EXTRACTION_CACHE_PREFIX}/{cache_key}", "rb") as payload_file:
+        return payload_file.read()
+
+
+def set_extraction_cache(
+    cache_key: str,
+    payload: Optional[bytes],
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> None:
+    """
+    Stores a fetched payload with its HTTP validators. Pass payload=None to only refresh the fetch time of
+    an entry that was revalidated with a 304 response.
+    """
+
+    storage = get_extraction_cache_storage()
+
+    if payload is not None:
+        payload_path = f"{EXTRACTION_CACHE_PREFIX}/{cache_key}"
+        storage.delete(payload_path)
+        storage.save(payload_path, ContentFile(payload))
+
+    metadata_path = f"{EXTRACTION_CACHE_PREFIX}/{cache_key}.json"
+    storage.delete(metadata_path)
+    storage.save(
+        metadata_path,
+        ContentFile(
+            json.dumps(
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "fetched_at": timezone.now().isoformat(),
+                }
+            ).encode()
+        ),
+    )
+
+
+def stage_load_payload(payload: pd.DataFrame) -> str:
+    """
+    Writes a transformed payload to the private cache storage once and returns its path, so parallel load
+    subtasks are sent a reference to the rows rather than the rows themselves.
+    """
+
+    return get_extraction_cache_storage().save(
+        f"{STAGED_LOAD_PREFIX}/{uuid.uuid4()}.csv",
+        ContentFile(
+            payload[["timestamp", "value", "target_id"]].to_csv(
+                index=False, date_format="%Y-%m-%dT%H:%M:%S.%f%z"
+            ).encode()
+        ),
+    )
+
+
+def read_staged_load_payload(path: str, target_ids: list[str]) -> pd.DataFrame:
+    """
+    Reads the rows of the given targets from a staged payload, one chunk at a time so a subtask only holds its
+    own targets' rows in memory.
+    """
+
+    with get_extraction_cache_storage().open(path, "rb") as staged_file:
+        chunks = [
+            chunk[chunk["target_id"].isin(target_ids)]
+            for chunk in pd.read_csv(
+                staged_file, dtype={"timestamp": str, "value": float, "target_id": str}, chunksize=100_000
+            )
+        ]
+
+    payload = (
+        pd.concat(chunks, ignore_index=True) if chunks
+        else pd.DataFrame({"timestamp": [], "value": [], "target_id": []})
+    )
+    payload["timestamp"] = pd.to_datetime(payload["timestamp"], utc=True, format="ISO8601")
+    payload["target_id"] = payload["target_id"].astype(object)
+
+    return payload
+
+
+def delete_staged_load_payload(path: str) -> None:
+    get_extraction_cache_storage().delete(path)
+
+
+def purge_extraction_cache(max_age: Optional[timedelta] = None) -> int:
+    """
+    Deletes cached payloads that were last fetched more than max_age ago (one day by default), along with staged
+    load payloads older than max_age whose parallel run never finished.
+    """
+
+    max_age = max(max_age or timedelta(days=1), timedelta(seconds=get_extraction_cache_timeout()))
+    cutoff = timezone.now() - max_age
+    purged_count = 0
+    storage = get_extraction_cache_storage()
+
+    try:
+        _, staged_file_names = storage.listdir(STAGED_LOAD_PREFIX)
+    except FileNotFoundError:
+        staged_file_names = []
+
+    for file_name in staged_file_names:
+        staged_path = f"{STAGED_LOAD_PREFIX}/{file_name}"
+
+        if storage.get_modified_time(staged_path) < cutoff:
+            storage.delete(staged_path)
+            purged_count += 1
+
+    try:
+        _, file_names = storage.listdir(EXTRACTION_CACHE_PREFIX)
+    except FileNotFoundError:
+        return purged_count
+
+    for file_name in file_names:
+        if not file_name.endswith(".json"):
+            continue
+
+        cache_key = file_name[: -len(".json")]
+        entry = get_extraction_cache(cache_key)
+
+        if entry is None or entry["fetched_at"] < cutoff:
+            storage.delete(f"{EXTRACTION_CACHE_PREFIX}/{cache_key}")
+            storage.delete(f"{EXTRACTION_CACHE_PREFIX}/{file_name}")
+            purged_count += 1
+
+    return purged_count
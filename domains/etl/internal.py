@@ -1,23 +1,95 @@
 import uuid
+import uuid6
 import logging
 import traceback
+import requests
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from io import BytesIO
-from typing import Union, Optional, TextIO
-from pydantic import ConfigDict
-from django.db.models import Min
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from itertools import repeat
+from io import BytesIO, StringIO
+from typing import Iterator, Union, Optional, TextIO
+from pydantic import ConfigDict, SkipValidation
+from django.conf import settings
+from django.db import transaction, connection
+from django.db.models import Min, Max
+from django.utils import timezone
 from domains.sta.models import Datastream, Observation
-from domains.sta.services import ObservationService
-from interfaces.api.schemas.observation import ObservationBulkPostBody
-from hydroserverpy.etl import extractors, transformers
+from domains.sta.services import DatastreamService
+from hydroserverpy.etl import ETLPipeline, extractors, transformers
+from hydroserverpy.etl.models.pipeline import ETLContext, ETLStage, ETLStatus
+from hydroserverpy.etl.operations import TemporalAggregationOperation
 from hydroserverpy.etl.transformers import ETLDataMapping
 from hydroserverpy.etl.loaders import Loader, ETLLoaderResult, ETLTargetResult
 from hydroserverpy.etl.exceptions import ETLError
+from .cache import (
+    get_extraction_cache_timeout,
+    build_extraction_cache_key,
+    extraction_cache_lock,
+    get_extraction_cache,
+    get_extraction_cache_payload,
+    set_extraction_cache,
+)
 
 
 logger = logging.getLogger(__name__)
-observation_service = ObservationService()
+datastream_service = DatastreamService()
+
+# Per-row contribution to the trapezoidal integral of an aggregation window: the segment from the previous
+# observation, or from the window start (interpolated) for the first observation of the window, plus the
+# segment to the window end (interpolated) for the last one. Mirrors TemporalAggregationOperation.
+TIME_WEIGHTED_MEAN_SQL = """
+    SUM(
+        CASE
+            WHEN prev_window = local_window
+            THEN (prev_v + v) / 2 * EXTRACT(EPOCH FROM t - prev_t)
+            ELSE (
+                COALESCE(
+                    prev_v + EXTRACT(EPOCH FROM window_start - prev_t)
+                    / EXTRACT(EPOCH FROM t - prev_t) * (v - prev_v),
+                    v
+                ) + v
+            ) / 2 * EXTRACT(EPOCH FROM t - window_start)
+        END
+        + CASE
+            WHEN next_window IS DISTINCT FROM local_window
+            THEN (
+                v + COALESCE(
+                    v + EXTRACT(EPOCH FROM window_end - t)
+                    / EXTRACT(EPOCH FROM next_t - t) * (next_v - v),
+                    v
+                )
+            ) / 2 * EXTRACT(EPOCH FROM window_end - t)
+            ELSE 0
+        END
+    ) / EXTRACT(EPOCH FROM window_end - window_start)
+"""
+
+AGGREGATION_STATISTIC_SQL = {
+    "simple_mean": "AVG(v)",
+    "last_value_of_period": "(ARRAY_AGG(v ORDER BY t DESC))[1]",
+    "time_weighted_mean": TIME_WEIGHTED_MEAN_SQL,
+}
+
+# PostgreSQL 16 has no uuidv7(), so aggregated observations get a version 7 UUID built from a random UUID with
+# its leading 48 bits replaced by the Unix epoch milliseconds and its version nibble set to 7. This keeps them
+# time-ordered like the uuid6.uuid7 IDs used by every other Observation insert path.
+UUID7_SQL = """
+    encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(EXTRACT(EPOCH FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+"""
 
 
 class HydroServerInternalExtractor(extractors.Extractor):
@@ -33,75 +105,362 @@ class HydroServerInternalExtractor(extractors.Extractor):
         return ""
 
 
-class HydroServerInternalTransformer(transformers.Transformer):
-    def transform(
+class HydroServerHTTPExtractor(extractors.HTTPExtractor):
+    def extract(
+        self,
+        **kwargs
+    ) -> Union[str, TextIO, BytesIO]:
+        """
+        Downloads a file from an HTTP/HTTPS server, sharing the payload with other tasks that request the same
+        rendered source for ETL_EXTRACTION_CACHE_TIMEOUT seconds. Stale payloads are revalidated with the
+        server's ETag/Last-Modified validators. Failed or empty responses raise the same errors as the standard
+        HTTP extractor without requesting the source again.
+        """
+
+        cache_timeout = get_extraction_cache_timeout()
+
+        if not cache_timeout:
+            return super().extract(**kwargs)
+
+        runtime_data = self.render_runtime_data(**kwargs)
+        source_uri = runtime_data["source_uri"]
+        timeout_seconds = 120
+        cache_key = build_extraction_cache_key({"extractor_type": "HTTP", **runtime_data})
+
+        with extraction_cache_lock(cache_key):
+            entry = get_extraction_cache(cache_key)
+
+            if entry and entry["fetched_at"] >= timezone.now() - timedelta(seconds=cache_timeout):
+                logger.info(f"Reusing cached data from {source_uri}")
+                return BytesIO(get_extraction_cache_payload(cache_key))
+
+            headers = {}
+            if entry and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry and entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+            logger.info(f"Requesting data from {source_uri}")
+
+            try:
+                response = requests.get(source_uri, headers=headers, timeout=timeout_seconds)
+            except requests.exceptions.Timeout as e:
+                raise ETLError(
+                    f"Request to {source_uri} timed out after {timeout_seconds} seconds."
+                    "The server may be busy or unreachable. "
+                    "Check the server status, then try again."
+                ) from e
+            except requests.exceptions.RequestException as e:
+                raise ETLError(
+                    f"Failed to connect to {source_uri} with error: {str(e)} "
+                ) from e
+
+            if response.status_code == 304 and entry:
+                set_extraction_cache(cache_key, None, entry.get("etag"), entry.get("last_modified"))
+                return BytesIO(get_extraction_cache_payload(cache_key))
+
+            self._check_response(source_uri, response)
+
+            set_extraction_cache(
+                cache_key,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+            return BytesIO(response.content)
+
+    @staticmethod
+    def _check_response(source_uri: str, response: requests.Response) -> None:
+        """
+        Raises the standard HTTP extractor's error for a failed or empty response.
+        """
+
+        if response.status_code in (401, 403):
+            raise ETLError(
+                f"Failed to authenticate with {source_uri}. "
+                f"The username, password, or token may be incorrect or expired."
+            )
+        if response.status_code == 404:
+            raise ETLError(
+                f"The requested data could not be found at {source_uri}. "
+                "This may indicate that the resource does not exist, has been moved, or the URL is incorrect. "
+                "Verify the URL and the availability of the resource, then try again."
+            )
+        if response.status_code >= 400:
+            raise ETLError(
+                f"HTTP request failed with status code {response.status_code} for {source_uri}. "
+                "This may indicate a client or server error. "
+                "Check that the URL is correct, the server is reachable, "
+                "and any required authentication or permissions are valid."
+            )
+        if response.status_code != 200 or not response.content:
+            raise ETLError(
+                f"No data was returned from {source_uri}. "
+                "The server may be temporarily unavailable, the resource could be empty, "
+                "or the request parameters may not match any available data. "
+                "Verify the URL, check the server status, and ensure your request is correct."
+            )
+
+
+class HydroServerSharedExtractor(extractors.Extractor):
+    extractor: extractors.Extractor
+    payloads: SkipValidation[dict]
+
+    def render_runtime_data(self, **kwargs) -> dict:
+        return self.extractor.render_runtime_data(**kwargs)
+
+    def extract(
         self,
-        payload: Union[str, TextIO, BytesIO],
-        data_mappings: list[ETLDataMapping],
         **kwargs
+    ) -> Union[str, TextIO, BytesIO]:
+        """
+        Extracts through the wrapped extractor once per rendered request and replays the payload (or the error)
+        to every other pipeline sharing the same payloads dict.
+        """
+
+        cache_key = build_extraction_cache_key({
+            "extractor_type": type(self.extractor).__name__,
+            **self.extractor.render_runtime_data(**kwargs),
+        })
+
+        if cache_key not in self.payloads:
+            try:
+                payload = self.extractor.extract(**kwargs)
+                if hasattr(payload, "read"):
+                    data = payload.read()
+                    payload = BytesIO(data) if isinstance(data, bytes) else StringIO(data)
+                self.payloads[cache_key] = payload
+            except Exception as e:
+                self.payloads[cache_key] = e
+
+        payload = self.payloads[cache_key]
+
+        if isinstance(payload, Exception):
+            raise payload
+        if isinstance(payload, (BytesIO, StringIO)):
+            return type(payload)(payload.getvalue())
+
+        return payload
+
+
+class HydroServerInternalTransformer(transformers.Transformer):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Slack added to the chunk overlap for window boundaries that shift with a timezone's DST offset.
+    chunk_overlap_slack: timedelta = timedelta(hours=2)
+
+    @staticmethod
+    def _get_aggregation_operations(data_mapping: ETLDataMapping) -> dict[str, TemporalAggregationOperation]:
+        return {
+            str(target_path.target_identifier): operation
+            for target_path in data_mapping.target_paths
+            for operation in target_path.data_operations
+            if isinstance(operation, TemporalAggregationOperation)
+        }
+
+    @staticmethod
+    def _get_open_window_start(target_df: pd.DataFrame, operation: TemporalAggregationOperation) -> pd.Timestamp:
+        """
+        Return the start of the aggregation window still open at the end of a chunk. Windows are aligned to
+        the local day of the chunk's first observation, as TemporalAggregationOperation aligns them.
+        """
+
+        tz = operation.tz or dt_timezone.utc
+        first_date = target_df["timestamp"].iloc[0].astimezone(tz).date()
+        last_date = target_df["timestamp"].iloc[-1].astimezone(tz).date()
+        window_days = operation.aggregation_interval * (
+            (last_date - first_date).days // operation.aggregation_interval
+        )
+
+        return pd.Timestamp(datetime.combine(first_date + timedelta(days=window_days), time.min, tzinfo=tz))
+
+    @staticmethod
+    def _read_source_window(
+        source_datastream_id: uuid.UUID,
+        start: Optional[datetime],
+        end: Optional[datetime],
     ) -> pd.DataFrame:
         """
-        Load datastream observations from the ORM into a DataFrame.
+        Read the source observations in (start, end] with COPY TO and parse them straight into NumPy-backed
+        columns, without building a Python object per row.
+        """
+
+        observation_table = connection.ops.quote_name(Observation._meta.db_table)
+        buffer = BytesIO()
+
+        with connection.cursor() as cursor:
+            with cursor.copy(
+                f"""
+                COPY (
+                    SELECT (EXTRACT(EPOCH FROM phenomenon_time) * 1000000)::bigint, result
+                    FROM {observation_table}
+                    WHERE datastream_id = %s
+                      AND (%s::timestamptz IS NULL OR phenomenon_time > %s)
+                      AND (%s::timestamptz IS NULL OR phenomenon_time <= %s)
+                    ORDER BY phenomenon_time
+                ) TO STDOUT
+                """,
+                [source_datastream_id, start, start, end, end],
+            ) as copy:
+                for data in copy:
+                    buffer.write(data)
+
+        if not buffer.tell():
+            return pd.DataFrame(columns=["timestamp", "value"])
+
+        buffer.seek(0)
+        source_df = pd.read_csv(
+            buffer,
+            sep="\t",
+            header=None,
+            names=["timestamp", "value"],
+            dtype={"timestamp": np.int64, "value": np.float64},
+        )
+        source_df["timestamp"] = pd.to_datetime(source_df["timestamp"], unit="us", utc=True)
+
+        return source_df
+
+    def iter_transform(
+        self,
+        data_mappings: list[ETLDataMapping],
+        chunk_size: Optional[timedelta] = None,
+        exclude_targets: Optional[set[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield standardized DataFrames of datastream observations one source time window at a time.
 
-        The payload is ignored; data is sourced directly from the Observation ORM.
-        For each data mapping, the source datastream is queried once and the resulting
-        DataFrame is fanned out to each target path. Per-target phenomenon_end_time
-        filtering is applied in pandas after the query to avoid re-querying the ORM
-        for one-to-many mappings.
+        Each window of chunk_size is read with COPY TO and transformed on its own, so memory is bounded
+        by the window size. Callers are expected to load each DataFrame before requesting the next one:
+        target end times are re-read for every window, and observations from the tail of the previous
+        window are carried over so aggregation windows spanning the chunk boundary are computed in full.
+        Targets added to exclude_targets are skipped in later windows.
         """
 
-        result_dfs = []
+        exclude_targets = exclude_targets if exclude_targets is not None else set()
 
         for data_mapping in data_mappings:
             source_datastream_id = uuid.UUID(str(data_mapping.source_identifier))
+            target_ids = [
+                str(target_path.target_identifier) for target_path in data_mapping.target_paths
+            ]
 
             earliest_end_time = Datastream.objects.filter(
-                id__in=[target_path.target_identifier for target_path in data_mapping.target_paths]
+                id__in=target_ids
             ).aggregate(
                 earliest=Min("phenomenon_end_time")
             )["earliest"]
 
-            queryset = Observation.objects.filter(datastream_id=source_datastream_id)
-            if earliest_end_time is not None:
-                queryset = queryset.filter(phenomenon_time__gt=earliest_end_time)
-
-            source_df = pd.DataFrame(list(queryset.values("phenomenon_time", "result")))
+            source_range = Observation.objects.filter(
+                datastream_id=source_datastream_id,
+                **({"phenomenon_time__gt": earliest_end_time} if earliest_end_time else {}),
+            ).aggregate(
+                begin=Min("phenomenon_time"),
+                end=Max("phenomenon_time"),
+            )
 
-            if source_df.empty:
+            if source_range["end"] is None:
                 continue
 
-            source_df = source_df.rename(
-                columns={"phenomenon_time": "timestamp", "result": "value"}
-            )
+            # The next chunk's aggregation starts just after its target's last loaded window, one interval
+            # before the window still open at the end of this chunk, so two intervals are carried over.
+            operations = self._get_aggregation_operations(data_mapping)
+            chunk_overlap = timedelta(
+                days=2 * max((operation.aggregation_interval for operation in operations.values()), default=1)
+            ) + self.chunk_overlap_slack
+            window_start = earliest_end_time
+            carry_df = pd.DataFrame(columns=["timestamp", "value"])
+
+            while window_start is None or window_start < source_range["end"]:
+                window_end = (
+                    (window_start or source_range["begin"]) + chunk_size
+                    if chunk_size is not None else None
+                )
+                window_df = self._read_source_window(
+                    source_datastream_id, window_start, window_end
+                )
+                window_start = window_end or source_range["end"]
 
-            for target_path in data_mapping.target_paths:
-                target_id = str(target_path.target_identifier)
+                if window_df.empty:
+                    continue
+
+                source_df = (
+                    pd.concat([carry_df, window_df], ignore_index=True)
+                    if not carry_df.empty else window_df
+                )
+                carry_start = source_df["timestamp"].searchsorted(
+                    source_df["timestamp"].iloc[-1] - chunk_overlap
+                )
+                carry_df = source_df.iloc[max(carry_start - 1, 0):]
 
-                phenomenon_end_time = (
-                    Datastream.objects.filter(id=target_path.target_identifier)
-                    .values_list("phenomenon_end_time", flat=True)
-                    .first()
+                end_times = dict(
+                    Datastream.objects.filter(id__in=target_ids).values_list(
+                        "id", "phenomenon_end_time"
+                    )
                 )
 
-                target_df = source_df.copy()
+                result_dfs = []
+                open_window_starts = {}
+
+                for target_id in target_ids:
+                    if target_id in exclude_targets:
+                        continue
+
+                    phenomenon_end_time = end_times.get(uuid.UUID(target_id))
+                    target_df = (
+                        source_df[source_df["timestamp"] > phenomenon_end_time]
+                        if phenomenon_end_time is not None else source_df
+                    )
+
+                    if target_df.empty:
+                        continue
 
-                if phenomenon_end_time is not None:
-                    target_df = target_df[target_df["timestamp"] > phenomenon_end_time]
+                    result_dfs.append(target_df.assign(target_id=target_id))
 
-                if target_df.empty:
+                    if window_start < source_range["end"] and target_id in operations:
+                        open_window_starts[target_id] = self._get_open_window_start(
+                            target_df, operations[target_id]
+                        )
+
+                if not result_dfs:
                     continue
 
-                target_df = target_df.copy()
-                target_df["target_id"] = target_id
-                result_dfs.append(target_df)
+                result_df = self.standardize_dataframe(
+                    pd.concat(result_dfs, ignore_index=True),
+                    data_mappings,
+                )
+
+                # TemporalAggregationOperation emits every window that starts before the local day of the last
+                # observation, which for multi-day windows includes the one still open at the end of the chunk.
+                # Those windows are left for the next chunk, which has the rest of their observations.
+                if open_window_starts and not result_df.empty:
+                    open_window_start = result_df["target_id"].map(open_window_starts)
+                    result_df = result_df[
+                        open_window_start.isna() | (result_df["timestamp"] < open_window_start)
+                    ].reset_index(drop=True)
+
+                if not result_df.empty:
+                    yield result_df
+
+    def transform(
+        self,
+        payload: Union[str, TextIO, BytesIO],
+        data_mappings: list[ETLDataMapping],
+        **kwargs
+    ) -> pd.DataFrame:
+        """
+        Load datastream observations from the database into a single DataFrame.
+
+        The payload is ignored; data is sourced directly from the Observation table. Each source is read
+        as one window; use iter_transform to process large sources in bounded chunks.
+        """
+
+        result_dfs = list(self.iter_transform(data_mappings))
 
         if not result_dfs:
             return pd.DataFrame(columns=["timestamp", "value", "target_id"])
 
-        return self.standardize_dataframe(
-            pd.concat(result_dfs, ignore_index=True),
-            data_mappings,
-        )
+        return pd.concat(result_dfs, ignore_index=True)
 
 
 class HydroServerInternalLoader(Loader):
@@ -113,6 +472,16 @@ class HydroServerInternalLoader(Loader):
     def _format_cutoff(value: Optional[datetime]) -> str:
         return value.isoformat() if value is not None else "None"
 
+    @staticmethod
+    def _check_target_permissions(principal, datastream: Datastream) -> None:
+        if "edit" not in datastream.get_principal_permissions(principal=principal):
+            raise ETLError("You do not have permission to edit this datastream")
+
+        if not Observation.can_principal_create(
+            principal=principal, workspace=datastream.thing.workspace
+        ):
+            raise ETLError("You do not have permission to create these observations")
+
     def load(
         self,
         payload: pd.DataFrame,
@@ -120,21 +489,22 @@ class HydroServerInternalLoader(Loader):
     ) -> ETLLoaderResult:
         """
         Load observations from a DataFrame to corresponding HydroServer datastreams.
+
+        Observations are written directly with COPY rather than through the observation API schemas.
+        Permissions are checked once per target datastream, and datastream statistics are updated once
+        per target from the loaded timestamps instead of rescanning the datastream's observations.
         """
 
         target_ids = payload["target_id"].unique()
 
         logger.debug("Resolving %s destination datastream(s).", len(target_ids))
 
-        datastreams = {}
-        missing_datastreams = []
+        target_uuids = {}
         task = kwargs["task_instance"]
 
         for target_id in target_ids:
             try:
-                datastreams[target_id] = Datastream.objects.get(pk=uuid.UUID(target_id))
-            except Datastream.DoesNotExist:
-                missing_datastreams.append(target_id)
+                target_uuids[target_id] = uuid.UUID(target_id)
             except Exception as e:
                 raise ETLError(
                     f"Encountered an unexpected error "
@@ -142,6 +512,19 @@ class HydroServerInternalLoader(Loader):
                     f"Ensure the datastream UUID is formatted correctly."
                 ) from e
 
+        existing_datastreams = Datastream.objects.select_related(
+            "thing__workspace"
+        ).in_bulk(list(target_uuids.values()))
+
+        datastreams = {
+            target_id: existing_datastreams[target_uuid]
+            for target_id, target_uuid in target_uuids.items()
+            if target_uuid in existing_datastreams
+        }
+        missing_datastreams = [
+            target_id for target_id in target_uuids if target_id not in datastreams
+        ]
+
         if missing_datastreams:
             raise ETLError(
                 f"One or more destination datastreams do not exist on this HydroServer instance. "
@@ -169,7 +552,6 @@ class HydroServerInternalLoader(Loader):
             datastream_df = (
                 payload[payload["target_id"] == target_id][["timestamp", "value"]]
                 .dropna(subset=["value"])
-                .copy()
             )
 
             if datastream.phenomenon_end_time is not None:
@@ -191,33 +573,39 @@ class HydroServerInternalLoader(Loader):
             datastream_observations_to_load = len(datastream_df)
 
             logger.debug(
-                "Uploading %s observation(s) to datastream %s (%s chunk(s), chunk_size=%s)",
+                "Copying %s observation(s) to datastream %s (chunk_size=%s)",
                 datastream_observations_to_load,
                 target_id,
-                (datastream_observations_to_load + self.chunk_size - 1) // self.chunk_size,
                 self.chunk_size,
             )
 
-            for start_idx in range(0, datastream_observations_to_load, self.chunk_size):
-                end_idx = min(start_idx + self.chunk_size, datastream_observations_to_load)
-                chunk = datastream_df.iloc[start_idx:end_idx]
+            try:
+                self._check_target_permissions(
+                    principal=task.workspace.owner, datastream=datastream
+                )
 
-                try:
-                    observation_service.bulk_create(
-                        principal=task.workspace.owner,
-                        data=ObservationBulkPostBody(
-                            fields=["phenomenonTime", "result"],
-                            data=chunk.values.tolist(),
-                        ),
-                        datastream_id=datastream.pk,
-                        mode="append",
+                with transaction.atomic():
+                    Observation.objects.bulk_copy_columns(
+                        columns={
+                            "id": [uuid6.uuid7() for _ in range(datastream_observations_to_load)],
+                            "datastream": repeat(datastream.pk, datastream_observations_to_load),
+                            "phenomenon_time": datastream_df["timestamp"].tolist(),
+                            "result": datastream_df["value"].to_numpy(dtype=float).tolist(),
+                        },
+                        batch_size=self.chunk_size,
                     )
-                    etl_results.target_results[target_id].values_loaded += len(chunk)
-                except Exception as e:
-                    etl_results.target_results[target_id].status = "failed"
-                    etl_results.target_results[target_id].error = str(e)
-                    etl_results.target_results[target_id].traceback = traceback.format_exc()
-                    break
+                    datastream_service.update_appended_observation_statistics({
+                        datastream.pk: {
+                            "phenomenon_begin_time": datastream_df["timestamp"].min(),
+                            "phenomenon_end_time": datastream_df["timestamp"].max(),
+                            "value_count": datastream_observations_to_load,
+                        }
+                    })
+                etl_results.target_results[target_id].values_loaded = datastream_observations_to_load
+            except Exception as e:
+                etl_results.target_results[target_id].status = "failed"
+                etl_results.target_results[target_id].error = str(e)
+                etl_results.target_results[target_id].traceback = traceback.format_exc()
 
             if not etl_results.target_results[target_id].values_loaded > 0:
                 etl_results.target_results[target_id].status = "skipped"
@@ -236,6 +624,172 @@ class HydroServerInternalLoader(Loader):
 
         return etl_results
 
+    @staticmethod
+    def _get_aggregation_zone_sql(operation: TemporalAggregationOperation) -> tuple[str, str]:
+        if operation.timezone_type == "offset":
+            offset = operation.timezone.replace(":", "")
+            return "%(zone)s::interval", f"{offset[:3]}:{offset[3:]}"
+        elif operation.timezone_type == "iana":
+            return "%(zone)s::text", operation.timezone
+        else:
+            return "%(zone)s::text", "UTC"
+
+    def _load_aggregation(
+        self,
+        source_datastream_id: uuid.UUID,
+        datastream: Datastream,
+        operation: TemporalAggregationOperation,
+    ) -> tuple[int, Optional[datetime], Optional[datetime]]:
+        """
+        Aggregates source observations newer than the target's end time into windows of
+        operation.aggregation_interval days and inserts them into the target datastream in a single
+        INSERT ... SELECT. As with the pandas aggregation, windows are aligned to local midnight of the first
+        source day, empty windows are dropped, and windows starting on or after the day of the latest source
+        observation are left until they are complete.
+        """
+
+        zone_sql, zone = self._get_aggregation_zone_sql(operation)
+        observation_table = connection.ops.quote_name(Observation._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH source_days AS (
+                    SELECT phenomenon_time AS t,
+                           result AS v,
+                           date_trunc('day', phenomenon_time AT TIME ZONE {zone_sql}) AS local_day
+                    FROM {observation_table}
+                    WHERE datastream_id = %(source_id)s
+                      AND (%(loaded_through)s::timestamptz IS NULL OR phenomenon_time > %(loaded_through)s)
+                ),
+                source AS (
+                    SELECT t, v, local_day,
+                           local_day - (
+                               (local_day::date - (MIN(local_day) OVER ())::date) %% %(interval_days)s
+                           ) * INTERVAL '1 day' AS local_window
+                    FROM source_days
+                ),
+                windows AS (
+                    SELECT t, v, local_window,
+                           local_window AT TIME ZONE {zone_sql} AS window_start,
+                           (local_window + %(interval_days)s * INTERVAL '1 day') AT TIME ZONE {zone_sql} AS window_end,
+                           LAG(t) OVER w AS prev_t,
+                           LAG(v) OVER w AS prev_v,
+                           LAG(local_window) OVER w AS prev_window,
+                           LEAD(t) OVER w AS next_t,
+                           LEAD(v) OVER w AS next_v,
+                           LEAD(local_window) OVER w AS next_window
+                    FROM source
+                    WINDOW w AS (ORDER BY t)
+                ),
+                aggregates AS (
+                    SELECT window_start, {AGGREGATION_STATISTIC_SQL[operation.aggregation_statistic]} AS value
+                    FROM windows
+                    WHERE local_window < (SELECT MAX(local_day) FROM source)
+                    GROUP BY local_window, window_start, window_end
+                ),
+                inserted AS (
+                    INSERT INTO {observation_table} (id, datastream_id, phenomenon_time, result)
+                    SELECT {UUID7_SQL}, %(target_id)s, window_start, value
+                    FROM aggregates
+                    WHERE value IS NOT NULL
+                      AND value <> 'NaN'::float8
+                      AND (%(loaded_through)s::timestamptz IS NULL OR window_start > %(loaded_through)s)
+                    RETURNING phenomenon_time
+                )
+                SELECT COUNT(*), MIN(phenomenon_time), MAX(phenomenon_time) FROM inserted
+                """,
+                {
+                    "zone": zone,
+                    "interval_days": operation.aggregation_interval,
+                    "source_id": source_datastream_id,
+                    "target_id": datastream.pk,
+                    "loaded_through": datastream.phenomenon_end_time,
+                },
+            )
+
+            return cursor.fetchone()
+
+    def load_aggregations(
+        self,
+        data_mappings: list[ETLDataMapping],
+        **kwargs
+    ) -> ETLLoaderResult:
+        """
+        Compute and load temporal aggregations for HydroServer datastreams entirely in PostgreSQL.
+        """
+
+        task = kwargs["task_instance"]
+        target_ids = [
+            str(target_path.target_identifier)
+            for data_mapping in data_mappings
+            for target_path in data_mapping.target_paths
+        ]
+        datastreams = Datastream.objects.select_related("thing__workspace").in_bulk(
+            [uuid.UUID(target_id) for target_id in target_ids]
+        )
+
+        etl_results = ETLLoaderResult()
+
+        for data_mapping in data_mappings:
+            for target_path in data_mapping.target_paths:
+                target_id = str(target_path.target_identifier)
+                target_result = ETLTargetResult(target_identifier=target_id)
+                etl_results.target_results[target_id] = target_result
+
+                try:
+                    datastream = datastreams.get(uuid.UUID(target_id))
+
+                    if datastream is None:
+                        raise ETLError(
+                            f"The destination datastream with ID '{target_id}' "
+                            f"does not exist on this HydroServer instance. "
+                            f"Ensure the datastream ID is correct."
+                        )
+
+                    self._check_target_permissions(
+                        principal=task.workspace.owner, datastream=datastream
+                    )
+
+                    operation = next(
+                        operation for operation in target_path.data_operations
+                        if isinstance(operation, TemporalAggregationOperation)
+                    )
+
+                    with transaction.atomic():
+                        values_loaded, earliest_timestamp, latest_timestamp = self._load_aggregation(
+                            source_datastream_id=uuid.UUID(str(data_mapping.source_identifier)),
+                            datastream=datastream,
+                            operation=operation,
+                        )
+                        datastream_service.update_appended_observation_statistics({
+                            datastream.pk: {
+                                "phenomenon_begin_time": earliest_timestamp,
+                                "phenomenon_end_time": latest_timestamp,
+                                "value_count": values_loaded,
+                            }
+                        })
+                except Exception as e:
+                    target_result.status = "failed"
+                    target_result.error = str(e)
+                    target_result.traceback = traceback.format_exc()
+                    continue
+
+                target_result.values_loaded = values_loaded
+                target_result.earliest_timestamp = earliest_timestamp
+                target_result.latest_timestamp = latest_timestamp
+                target_result.status = "success" if values_loaded > 0 else "skipped"
+
+                logger.info(
+                    "Aggregation result: loaded=%s cutoff=%s",
+                    values_loaded,
+                    self._format_cutoff(datastream.phenomenon_end_time),
+                )
+
+        etl_results.aggregate_results()
+
+        return etl_results
+
     def target_loaded_through(
         self,
         target_identifier: Union[str, int]
@@ -260,3 +814,103 @@ class HydroServerInternalLoader(Loader):
             ) from e
 
         return datastream.phenomenon_end_time
+
+
+class HydroServerStagedLoaderResult(ETLLoaderResult):
+    payload: SkipValidation[pd.DataFrame]
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class HydroServerStagingLoader(HydroServerInternalLoader):
+    """
+    Returns the transformed payload instead of loading it, so a parallel task run can extract and transform its
+    source once and hand each group of targets to its own load subtask.
+    """
+
+    def load(
+        self,
+        payload: pd.DataFrame,
+        **kwargs
+    ) -> HydroServerStagedLoaderResult:
+        return HydroServerStagedLoaderResult(payload=payload)
+
+
+class HydroServerAggregationPipeline(ETLPipeline):
+    @staticmethod
+    def _merge_results(etl_results: ETLLoaderResult, chunk_results: ETLLoaderResult) -> None:
+        for target_id, chunk_result in chunk_results.target_results.items():
+            target_result = etl_results.target_results.setdefault(
+                target_id, ETLTargetResult(target_identifier=target_id)
+            )
+            target_result.values_loaded += chunk_result.values_loaded
+
+            if chunk_result.status == "failed":
+                target_result.status = "failed"
+                target_result.error = chunk_result.error
+                target_result.traceback = chunk_result.traceback
+            elif target_result.status != "failed":
+                target_result.status = "success" if target_result.values_loaded > 0 else "skipped"
+
+    def run(
+        self,
+        data_mappings: list[ETLDataMapping],
+        raise_on_error: bool = True,
+        **kwargs
+    ) -> ETLContext:
+        """
+        Run an Aggregation task's pipeline against the Observation table directly. With ETL_SQL_AGGREGATION
+        the aggregation is computed in PostgreSQL; otherwise source observations are transformed and loaded
+        one time window at a time so memory stays bounded for long source records.
+        """
+
+        context = ETLContext()
+
+        context.status = ETLStatus.RUNNING
+
+        try:
+            context.runtime_variables["transformer"] = self.transformer.render_runtime_data(
+                **kwargs
+            )
+            context.runtime_variables["loader"] = self.loader.render_runtime_data(
+                **kwargs
+            )
+
+            if settings.ETL_SQL_AGGREGATION:
+                context.stage = ETLStage.LOAD
+                context.results = self.loader.load_aggregations(
+                    data_mappings=data_mappings,
+                    **kwargs
+                )
+            else:
+                context.stage = ETLStage.TRANSFORM
+                context.results = ETLLoaderResult()
+                failed_targets = set()
+
+                for payload in self.transformer.iter_transform(
+                    data_mappings=data_mappings,
+                    chunk_size=timedelta(days=settings.ETL_AGGREGATION_CHUNK_DAYS),
+                    exclude_targets=failed_targets,
+                ):
+                    context.stage = ETLStage.LOAD
+                    chunk_results = self.loader.load(payload=payload, **kwargs)
+                    self._merge_results(context.results, chunk_results)
+                    failed_targets.update(
+                        target_id for target_id, target_result in chunk_results.target_results.items()
+                        if target_result.status == "failed"
+                    )
+                    context.stage = ETLStage.TRANSFORM
+
+                context.results.aggregate_results()
+        except Exception as e:
+            if raise_on_error:
+                raise
+            context.mark_failed(e)
+            return context
+
+        if context.results.failure_count == 0:
+            context.status = ETLStatus.SUCCESS
+        else:
+            context.status = ETLStatus.INCOMPLETE
+
+        return context
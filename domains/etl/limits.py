@@ -0,0 +1,113 @@
+import logging
+import redis
+from typing import Optional
+from urllib.parse import urlparse
+from django.conf import settings
+from domains.etl.models import DataConnection
+
+
+logger = logging.getLogger(__name__)
+
+SOURCE_SLOT_LEASE_SECONDS = 6 * 60 * 60
+
+# Claims a concurrency slot and a rate token for a source in one step. Returns "0" once both are held, or the
+# number of seconds to wait before trying again. Slots are leased so a crashed worker can't hold one forever.
+ACQUIRE_SOURCE_SLOT_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local lease = tonumber(ARGV[2])
+local concurrency = tonumber(ARGV[3])
+local rate = tonumber(ARGV[4])
+
+if concurrency > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+    if not redis.call('ZSCORE', KEYS[1], ARGV[1]) and redis.call('ZCARD', KEYS[1]) >= concurrency then
+        return ARGV[5]
+    end
+end
+
+if rate > 0 then
+    local refill = rate / 60
+    local bucket = redis.call('HMGET', KEYS[2], 'tokens', 'updated_at')
+    local tokens = math.min(rate, (tonumber(bucket[1]) or rate) + (now - (tonumber(bucket[2]) or now)) * refill)
+    if tokens < 1 then
+        redis.call('HSET', KEYS[2], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+        return tostring((1 - tokens) / refill)
+    end
+    redis.call('HSET', KEYS[2], 'tokens', tostring(tokens - 1), 'updated_at', tostring(now))
+    redis.call('EXPIRE', KEYS[2], 120)
+end
+
+if concurrency > 0 then
+    redis.call('ZADD', KEYS[1], now + lease, ARGV[1])
+    redis.call('EXPIRE', KEYS[1], lease)
+end
+
+return '0'
+"""
+
+_redis_client = None
+
+
+def get_source_limit_client() -> redis.Redis:
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.ETL_SOURCE_LIMIT_REDIS_URL, socket_timeout=5, socket_connect_timeout=5
+        )
+
+    return _redis_client
+
+
+def get_source_limit_key(data_connection: Optional[DataConnection]) -> Optional[str]:
+    """
+    Returns the key runs are limited under: the extractor's host when ETL_SOURCE_LIMIT_SCOPE is "host" and the
+    data connection's source has one, otherwise the data connection. Returns None when no limits are set.
+    """
+
+    if not data_connection or not (settings.ETL_SOURCE_CONCURRENCY or settings.ETL_SOURCE_RATE_LIMIT):
+        return None
+
+    if settings.ETL_SOURCE_LIMIT_SCOPE == "host":
+        source_uri = (data_connection.extractor_settings or {}).get("sourceUri")
+        host = urlparse(source_uri).hostname if isinstance(source_uri, str) else None
+        if host:
+            return f"host:{host.lower()}"
+
+    return f"data-connection:{data_connection.id}"
+
+
+def acquire_source_slot(source_key: str, holder_id: str) -> float:
+    """
+    Claims a run slot for a source across all workers. Returns 0 if the slot was claimed, or the number of
+    seconds the caller should wait before trying again. Runs are not limited while Redis is unreachable.
+    """
+
+    try:
+        wait_seconds = get_source_limit_client().eval(
+            ACQUIRE_SOURCE_SLOT_SCRIPT,
+            2,
+            f"etl-source-limit:{source_key}:slots",
+            f"etl-source-limit:{source_key}:tokens",
+            holder_id,
+            SOURCE_SLOT_LEASE_SECONDS,
+            settings.ETL_SOURCE_CONCURRENCY,
+            settings.ETL_SOURCE_RATE_LIMIT,
+            settings.ETL_SOURCE_RETRY_DELAY,
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Could not check ETL source limits for {source_key}: {e}")
+        return 0
+
+    return float(wait_seconds)
+
+
+def release_source_slot(source_key: str, holder_id: str) -> None:
+    if not settings.ETL_SOURCE_CONCURRENCY:
+        return
+
+    try:
+        get_source_limit_client().zrem(f"etl-source-limit:{source_key}:slots", holder_id)
+    except redis.RedisError as e:
+        logger.warning(f"Could not release ETL source slot for {source_key}: {e}")
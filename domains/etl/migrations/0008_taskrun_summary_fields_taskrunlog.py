@@ -0,0 +1,129 @@
+import json
+import zlib
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+MESSAGE_KEYS = (
+    "message",
+    "summary",
+    "statusMessage",
+    "status_message",
+    "failureReason",
+    "failure_reason",
+    "error",
+)
+
+FAILURE_COUNT_KEYS = ("failure_count", "failureCount")
+
+
+def backfill_task_run_summaries(apps, schema_editor):
+    message_sql = ", ".join(
+        f"CASE WHEN jsonb_typeof(result->'{key}') = 'string' AND btrim(result->>'{key}') <> '' "
+        f"THEN result->>'{key}' END"
+        for key in MESSAGE_KEYS
+    )
+    failure_count_sql = ", ".join(
+        f"CASE "
+        f"WHEN jsonb_typeof(result->'{key}') = 'number' AND (result->>'{key}')::numeric = trunc((result->>'{key}')::numeric) "
+        f"THEN (result->>'{key}')::numeric::integer "
+        f"WHEN jsonb_typeof(result->'{key}') = 'string' AND btrim(result->>'{key}') ~ '^-?[0-9]+$' "
+        f"THEN btrim(result->>'{key}')::integer "
+        f"END"
+        for key in FAILURE_COUNT_KEYS
+    )
+
+    schema_editor.execute(f"""
+        UPDATE etl_taskrun SET
+            message = COALESCE({message_sql}),
+            failure_count = COALESCE({failure_count_sql}),
+            values_loaded = CASE
+                WHEN jsonb_typeof(result->'values_loaded_total') = 'number'
+                    AND (result->>'values_loaded_total')::numeric = trunc((result->>'values_loaded_total')::numeric)
+                THEN (result->>'values_loaded_total')::numeric::bigint
+            END,
+            duration = finished_at - started_at
+        WHERE jsonb_typeof(result) = 'object' OR finished_at IS NOT NULL
+    """)
+
+    TaskRun = apps.get_model("etl", "TaskRun")
+    TaskRunLog = apps.get_model("etl", "TaskRunLog")
+
+    task_run_ids = list(
+        TaskRun.objects.filter(result__has_key="log_entries").values_list("id", flat=True)
+    )
+
+    for i in range(0, len(task_run_ids), 1000):
+        TaskRunLog.objects.bulk_create([
+            TaskRunLog(
+                task_run_id=task_run_id,
+                entries=zlib.compress(json.dumps(log_entries or [], default=str).encode()),
+            )
+            for task_run_id, log_entries in TaskRun.objects.filter(
+                id__in=task_run_ids[i:i + 1000]
+            ).values_list("id", "result__log_entries")
+        ])
+
+    schema_editor.execute(
+        "UPDATE etl_taskrun SET result = result - 'log_entries' WHERE result ? 'log_entries'"
+    )
+
+
+def restore_task_run_log_entries(apps, schema_editor):
+    TaskRunLog = apps.get_model("etl", "TaskRunLog")
+
+    for task_run_log in TaskRunLog.objects.iterator(chunk_size=1000):
+        schema_editor.execute(
+            "UPDATE etl_taskrun SET result = result || %s::jsonb WHERE id = %s AND jsonb_typeof(result) = 'object'",
+            [
+                json.dumps({"log_entries": json.loads(zlib.decompress(task_run_log.entries))}),
+                task_run_log.task_run_id,
+            ],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("etl", "0007_dataconnectionnotificationrecipient"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskrun",
+            name="message",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="taskrun",
+            name="failure_count",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="taskrun",
+            name="values_loaded",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="taskrun",
+            name="duration",
+            field=models.DurationField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="TaskRunLog",
+            fields=[
+                (
+                    "task_run",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="log",
+                        serialize=False,
+                        to="etl.taskrun",
+                    ),
+                ),
+                ("entries", models.BinaryField()),
+            ],
+        ),
+        migrations.RunPython(backfill_task_run_summaries, restore_task_run_log_entries),
+    ]
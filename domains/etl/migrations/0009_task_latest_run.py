@@ -0,0 +1,58 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_task_latest_runs(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            UPDATE etl_task AS task
+            SET latest_run_id = latest_run.id,
+                latest_run_status = latest_run.status,
+                latest_run_started_at = latest_run.started_at,
+                latest_run_finished_at = latest_run.finished_at
+            FROM (
+                SELECT DISTINCT ON (task_id) task_id, id, status, started_at, finished_at
+                FROM etl_taskrun
+                ORDER BY task_id, started_at DESC, id DESC
+            ) AS latest_run
+            WHERE latest_run.task_id = task.id
+            """
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("etl", "0008_taskrun_summary_fields_taskrunlog"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="latest_run",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="etl.taskrun",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="latest_run_status",
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="latest_run_started_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="latest_run_finished_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_task_latest_runs, migrations.RunPython.noop),
+    ]
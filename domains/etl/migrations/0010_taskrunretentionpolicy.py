@@ -0,0 +1,25 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0009_task_latest_run'),
+        ('iam', '0004_alter_permission_resource_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRunRetentionPolicy',
+            fields=[
+                ('workspace', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_run_retention_policy', serialize=False, to='iam.workspace')),
+                ('days', models.PositiveIntegerField()),
+            ],
+            options={
+                'verbose_name_plural': 'task run retention policies',
+            },
+        ),
+    ]
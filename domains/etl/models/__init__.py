@@ -1,4 +1,4 @@
 from .orchestration_system import OrchestrationSystem
 from .data_connection import DataConnection, DataConnectionNotificationRecipient
 from .task import Task, TaskMapping, TaskMappingPath
-from .run import TaskRun
+from .run import TaskRun, TaskRunLog, TaskRunRetentionPolicy
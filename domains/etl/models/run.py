@@ -1,5 +1,8 @@
+import json
+import zlib
 import uuid6
 from django.db import models
+from django.db.models import Q
 from .task import Task
 
 
@@ -10,6 +13,10 @@ class TaskRun(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     finished_at = models.DateTimeField(null=True, blank=True)
     result = models.JSONField(blank=True, null=True)
+    message = models.TextField(blank=True, null=True)
+    failure_count = models.IntegerField(blank=True, null=True)
+    values_loaded = models.BigIntegerField(blank=True, null=True)
+    duration = models.DurationField(blank=True, null=True)
 
     @staticmethod
     def extract_message(result: dict | None) -> str | None:
@@ -52,13 +59,75 @@ class TaskRun(models.Model):
 
         return None
 
-    @property
-    def message(self) -> str | None:
-        return self.extract_message(self.result)
+    @staticmethod
+    def extract_values_loaded(result: dict | None) -> int | None:
+        if not isinstance(result, dict):
+            return None
+
+        value = result.get("values_loaded_total")
+
+        return value if isinstance(value, int) and not isinstance(value, bool) else None
 
     @property
-    def failure_count(self) -> int | None:
-        return self.extract_failure_count(self.result)
+    def log_entries(self) -> list[dict] | None:
+        try:
+            return self.log.get_entries()
+        except TaskRunLog.DoesNotExist:
+            return None
+
+    def save(self, *args, **kwargs):
+        """
+        Moves any log_entries out of the result into the run's TaskRunLog and refreshes the summary columns
+        derived from the result, so run listings never need to read log entries or parse the result JSON.
+        Also keeps the task's latest run pointer current.
+        """
+
+        log_entries = None
+
+        if isinstance(self.result, dict) and "log_entries" in self.result:
+            self.result = dict(self.result)
+            log_entries = self.result.pop("log_entries")
+
+        self.message = self.extract_message(self.result)
+        self.failure_count = self.extract_failure_count(self.result)
+        self.values_loaded = self.extract_values_loaded(self.result)
+        self.duration = (
+            self.finished_at - self.started_at
+            if self.finished_at and self.started_at else None
+        )
+
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {
+                *kwargs["update_fields"], "message", "failure_count", "values_loaded", "duration"
+            }
+
+        super().save(*args, **kwargs)
+
+        if log_entries is not None:
+            TaskRunLog.objects.update_or_create(
+                task_run=self, defaults={"entries": TaskRunLog.compress_entries(log_entries)}
+            )
+
+        self.update_task_latest_run()
+
+    def update_task_latest_run(self) -> None:
+        """
+        Points the task at this run if it is the task's latest run, in one conditional update so concurrent
+        runs of the same task can't move the pointer back to an older run.
+        """
+
+        Task.objects.filter(
+            Q(latest_run__isnull=True)
+            | Q(latest_run_id=self.id)
+            | Q(latest_run_started_at__lt=self.started_at)
+            | Q(latest_run_started_at=self.started_at, latest_run_id__lt=self.id),
+            pk=self.task_id,
+        ).update(
+            latest_run_id=self.id,
+            latest_run_status=self.status,
+            latest_run_started_at=self.started_at,
+            latest_run_finished_at=self.finished_at,
+        )
 
     class Meta:
         indexes = [
@@ -67,3 +136,33 @@ class TaskRun(models.Model):
                 name="etl_taskrun_task_started_idx",
             ),
         ]
+
+
+class TaskRunLog(models.Model):
+    """
+    Log entries of a task run, stored as one zlib-compressed JSON blob.
+    """
+
+    task_run = models.OneToOneField(TaskRun, on_delete=models.CASCADE, primary_key=True, related_name="log")
+    entries = models.BinaryField()
+
+    @staticmethod
+    def compress_entries(entries: list[dict] | None) -> bytes:
+        return zlib.compress(json.dumps(entries or [], default=str).encode())
+
+    def get_entries(self) -> list[dict]:
+        return json.loads(zlib.decompress(self.entries))
+
+
+class TaskRunRetentionPolicy(models.Model):
+    """
+    Overrides how many days of task runs are kept for the tasks of one workspace.
+    """
+
+    workspace = models.OneToOneField(
+        "iam.Workspace", on_delete=models.CASCADE, primary_key=True, related_name="task_run_retention_policy"
+    )
+    days = models.PositiveIntegerField()
+
+    class Meta:
+        verbose_name_plural = "task run retention policies"
@@ -78,6 +78,12 @@ class Task(models.Model, PermissionChecker):
     )
     paused = models.BooleanField(default=False)
     next_run_at = models.DateTimeField(null=True, blank=True)
+    latest_run = models.ForeignKey(
+        "etl.TaskRun", null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    latest_run_status = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    latest_run_started_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    latest_run_finished_at = models.DateTimeField(null=True, blank=True, db_index=True)
     extractor_variables = models.JSONField(default=dict)
     transformer_variables = models.JSONField(default=dict)
     loader_variables = models.JSONField(default=dict)
@@ -87,6 +93,25 @@ class Task(models.Model, PermissionChecker):
     def __str__(self):
         return f"{self.name} - {self.id}"
 
+    @classmethod
+    def refresh_latest_runs(cls, task_ids) -> int:
+        """
+        Recomputes the latest run pointer and its cached status fields from the tasks' runs. Only needed when
+        runs are deleted, moved to an earlier start, or written with queryset updates, since saved runs keep
+        their task current.
+        """
+
+        from .run import TaskRun
+
+        latest_runs = TaskRun.objects.filter(task_id=models.OuterRef("pk")).order_by("-started_at", "-id")
+
+        return cls.objects.filter(pk__in=task_ids).update(
+            latest_run_id=models.Subquery(latest_runs.values("id")[:1]),
+            latest_run_status=models.Subquery(latest_runs.values("status")[:1]),
+            latest_run_started_at=models.Subquery(latest_runs.values("started_at")[:1]),
+            latest_run_finished_at=models.Subquery(latest_runs.values("finished_at")[:1]),
+        )
+
     @classmethod
     def can_principal_create(
         cls, principal: Union["User", "APIKey", None], workspace: "Workspace"
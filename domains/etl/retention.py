@@ -0,0 +1,85 @@
+import time
+import logging
+from typing import Optional
+from django.db import connection, transaction
+from django.utils import timezone
+from domains.etl.models import Task, TaskRun, TaskRunLog, TaskRunRetentionPolicy
+
+
+logger = logging.getLogger(__name__)
+
+# Picks one batch of expired runs. A run expires once it is older than its workspace's retention policy (or the
+# default), unless it is the newest run of its task. The window ranks expired runs per task, so the newest
+# expired run is only kept when the task has no newer run at all.
+DELETE_EXPIRED_TASK_RUNS_SQL = f"""
+WITH expired AS (
+    SELECT ranked.id
+    FROM (
+        SELECT
+            run.id,
+            run.task_id,
+            run.started_at,
+            row_number() OVER (PARTITION BY run.task_id ORDER BY run.started_at DESC, run.id DESC) AS position
+        FROM {TaskRun._meta.db_table} AS run
+        JOIN {Task._meta.db_table} AS task ON task.id = run.task_id
+        LEFT JOIN {TaskRunRetentionPolicy._meta.db_table} AS policy ON policy.workspace_id = task.workspace_id
+        WHERE run.started_at < %(now)s - make_interval(days => COALESCE(policy.days, %(default_days)s))
+    ) AS ranked
+    WHERE ranked.position > 1 OR EXISTS (
+        SELECT 1 FROM {TaskRun._meta.db_table} AS newer
+        WHERE newer.task_id = ranked.task_id AND newer.started_at > ranked.started_at
+    )
+    LIMIT %(batch_size)s
+),
+deleted_logs AS (
+    DELETE FROM {TaskRunLog._meta.db_table} WHERE task_run_id IN (SELECT id FROM expired)
+),
+cleared_pointers AS (
+    UPDATE {Task._meta.db_table} SET latest_run_id = NULL WHERE latest_run_id IN (SELECT id FROM expired)
+)
+DELETE FROM {TaskRun._meta.db_table} WHERE id IN (SELECT id FROM expired)
+"""
+
+
+def delete_expired_task_runs(
+    default_days: int,
+    batch_size: int = 5000,
+    max_batches: Optional[int] = None,
+) -> dict:
+    """
+    Deletes expired task runs and their logs in batches of up to batch_size rows, each batch in its own short
+    transaction so the cleanup never holds locks on the whole table. Returns the number of deleted runs, the
+    number of batches, and the elapsed time.
+    """
+
+    now = timezone.now()
+    started = time.monotonic()
+    deleted_count = 0
+    batch_count = 0
+
+    while max_batches is None or batch_count < max_batches:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                DELETE_EXPIRED_TASK_RUNS_SQL,
+                {"now": now, "default_days": default_days, "batch_size": batch_size},
+            )
+            batch_deleted = cursor.rowcount
+
+        if not batch_deleted:
+            break
+
+        batch_count += 1
+        deleted_count += batch_deleted
+        logger.debug(f"Deleted batch {batch_count} of {batch_deleted} expired task runs.")
+
+        if batch_deleted < batch_size:
+            break
+
+    elapsed_seconds = time.monotonic() - started
+
+    return {
+        "deleted": deleted_count,
+        "batches": batch_count,
+        "seconds": round(elapsed_seconds, 3),
+        "runs_per_second": round(deleted_count / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+    }
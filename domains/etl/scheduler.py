@@ -0,0 +1,134 @@
+import time
+import hashlib
+import logging
+from django.conf import settings
+from django_celery_beat.schedulers import DatabaseScheduler
+from domains.etl.models import Task
+from domains.etl.tasks import record_skipped_etl_runs
+
+
+logger = logging.getLogger(__name__)
+
+ETL_BEAT_TASK_NAMES = {
+    "domains.etl.tasks.run_etl_task",
+    "domains.etl.tasks.run_etl_task_group",
+}
+
+
+def get_stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def get_etl_dispatch_countdown(entry_name: str) -> int:
+    """
+    Returns a stable start offset for a beat entry, so entries sharing a crontab minute are spread across
+    ETL_SCHEDULE_JITTER seconds instead of being dispatched together.
+    """
+
+    jitter = max(settings.ETL_SCHEDULE_JITTER, 0)
+
+    return get_stable_hash(entry_name) % (jitter + 1) if jitter else 0
+
+
+class ETLDatabaseScheduler(DatabaseScheduler):
+    """
+    Database beat scheduler for ETL entries. Each beat process only schedules its own shard of the ETL entries,
+    dispatches them with a stable start jitter, and records a MISSED task run instead of dispatching while
+    the broker queue is deeper than ETL_SCHEDULE_MAX_QUEUE_DEPTH.
+    """
+
+    queue_depth_check_interval = 1
+
+    def __init__(self, *args, **kwargs):
+        self._queue_depth = None
+        self._queue_depth_checked_at = 0
+        super().__init__(*args, **kwargs)
+
+    def enabled_models(self):
+        periodic_tasks = super().enabled_models()
+        shard_count = max(settings.ETL_BEAT_SHARD_COUNT, 1)
+
+        if shard_count == 1:
+            return periodic_tasks
+
+        orchestration_system_ids = dict(
+            Task.objects.filter(
+                periodic_task_id__in=[
+                    periodic_task.id for periodic_task in periodic_tasks
+                    if periodic_task.task == "domains.etl.tasks.run_etl_task"
+                ]
+            ).values_list("periodic_task_id", "orchestration_system_id")
+        )
+
+        return [
+            periodic_task for periodic_task in periodic_tasks
+            if self.get_shard(periodic_task, orchestration_system_ids, shard_count) == settings.ETL_BEAT_SHARD_INDEX
+        ]
+
+    @staticmethod
+    def get_shard(periodic_task, orchestration_system_ids: dict, shard_count: int) -> int:
+        """
+        Assigns task entries to shards by orchestration system and coalesced entries by data connection. All
+        other entries run on shard 0.
+        """
+
+        if periodic_task.task == "domains.etl.tasks.run_etl_task" and periodic_task.id in orchestration_system_ids:
+            return get_stable_hash(str(orchestration_system_ids[periodic_task.id])) % shard_count
+
+        if periodic_task.task == "domains.etl.tasks.run_etl_task_group":
+            return get_stable_hash(periodic_task.kwargs) % shard_count
+
+        return 0
+
+    def get_queue_depth(self, queue: str):
+        now = time.monotonic()
+
+        if now - self._queue_depth_checked_at < self.queue_depth_check_interval:
+            return self._queue_depth
+
+        try:
+            with self.app.connection_for_write() as connection:
+                self._queue_depth = connection.default_channel.queue_declare(
+                    queue=queue, passive=True
+                ).message_count
+        except Exception as e:
+            logger.warning(f"Could not read the depth of queue {queue}: {e}")
+            self._queue_depth = None
+
+        self._queue_depth_checked_at = now
+
+        return self._queue_depth
+
+    def apply_async(self, entry, producer=None, advance=True, **kwargs):
+        if entry.task not in ETL_BEAT_TASK_NAMES:
+            return super().apply_async(entry, producer=producer, advance=advance, **kwargs)
+
+        queue_depth = self.get_queue_depth(
+            entry.options.get("queue") or self.app.conf.task_default_queue
+        ) if settings.ETL_SCHEDULE_MAX_QUEUE_DEPTH else None
+
+        if queue_depth is not None and queue_depth >= settings.ETL_SCHEDULE_MAX_QUEUE_DEPTH:
+            if advance:
+                self.reserve(entry)
+            record_skipped_etl_runs(
+                entry.task,
+                entry.kwargs,
+                status="MISSED",
+                message=(
+                    f"Scheduled run was skipped because {queue_depth} task(s) were already waiting in the queue. "
+                    "The next scheduled run will load any data this run missed."
+                ),
+            )
+            return None
+
+        countdown = get_etl_dispatch_countdown(entry.name)
+        entry.options = {
+            **entry.options,
+            "countdown": countdown,
+            "expires": countdown + settings.ETL_TASK_EXPIRE_SECONDS,
+        }
+
+        if self._queue_depth is not None:
+            self._queue_depth += 1
+
+        return super().apply_async(entry, producer=producer, advance=advance, **kwargs)
@@ -5,7 +5,7 @@ from django.http import HttpResponse
 from django.db import IntegrityError
 from django.contrib.auth import get_user_model
 from domains.iam.models import APIKey
-from domains.etl.models import TaskRun
+from domains.etl.models import Task, TaskRun
 from interfaces.api.schemas import TaskRunFields, TaskRunPostBody, TaskRunPatchBody, TaskRunOrderByFields
 from interfaces.api.service import ServiceUtils
 from .task import TaskService
@@ -66,10 +66,13 @@ class TaskRunService(ServiceUtils):
         )
 
         try:
-            task_run = TaskRun.objects.get(pk=uid, task=task)
+            task_run = TaskRun.objects.select_related("log").get(pk=uid, task=task)
         except TaskRun.DoesNotExist:
             raise HttpError(404, "Task run not found")
 
+        if task_run.log_entries is not None and isinstance(task_run.result, dict):
+            task_run.result = {**task_run.result, "log_entries": task_run.log_entries}
+
         return task_run
 
     def create(
@@ -125,6 +128,9 @@ class TaskRunService(ServiceUtils):
 
         task_run.save()
 
+        if "started_at" in task_run_data:
+            Task.refresh_latest_runs([task.id])
+
         return self.get(
             principal=principal, uid=task_run.id, task_id=task_id
         )
@@ -141,5 +147,6 @@ class TaskRunService(ServiceUtils):
             raise HttpError(404, "Task run not found")
 
         task_run.delete()
+        Task.refresh_latest_runs([task.id])
 
         return "ETL task run deleted"
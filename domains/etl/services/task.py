@@ -9,9 +9,7 @@ from django.http import HttpResponse
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.db import IntegrityError
-from django.db.models import IntegerField, Q, QuerySet, Subquery, OuterRef
-from django.db.models.fields.json import KeyTextTransform
-from django.db.models.functions import Cast, Coalesce
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 from django.conf import settings
 from django_celery_beat.models import PeriodicTask, CrontabSchedule, IntervalSchedule
@@ -63,7 +61,7 @@ class TaskService(ServiceUtils):
     ):
         try:
             task = Task.objects
-            task = self.annotate_latest_task_result(
+            task = self.select_latest_run(
                 task,
                 include_result=include_latest_run_result,
             )
@@ -138,21 +136,7 @@ class TaskService(ServiceUtils):
         include_latest_run_result: bool = True,
         include_data_connection_settings: bool = True,
     ) -> dict:
-        latest_task_run = getattr(task, "latest_task_run", None)
-        latest_run_message = None
-        latest_run_failure_count = None
-
-        if latest_task_run:
-            latest_run_message = getattr(latest_task_run, "message_text", None)
-            latest_run_failure_count = getattr(
-                latest_task_run, "failure_count_value", None
-            )
-
-            if include_latest_run_result:
-                if latest_run_message is None:
-                    latest_run_message = latest_task_run.message
-                if latest_run_failure_count is None:
-                    latest_run_failure_count = latest_task_run.failure_count
+        latest_run = task.latest_run
 
         response = {
             "id": task.id,
@@ -170,33 +154,14 @@ class TaskService(ServiceUtils):
                 "intervalPeriod": task.periodic_task.interval.period if task.periodic_task.interval else None,
             } if task.periodic_task else None,
             "latest_run": {
-                "id": latest_task_run.id if latest_task_run else getattr(task, "latest_run_id", None),
-                "status": latest_task_run.status if latest_task_run else getattr(task, "latest_run_status", None),
-                "message": latest_run_message if latest_task_run else getattr(task, "latest_run_message", None),
-                "failure_count": (
-                    latest_run_failure_count
-                    if latest_task_run
-                    else getattr(task, "latest_run_failure_count", None)
-                ),
-                "result": (
-                    (
-                        latest_task_run.result
-                        if latest_task_run
-                        else getattr(task, "latest_run_result", None)
-                    )
-                    if include_latest_run_result else None
-                ),
-                "started_at": (
-                    latest_task_run.started_at
-                    if latest_task_run
-                    else getattr(task, "latest_run_started_at", None)
-                ),
-                "finished_at": (
-                    latest_task_run.finished_at
-                    if latest_task_run
-                    else getattr(task, "latest_run_finished_at", None)
-                ),
-            } if latest_task_run or getattr(task, "latest_run_id", None) else None,
+                "id": latest_run.id,
+                "status": latest_run.status,
+                "message": latest_run.message,
+                "failure_count": latest_run.failure_count,
+                "result": latest_run.result if include_latest_run_result else None,
+                "started_at": latest_run.started_at,
+                "finished_at": latest_run.finished_at,
+            } if latest_run else None,
             "extractor_variables": task.extractor_variables,
             "transformer_variables": task.transformer_variables,
             "loader_variables": task.loader_variables,
@@ -296,130 +261,16 @@ class TaskService(ServiceUtils):
         )
 
     @staticmethod
-    def annotate_latest_task_run_fields(queryset: QuerySet) -> QuerySet:
-        task_result_queryset = (
-            TaskRun.objects
-            .filter(task_id=OuterRef("pk"))
-            .order_by("-started_at", "-id")
-        )
-        return queryset.annotate(
-            latest_run_id=Subquery(
-                task_result_queryset.values("id")[:1]
-            ),
-            latest_run_status=Subquery(
-                task_result_queryset.values("status")[:1]
-            ),
-            latest_run_started_at=Subquery(
-                task_result_queryset.values("started_at")[:1]
-            ),
-            latest_run_finished_at=Subquery(
-                task_result_queryset.values("finished_at")[:1]
-            ),
-        )
-
-    @staticmethod
-    def get_latest_runs_for_tasks(
-        task_ids: list[uuid.UUID],
+    def select_latest_run(
+        queryset: QuerySet,
         include_result: bool = True,
-    ) -> dict[uuid.UUID, TaskRun]:
-        if not task_ids:
-            return {}
-
-        latest_runs = (
-            TaskRun.objects
-            .filter(task_id__in=task_ids)
-            .annotate(
-                message_text=Coalesce(
-                    KeyTextTransform("message", "result"),
-                    KeyTextTransform("summary", "result"),
-                    KeyTextTransform("statusMessage", "result"),
-                    KeyTextTransform("status_message", "result"),
-                    KeyTextTransform("failureReason", "result"),
-                    KeyTextTransform("failure_reason", "result"),
-                    KeyTextTransform("error", "result"),
-                ),
-                failure_count_value=Coalesce(
-                    Cast(
-                        KeyTextTransform("failure_count", "result"),
-                        IntegerField(),
-                    ),
-                    Cast(
-                        KeyTextTransform("failureCount", "result"),
-                        IntegerField(),
-                    ),
-                    output_field=IntegerField(),
-                ),
-            )
-            .order_by("task_id", "-started_at", "-id")
-        )
+    ) -> QuerySet:
+        queryset = queryset.select_related("latest_run")
 
         if not include_result:
-            latest_runs = latest_runs.defer("result")
-
-        return {
-            task_run.task_id: task_run
-            for task_run in latest_runs.distinct("task_id")
-        }
+            queryset = queryset.defer("latest_run__result")
 
-    @staticmethod
-    def annotate_latest_task_result(
-        queryset: QuerySet,
-        include_result: bool = True,
-    ) -> QuerySet:
-        task_result_queryset = (
-            TaskRun.objects
-            .filter(task_id=OuterRef("pk"))
-            .order_by("-started_at", "-id")
-        )
-        annotations = {
-            "latest_run_id": Subquery(
-                task_result_queryset.values("id")[:1]
-            ),
-            "latest_run_status": Subquery(
-                task_result_queryset.values("status")[:1]
-            ),
-            "latest_run_message": Subquery(
-                task_result_queryset.annotate(
-                    message_text=Coalesce(
-                        KeyTextTransform("message", "result"),
-                        KeyTextTransform("summary", "result"),
-                        KeyTextTransform("statusMessage", "result"),
-                        KeyTextTransform("status_message", "result"),
-                        KeyTextTransform("failureReason", "result"),
-                        KeyTextTransform("failure_reason", "result"),
-                        KeyTextTransform("error", "result"),
-                    )
-                ).values("message_text")[:1]
-            ),
-            "latest_run_failure_count": Subquery(
-                task_result_queryset.annotate(
-                    failure_count_value=Coalesce(
-                        Cast(
-                            KeyTextTransform("failure_count", "result"),
-                            IntegerField(),
-                        ),
-                        Cast(
-                            KeyTextTransform("failureCount", "result"),
-                            IntegerField(),
-                        ),
-                        output_field=IntegerField(),
-                    )
-                ).values("failure_count_value")[:1]
-            ),
-            "latest_run_started_at": Subquery(
-                task_result_queryset.values("started_at")[:1]
-            ),
-            "latest_run_finished_at": Subquery(
-                task_result_queryset.values("finished_at")[:1]
-            ),
-        }
-        if include_result:
-            annotations["latest_run_result"] = Subquery(
-                task_result_queryset.values("result")[:1]
-            )
-        return queryset.annotate(
-            **annotations
-        )
+        return queryset
 
     def list(
         self,
@@ -449,31 +300,6 @@ class TaskService(ServiceUtils):
         order_by = order_by or []
         queryset = Task.objects
 
-        if (
-            any(
-                field in filtering
-                for field in [
-                    "latest_run_status",
-                    "latest_run_started_at__lte",
-                    "latest_run_started_at__gte",
-                    "latest_run_finished_at__lte",
-                    "latest_run_finished_at__gte",
-                ]
-            )
-            or any(
-                field.lstrip("-")
-                in {
-                    "latestRunStatus",
-                    "latestRunStartedAt",
-                    "latestRunFinishedAt",
-                }
-                for field in order_by
-            )
-        ):
-            queryset = self.annotate_latest_task_run_fields(
-                queryset
-            )
-
         for field in [
             "workspace_id",
             "task_type",
@@ -512,6 +338,9 @@ class TaskService(ServiceUtils):
                 "dataConnectionExtractorType": "data_connection__extractor_type",
                 "dataConnectionTransformerType": "data_connection__transformer_type",
                 "dataConnectionLoaderType": "data_connection__loader_type",
+                "latestRunStatus": "latest_run_status",
+                "latestRunStartedAt": "latest_run_started_at",
+                "latestRunFinishedAt": "latest_run_finished_at",
             }
             order_by_aliases.update(
                 {f"-{key}": f"-{value}" for key, value in order_by_aliases.items()}
@@ -526,6 +355,11 @@ class TaskService(ServiceUtils):
         else:
             queryset = queryset.order_by("id")
 
+        queryset = self.select_latest_run(
+            queryset,
+            include_result=include_latest_run_result,
+        )
+
         if expand_related:
             queryset = self.select_expanded_fields(
                 queryset,
@@ -543,14 +377,6 @@ class TaskService(ServiceUtils):
         queryset = queryset.visible(principal=principal).distinct()  # noqa
         queryset, count = self.apply_pagination(queryset, response, page, page_size)
 
-        queryset = list(queryset.all())
-        latest_runs_by_task_id = self.get_latest_runs_for_tasks(
-            [task.id for task in queryset],
-            include_result=include_latest_run_result,
-        )
-        for task in queryset:
-            task.latest_task_run = latest_runs_by_task_id.get(task.id)
-
         return [
             self.build_task_response(
                 task,
@@ -639,6 +465,8 @@ class TaskService(ServiceUtils):
         )
         task.save()
 
+        self.update_coalesced_scheduling(task.data_connection_id)
+
         return self.get(
             principal=principal, uid=task.id, expand_related=True
         )
@@ -658,6 +486,7 @@ class TaskService(ServiceUtils):
         )
 
         next_task_type = task_data.get("task_type", task.task_type)
+        previous_data_connection_id = task.data_connection_id
 
         if next_task_type == "Aggregation":
             if "data_connection_id" in task_data and task_data["data_connection_id"] is not None:
@@ -703,6 +532,9 @@ class TaskService(ServiceUtils):
 
         task.save()
 
+        for data_connection_id in {previous_data_connection_id, task.data_connection_id}:
+            self.update_coalesced_scheduling(data_connection_id)
+
         return self.get(
             principal=principal, uid=task.id, expand_related=True
         )
@@ -712,8 +544,11 @@ class TaskService(ServiceUtils):
             principal=principal, uid=uid, action="delete", expand_related=True
         )
 
+        data_connection_id = task.data_connection_id
         task.delete()
 
+        self.update_coalesced_scheduling(data_connection_id)
+
         return "ETL Task deleted"
 
     def run(self, principal: User | APIKey, task_id: uuid.UUID, file=None):
@@ -747,6 +582,7 @@ class TaskService(ServiceUtils):
                 )
         except Exception:
             task_run.delete()
+            Task.refresh_latest_runs([task.id])
             raise
 
         task_run.refresh_from_db()
@@ -868,7 +704,7 @@ class TaskService(ServiceUtils):
                 interval=interval_schedule,
                 crontab=crontab_schedule,
                 start_time=schedule_data.get("start_time", timezone.now()),
-                expire_seconds=3600,
+                expire_seconds=settings.ETL_TASK_EXPIRE_SECONDS,
             )
         else:
             task.periodic_task.crontab = crontab_schedule
@@ -893,6 +729,87 @@ class TaskService(ServiceUtils):
 
         return task
 
+    @staticmethod
+    def update_coalesced_scheduling(data_connection_id: uuid.UUID | None):
+        """
+        Replaces the beat entries of a data connection's tasks that share a crontab schedule with one
+        run_etl_task_group entry per schedule, and restores the individual entries of tasks that no longer
+        share one.
+        """
+
+        if not data_connection_id:
+            return
+
+        tasks = Task.objects.select_related(
+            "periodic_task__crontab", "orchestration_system"
+        ).filter(
+            data_connection_id=data_connection_id, periodic_task__isnull=False
+        )
+
+        now = timezone.now()
+        schedule_groups = {}
+
+        for task in tasks:
+            crontab = task.periodic_task.crontab
+            if (
+                settings.ETL_COALESCE_SCHEDULES
+                and crontab
+                and task.task_type != "Aggregation"
+                and task.orchestration_system.orchestration_system_type == "INTERNAL"
+                and not task.paused
+                and (not task.periodic_task.start_time or task.periodic_task.start_time <= now)
+            ):
+                schedule = " ".join([
+                    crontab.minute, crontab.hour, crontab.day_of_month, crontab.month_of_year, crontab.day_of_week
+                ])
+                schedule_groups.setdefault(schedule, []).append(task)
+
+        schedule_groups = {
+            schedule: grouped_tasks for schedule, grouped_tasks in schedule_groups.items() if len(grouped_tasks) > 1
+        }
+        coalesced_task_ids = {task.id for grouped_tasks in schedule_groups.values() for task in grouped_tasks}
+
+        for task in tasks:
+            enabled = (
+                task.orchestration_system.orchestration_system_type == "INTERNAL"
+                and not task.paused
+                and task.id not in coalesced_task_ids
+            )
+            if task.periodic_task.enabled != enabled:
+                task.periodic_task.enabled = enabled
+                task.periodic_task.date_changed = now
+                task.periodic_task.save(update_fields=["enabled", "date_changed"])
+
+        group_name_prefix = f"Coalesced ETL tasks — {data_connection_id} — "
+
+        for group_periodic_task in PeriodicTask.objects.select_related("crontab").filter(
+            task="domains.etl.tasks.run_etl_task_group", name__startswith=group_name_prefix
+        ):
+            if group_periodic_task.name[len(group_name_prefix):] not in schedule_groups:
+                group_periodic_task.crontab.delete()
+
+        for schedule in schedule_groups:
+            minute, hour, day_of_month, month_of_year, day_of_week = schedule.split()
+
+            if PeriodicTask.objects.filter(name=f"{group_name_prefix}{schedule}").exists():
+                continue
+
+            PeriodicTask.objects.create(
+                name=f"{group_name_prefix}{schedule}",
+                task="domains.etl.tasks.run_etl_task_group",
+                kwargs=f'{{"data_connection_id": "{str(data_connection_id)}", "crontab": "{schedule}"}}',
+                enabled=True,
+                date_changed=now,
+                crontab=CrontabSchedule.objects.create(
+                    minute=minute,
+                    hour=hour,
+                    day_of_month=day_of_month,
+                    month_of_year=month_of_year,
+                    day_of_week=day_of_week,
+                ),
+                expire_seconds=settings.ETL_TASK_EXPIRE_SECONDS,
+            )
+
     @staticmethod
     def _extract_rating_curve_url(transformation: dict) -> str:
         url = transformation.get("ratingCurveUrl")
@@ -1,21 +1,46 @@
+import json
+import math
+import hashlib
 import logging
-from uuid import UUID
-from datetime import timedelta
-from celery import shared_task
-from celery.signals import task_prerun, task_success, task_failure, task_postrun
+import traceback
+import pandas as pd
+from uuid import UUID, uuid4
+from collections import defaultdict
+from typing import Optional
+from datetime import datetime, timedelta
+from celery import shared_task, chord
+from celery.signals import task_prerun, task_success, task_failure, task_postrun, task_revoked
+from django.db import connection
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 from django.utils.html import strip_tags
-from django.db.models import Prefetch
+from django.db.models import Q, Count, Exists, OuterRef, Subquery
 from django.db.utils import IntegrityError
 from django.core.management import call_command
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.conf import settings
-from domains.etl.models import Task, TaskRun, DataConnection
+from domains.etl.models import Task, TaskRun, DataConnection, DataConnectionNotificationRecipient
 from domains.sta.models import Datastream
 from hydroserverpy.etl.hydroserver import build_hydroserver_pipeline
 from hydroserverpy.etl.exceptions import ETLError
-from .internal import HydroServerInternalExtractor, HydroServerInternalTransformer, HydroServerInternalLoader
+from hydroserverpy.etl.loaders import ETLLoaderResult, ETLTargetResult
+from .cache import (
+    purge_extraction_cache,
+    stage_load_payload,
+    read_staged_load_payload,
+    delete_staged_load_payload,
+)
+from .limits import get_source_limit_key, acquire_source_slot, release_source_slot
+from .internal import (
+    HydroServerHTTPExtractor,
+    HydroServerSharedExtractor,
+    HydroServerInternalExtractor,
+    HydroServerInternalTransformer,
+    HydroServerInternalLoader,
+    HydroServerStagingLoader,
+    HydroServerAggregationPipeline,
+)
 
 
 def _serialize_log_entries(context) -> list[dict]:
@@ -98,14 +123,9 @@ def _validate_aggregation_task_runtime(task: Task):
         )
 
 
-@shared_task(bind=True, expires=10)
-def run_etl_task(self, task_id: str):
-    """
-    Runs a HydroServer ETL task based on the task configuration provided.
-    """
-
+def _get_etl_task(task_id: str) -> Task:
     try:
-        task = Task.objects.select_related(
+        return Task.objects.select_related(
             "data_connection"
         ).prefetch_related(
             "mappings", "mappings__paths"
@@ -121,6 +141,20 @@ def run_etl_task(self, task_id: str):
             "See task logs for additional details."
         ) from e
 
+
+def _run_etl_pipeline(
+    task: Task,
+    shared_extractions: Optional[dict] = None,
+    stage_load: bool = False,
+):
+    """
+    Runs a task's ETL pipeline and returns the pipeline context. Pipelines given the same shared_extractions
+    dict extract each rendered request once. With stage_load, the transformed payload is returned on
+    context.results instead of being loaded.
+    """
+
+    loader_cls = HydroServerStagingLoader if stage_load else HydroServerInternalLoader
+
     # TODO: HydroServer stored settings and hydroserverpy interface should be better reconciled once automated QA/QC
     #  design is finalized.
 
@@ -132,25 +166,32 @@ def run_etl_task(self, task_id: str):
                 "transformer_cls": HydroServerInternalTransformer,
                 "loader_cls": HydroServerInternalLoader
             }
+        elif task.data_connection.extractor_type == "HTTP":
+            etl_classes = {
+                "extractor_cls": HydroServerHTTPExtractor,
+                "loader_cls": loader_cls
+            }
         else:
             etl_classes = {
-                "loader_cls": HydroServerInternalLoader
+                "loader_cls": loader_cls
             }
 
+        data_mappings = [
+            {
+                "sourceIdentifier": mapping.source_identifier,
+                "paths": [
+                    {
+                        "targetIdentifier": path.target_identifier,
+                        "dataTransformations": path.data_transformations,
+                    } for path in mapping.paths.all()
+                ]
+            } for mapping in task.mappings.all()
+        ]
+
         etl_pipeline, etl_data_mappings, runtime_variables = build_hydroserver_pipeline(
             task=task,
             data_connection=task.data_connection,
-            data_mappings=[
-                {
-                    "sourceIdentifier": mapping.source_identifier,
-                    "paths": [
-                        {
-                            "targetIdentifier": path.target_identifier,
-                            "dataTransformations": path.data_transformations,
-                        } for path in mapping.paths.all()
-                    ]
-                } for mapping in task.mappings.all()
-            ],
+            data_mappings=[data_mapping for data_mapping in data_mappings if data_mapping["paths"]],
             **etl_classes
         )
     except ETLError as e:
@@ -161,6 +202,18 @@ def run_etl_task(self, task_id: str):
             "See task logs for additional details."
         ) from e
 
+    if task.task_type == "Aggregation":
+        etl_pipeline = HydroServerAggregationPipeline(
+            extractor=etl_pipeline.extractor,
+            transformer=etl_pipeline.transformer,
+            loader=etl_pipeline.loader,
+        )
+    elif shared_extractions is not None:
+        etl_pipeline.extractor = HydroServerSharedExtractor(
+            extractor=etl_pipeline.extractor,
+            payloads=shared_extractions,
+        )
+
     try:
         context = etl_pipeline.run(
             task=task,
@@ -188,20 +241,448 @@ def run_etl_task(self, task_id: str):
             error.results = _build_context_result_payload(context)
             raise error from context.exception
 
-    if context.results.values_loaded_total == 0:
-        message = "Already up-to-date. No new observations were loaded."
-    else:
-        message = (
-            f"Loaded {context.results.values_loaded_total} total observation(s) "
-            f"into {context.results.success_count} datastream(s)."
+    return context
+
+
+def _build_failure_result(exception: Exception, traceback_text: Optional[str]) -> dict:
+    result = {
+        "message": str(exception),
+        "error": str(exception),
+        "traceback": traceback_text,
+    }
+    result.update(
+        getattr(exception, "results", None)
+        or getattr(exception, "result", None)
+        or {}
+    )
+
+    return result
+
+
+def _build_load_message(values_loaded_total: int, success_count: int) -> str:
+    if values_loaded_total == 0:
+        return "Already up-to-date. No new observations were loaded."
+
+    return (
+        f"Loaded {values_loaded_total} total observation(s) "
+        f"into {success_count} datastream(s)."
+    )
+
+
+def _use_parallel_load(task: Task) -> bool:
+    """
+    Whether a task has enough target paths to load its transformed observations with parallel subtasks.
+    Aggregation tasks are computed against the Observation table and always run in a single worker.
+    """
+
+    if task.task_type == "Aggregation" or not settings.ETL_PARALLEL_LOAD_MIN_TARGETS:
+        return False
+
+    path_count = sum(len(mapping.paths.all()) for mapping in task.mappings.all())
+
+    return path_count >= settings.ETL_PARALLEL_LOAD_MIN_TARGETS
+
+
+def _get_parallel_load_target_groups(target_ids: list[str]) -> list[list[str]]:
+    group_size = max(settings.ETL_PARALLEL_LOAD_GROUP_SIZE, 1)
+
+    return [
+        target_ids[i:i + group_size] for i in range(0, len(target_ids), group_size)
+    ]
+
+
+def _get_workspace_load_lock_id(workspace_id: UUID, slot: int) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(f"etl-load:{workspace_id}:{slot}".encode(), digest_size=8).digest(),
+        "big",
+        signed=True,
+    )
+
+
+def _acquire_workspace_load_slot(workspace_id: UUID) -> Optional[int]:
+    """
+    Claims one of the workspace's parallel load slots with a PostgreSQL session advisory lock, so the limit
+    holds across workers and a slot is released if its worker dies.
+    """
+
+    with connection.cursor() as cursor:
+        for slot in range(max(settings.ETL_WORKSPACE_LOAD_CONCURRENCY, 1)):
+            lock_id = _get_workspace_load_lock_id(workspace_id, slot)
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+            if cursor.fetchone()[0]:
+                return lock_id
+
+    return None
+
+
+def _release_workspace_load_slot(lock_id: int) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+def _update_next_run_at(task: Task) -> None:
+    if not task.periodic_task:
+        task.next_run_at = None
+        task.save(update_fields=["next_run_at"])
+        return
+
+    now = timezone.now()
+
+    time_delta = task.periodic_task.schedule.remaining_estimate(now)
+    time_delta = max(time_delta, timedelta(0))
+
+    task.next_run_at = now + time_delta
+    task.save(update_fields=["next_run_at"])
+
+
+def _get_coalesced_etl_tasks(data_connection_id: str, crontab: str) -> list[Task]:
+    """
+    Returns the unpaused tasks whose own beat entries were disabled in favor of a data connection's
+    coalesced crontab entry.
+    """
+
+    minute, hour, day_of_month, month_of_year, day_of_week = crontab.split()
+
+    return list(
+        Task.objects.select_related(
+            "data_connection", "periodic_task__crontab", "periodic_task__interval"
+        ).prefetch_related(
+            "mappings", "mappings__paths"
+        ).filter(
+            data_connection_id=data_connection_id,
+            orchestration_system__orchestration_system_type="INTERNAL",
+            paused=False,
+            periodic_task__enabled=False,
+            periodic_task__crontab__minute=minute,
+            periodic_task__crontab__hour=hour,
+            periodic_task__crontab__day_of_month=day_of_month,
+            periodic_task__crontab__month_of_year=month_of_year,
+            periodic_task__crontab__day_of_week=day_of_week,
+        ).exclude(
+            task_type="Aggregation"
+        ).order_by("id")
+    )
+
+
+def _claim_source_slot(
+    task_instance,
+    data_connection: Optional[DataConnection],
+    deferred_at: Optional[str],
+    task_run_ids: tuple = (),
+) -> Optional[str]:
+    """
+    Claims a run slot for the data connection's source and returns its key. If the source is at its concurrency
+    or rate limit, the run is deferred with a retry instead, and any TaskRuns waiting on it note when the
+    deferral started. The retry gets a fresh expiry measured from its countdown, since the original absolute
+    expiry would revoke a run deferred past it and record it as EXPIRED.
+    """
+
+    if task_instance.request.is_eager:
+        return None
+
+    source_key = get_source_limit_key(data_connection)
+
+    if source_key is None:
+        return None
+
+    wait_seconds = acquire_source_slot(source_key, task_instance.request.id)
+
+    if not wait_seconds:
+        return source_key
+
+    deferred_at = deferred_at or timezone.now().isoformat()
+    countdown = math.ceil(wait_seconds)
+
+    message = f"Waiting for {source_key} to drop below its ETL source limit. Retrying in {countdown} second(s)."
+
+    TaskRun.objects.filter(id__in=task_run_ids).update(
+        message=message,
+        result={"message": message, "deferred_at": deferred_at},
+    )
+
+    raise task_instance.retry(
+        countdown=countdown,
+        expires=countdown + settings.ETL_TASK_EXPIRE_SECONDS,
+        kwargs={**task_instance.request.kwargs, "deferred_at": deferred_at},
+    )
+
+
+def _build_source_limit_payload(deferred_at: Optional[str]) -> dict:
+    if not deferred_at:
+        return {}
+
+    return {
+        "source_limit_wait_seconds": round(
+            (timezone.now() - datetime.fromisoformat(deferred_at)).total_seconds(), 3
         )
+    }
+
+
+@shared_task(bind=True, max_retries=None, expires=settings.ETL_TASK_EXPIRE_SECONDS)
+def run_etl_task(self, task_id: str, deferred_at: Optional[str] = None):
+    """
+    Runs a HydroServer ETL task based on the task configuration provided.
+    """
+
+    task = _get_etl_task(task_id)
+
+    parallel_load = _use_parallel_load(task) and not self.request.is_eager
+
+    source_key = _claim_source_slot(self, task.data_connection, deferred_at, (self.request.id,))
+
+    try:
+        context = _run_etl_pipeline(task, stage_load=parallel_load)
+    except Exception as e:
+        if deferred_at:
+            e.results = {**(getattr(e, "results", None) or {}), **_build_source_limit_payload(deferred_at)}
+        raise
+    finally:
+        if source_key:
+            release_source_slot(source_key, self.request.id)
+
+    if parallel_load:
+        payload = context.results.payload.dropna(subset=["value"])
+        target_groups = _get_parallel_load_target_groups(list(payload["target_id"].unique()))
+
+        if len(target_groups) > 1:
+            stage_path = stage_load_payload(payload)
+
+            raise self.replace(
+                chord(
+                    [
+                        run_etl_task_targets.s(task_id=task_id, stage_path=stage_path, target_ids=target_ids)
+                        for target_ids in target_groups
+                    ],
+                    finalize_etl_task_run.s(
+                        task_id=task_id,
+                        stage_path=stage_path,
+                        transform_result={
+                            "runtime_variables": context.runtime_variables,
+                            "log_entries": _serialize_log_entries(context),
+                            **_build_source_limit_payload(deferred_at),
+                        },
+                    ),
+                )
+            )
+
+        context.results = HydroServerInternalLoader().load(payload=payload, task_instance=task)
 
     return {
-        "message": message,
+        "message": _build_load_message(
+            context.results.values_loaded_total, context.results.success_count
+        ),
         **_build_context_result_payload(context),
+        **_build_source_limit_payload(deferred_at),
     }
 
 
+@shared_task(bind=True, max_retries=settings.ETL_WORKSPACE_LOAD_MAX_RETRIES)
+def run_etl_task_targets(self, task_id: str, stage_path: str, target_ids: list[str]):
+    """
+    Loads one group of targets' transformed observations from the run's staged payload as one part of a parallel
+    task run. Errors are returned rather than raised so the chord callback always records the run's outcome.
+    """
+
+    try:
+        task = _get_etl_task(task_id)
+        lock_id = _acquire_workspace_load_slot(task.workspace_id)
+    except Exception as e:
+        return {"error": str(e), "traceback": traceback.format_exc()}
+
+    if lock_id is None:
+        if self.request.retries >= self.max_retries:
+            return {
+                "error": (
+                    f"Timed out waiting for a parallel load slot in workspace '{task.workspace_id}' "
+                    f"after {self.request.retries} retries."
+                ),
+            }
+        raise self.retry(countdown=settings.ETL_WORKSPACE_LOAD_RETRY_DELAY)
+
+    try:
+        return HydroServerInternalLoader().load(
+            payload=read_staged_load_payload(stage_path, target_ids), task_instance=task
+        ).model_dump(mode="json")
+    except Exception as e:
+        return {
+            **(getattr(e, "results", None) or {}),
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+        }
+    finally:
+        _release_workspace_load_slot(lock_id)
+
+
+@shared_task(bind=True)
+def finalize_etl_task_run(
+    self,
+    results: list[dict],
+    task_id: str,
+    transform_result: Optional[dict] = None,
+    stage_path: Optional[str] = None,
+):
+    """
+    Combines the results of a parallel ETL task run's extract and transform stage and its load subtasks into
+    its TaskRun, and deletes the run's staged payload.
+    """
+
+    if stage_path:
+        delete_staged_load_payload(stage_path)
+
+    transform_result = transform_result or {}
+
+    loader_result = ETLLoaderResult(
+        target_results={
+            target_id: ETLTargetResult(**target_result)
+            for result in results
+            for target_id, target_result in (result.get("target_results") or {}).items()
+        }
+    )
+    loader_result.aggregate_results()
+
+    errors = [result for result in results if result.get("error")]
+
+    payload = {
+        "runtime_variables": next(
+            (
+                result["runtime_variables"] for result in [transform_result, *results]
+                if result.get("runtime_variables")
+            ),
+            {},
+        ),
+        "log_entries": [
+            log_entry for result in [transform_result, *results] for log_entry in result.get("log_entries") or []
+        ],
+        **loader_result.model_dump(mode="json"),
+    }
+
+    source_limit_wait_seconds = [
+        result["source_limit_wait_seconds"] for result in [transform_result, *results]
+        if result.get("source_limit_wait_seconds")
+    ]
+    if source_limit_wait_seconds:
+        payload["source_limit_wait_seconds"] = max(source_limit_wait_seconds)
+
+    if errors:
+        status = "FAILURE"
+        result = {
+            "message": errors[0]["error"],
+            "error": errors[0]["error"],
+            "traceback": errors[0].get("traceback"),
+            **payload,
+        }
+    else:
+        status = "SUCCESS"
+        result = {
+            "message": _build_load_message(
+                loader_result.values_loaded_total, loader_result.success_count
+            ),
+            **payload,
+        }
+
+    task_run = TaskRun.objects.filter(id=self.request.id).first()
+
+    if task_run:
+        task_run.status = status
+        task_run.finished_at = timezone.now()
+        task_run.result = result
+        task_run.save(update_fields=["status", "finished_at", "result"])
+
+    return result
+
+
+@shared_task(bind=True, max_retries=None, expires=settings.ETL_TASK_EXPIRE_SECONDS)
+def run_etl_task_group(self, data_connection_id: str, crontab: str, deferred_at: Optional[str] = None):
+    """
+    Runs every task coalesced onto a data connection's crontab beat entry in one worker. Tasks that render the
+    same extractor request share one extracted payload, and each task records its own TaskRun.
+    """
+
+    tasks = _get_coalesced_etl_tasks(data_connection_id, crontab)
+
+    if not tasks:
+        return {}
+
+    source_key = _claim_source_slot(self, tasks[0].data_connection, deferred_at)
+
+    try:
+        return _run_coalesced_etl_tasks(tasks, deferred_at)
+    finally:
+        if source_key:
+            release_source_slot(source_key, self.request.id)
+
+
+def _run_coalesced_etl_tasks(tasks: list[Task], deferred_at: Optional[str]) -> dict:
+    shared_extractions = {}
+    statuses = {}
+
+    for task in tasks:
+        task_run = TaskRun.objects.create(
+            id=uuid4(),
+            task=task,
+            status="RUNNING",
+            started_at=timezone.now(),
+        )
+
+        try:
+            context = _run_etl_pipeline(task, shared_extractions=shared_extractions)
+            task_run.status = "SUCCESS"
+            result = {
+                "message": _build_load_message(
+                    context.results.values_loaded_total, context.results.success_count
+                ),
+                **_build_context_result_payload(context),
+            }
+        except Exception as e:
+            task_run.status = "FAILURE"
+            result = _build_failure_result(e, traceback.format_exc())
+
+        result.update(_build_source_limit_payload(deferred_at))
+        task_run.result = json.loads(json.dumps(result, cls=DjangoJSONEncoder))
+        task_run.finished_at = timezone.now()
+        task_run.save(update_fields=["status", "finished_at", "result"])
+
+        _update_next_run_at(task)
+        statuses[str(task.id)] = task_run.status
+
+    return statuses
+
+
+def record_skipped_etl_runs(
+    task_name: str,
+    task_kwargs: dict,
+    status: str,
+    message: str,
+    run_id: Optional[str] = None,
+) -> None:
+    """
+    Records a TaskRun with the given status for each task a run_etl_task or run_etl_task_group call would
+    have run, so runs that never executed remain visible in the task's run history.
+    """
+
+    if task_name == run_etl_task.name:
+        tasks = Task.objects.select_related("periodic_task").filter(pk=task_kwargs.get("task_id"))
+    elif task_name == run_etl_task_group.name:
+        tasks = _get_coalesced_etl_tasks(task_kwargs["data_connection_id"], task_kwargs["crontab"])
+    else:
+        return
+
+    now = timezone.now()
+
+    for task in tasks:
+        TaskRun.objects.update_or_create(
+            id=run_id if task_name == run_etl_task.name and run_id else uuid4(),
+            defaults={
+                "task": task,
+                "status": status,
+                "started_at": now,
+                "finished_at": now,
+                "result": {"message": message},
+            },
+        )
+        _update_next_run_at(task)
+
+
 @task_prerun.connect
 def mark_etl_task_started(sender, task_id, kwargs, **extra):
     """
@@ -238,18 +719,7 @@ def update_next_run(sender, task_id, kwargs, **extra):
     except Task.DoesNotExist:
         return
 
-    if not task.periodic_task:
-        task.next_run_at = None
-        task.save(update_fields=["next_run_at"])
-        return
-
-    now = timezone.now()
-
-    time_delta = task.periodic_task.schedule.remaining_estimate(now)
-    time_delta = max(time_delta, timedelta(0))
-
-    task.next_run_at = now + time_delta
-    task.save(update_fields=["next_run_at"])
+    _update_next_run_at(task)
 
 
 @task_success.connect
@@ -287,20 +757,9 @@ def mark_etl_task_failure(sender, task_id, einfo, exception, **extra):
     except TaskRun.DoesNotExist:
         return
 
-    result = {
-        "message": str(exception),
-        "error": str(exception),
-        "traceback": einfo.traceback,
-    }
-    result.update(
-        getattr(exception, "results", None)
-        or getattr(exception, "result", None)
-        or {}
-    )
-
     task_run.status = "FAILURE"
     task_run.finished_at = timezone.now()
-    task_run.result = result
+    task_run.result = _build_failure_result(exception, einfo.traceback)
 
     task_run.save(update_fields=["status", "finished_at", "result"])
 
@@ -308,92 +767,176 @@ def mark_etl_task_failure(sender, task_id, einfo, exception, **extra):
 @shared_task(bind=True, expires=10)
 def cleanup_etl_task_runs(self, days=14):
     """
-    Celery task to run the cleanup_etl_task_runs management command.
+    Celery task to run the cleanup_etl_task_runs management command and purge stale extraction cache entries.
     """
 
     call_command("cleanup_etl_task_runs", f"--days={days}")
+    purge_extraction_cache()
+
+
+def _build_notification_task_summaries(data_connection_ids: list[UUID], since: datetime) -> dict[UUID, list[dict]]:
+    daily_runs = Q(taskrun__started_at__gte=since)
+    latest_daily_run = TaskRun.objects.filter(
+        task_id=OuterRef("pk"), started_at__gte=since
+    ).order_by("-started_at", "-id")
+
+    tasks = Task.objects.filter(data_connection_id__in=data_connection_ids).annotate(
+        run_count=Count("taskrun", filter=daily_runs),
+        failure_count=Count("taskrun", filter=daily_runs & Q(taskrun__status="FAILURE")),
+        last_run_message=Subquery(latest_daily_run.values("message")[:1]),
+    ).order_by("name", "id").values(
+        "id", "name", "data_connection_id", "run_count", "failure_count", "last_run_message"
+    )
+
+    task_summaries = defaultdict(list)
+
+    for task in tasks:
+        task_summaries[task["data_connection_id"]].append({
+            "id": task["id"],
+            "name": task["name"],
+            "run_count": task["run_count"],
+            "failure_count": task["failure_count"],
+            "last_run_message": task["last_run_message"] or "",
+            "link": f"{settings.PROXY_BASE_URL}/orchestration?taskId={task['id']}"
+        })
+
+    return task_summaries
 
 
 @shared_task(bind=True, expires=10)
 def send_orchestration_notifications(self):
     """
-    Celery task to run the send_orchestration_notifications management command.
+    Celery task to render the daily orchestration summary of every data connection with notification recipients.
+    Data connections are read DATA_CONNECTION_NOTIFICATION_BATCH_SIZE at a time, and each page of emails is sent
+    by its own send_orchestration_notification_batch task.
     """
 
-    task_run_queryset = TaskRun.objects.filter(
-        started_at__gte=timezone.now() - timedelta(days=1)
-    ).order_by("-started_at")
+    since = timezone.now() - timedelta(days=1)
+    batch_size = max(settings.DATA_CONNECTION_NOTIFICATION_BATCH_SIZE, 1)
+    data_connections = DataConnection.objects.filter(
+        Exists(DataConnectionNotificationRecipient.objects.filter(data_connection_id=OuterRef("pk")))
+    ).order_by("id").only("id", "name")
+    last_data_connection_id = None
+
+    while True:
+        page = data_connections
+        if last_data_connection_id is not None:
+            page = page.filter(id__gt=last_data_connection_id)
+        page = list(page[:batch_size])
+
+        if not page:
+            break
+
+        last_data_connection_id = page[-1].id
+        data_connection_ids = [data_connection.id for data_connection in page]
+
+        recipients = defaultdict(list)
+        for data_connection_id, email in DataConnectionNotificationRecipient.objects.filter(
+            data_connection_id__in=data_connection_ids
+        ).values_list("data_connection_id", "email"):
+            recipients[data_connection_id].append(email)
+
+        task_summaries = _build_notification_task_summaries(data_connection_ids, since)
+        messages = []
+
+        for data_connection in page:
+            if not task_summaries[data_connection.id]:
+                logging.info(
+                    "Skipping email for DataConnection %s because there are no tasks today.",
+                    data_connection.name
+                )
+                continue
+
+            html_content = render_to_string(
+                "orchestration/email/orchestration_notification.html",
+                {
+                    "data_connection_name": data_connection.name,
+                    "tasks": task_summaries[data_connection.id],
+                },
+            )
 
-    data_connections = DataConnection.objects.prefetch_related(
-        "notification_recipients", "tasks", Prefetch(
-            "tasks__taskrun_set",
-            queryset=task_run_queryset,
-            to_attr="daily_task_runs",
-        ),
-    ).all()
+            messages.append({
+                "data_connection_name": data_connection.name,
+                "subject": f"Job Orchestration Status: {data_connection.name}",
+                "recipients": recipients[data_connection.id],
+                "text_content": strip_tags(html_content),
+                "html_content": html_content,
+            })
 
-    for data_connection in data_connections:
-        subject = f"Job Orchestration Status: {data_connection.name}"
-        recipients = [
-            notification_recipient.email
-            for notification_recipient in data_connection.notification_recipients.all()
-        ]
+        if messages:
+            send_orchestration_notification_batch.apply_async(kwargs={"messages": messages})
 
-        task_summaries = []
+        if len(page) < batch_size:
+            break
 
-        for task in data_connection.tasks.all():
-            task_summaries.append({
-                "id": task.id,
-                "name": task.name,
-                "run_count": len(task.daily_task_runs),
-                "failure_count": sum(1 for run in task.daily_task_runs if run.status == "FAILURE"),
-                "last_run_message": task.daily_task_runs[0].result.get("message", "") if task.daily_task_runs else "",
-                "link": f"{settings.PROXY_BASE_URL}/orchestration?taskId={task.id}"
-            })
 
-        if not task_summaries:
-            logging.info(
-                "Skipping email for DataConnection %s because there are no tasks today.",
-                data_connection.name
-            )
-            continue
+@shared_task(bind=True, max_retries=3, default_retry_delay=300)
+def send_orchestration_notification_batch(self, messages: list[dict]):
+    """
+    Celery task to send a page of rendered orchestration summary emails over one SMTP connection. Emails that
+    fail are retried later without resending the ones that were delivered.
+    """
 
-        if not recipients:
-            logging.info(
-                "Skipping email for DataConnection %s because there are no notification recipients.",
-                data_connection.name
-            )
-            continue
+    failed_messages = []
+    email_connection = get_connection(fail_silently=False)
 
-        context = {
-            "data_connection_name": data_connection.name,
-            "tasks": task_summaries
-        }
-
-        html_content = render_to_string("orchestration/email/orchestration_notification.html", context)
-        text_content = strip_tags(html_content)
+    try:
+        email_connection.open()
+    except Exception as e:
+        logging.error("Could not open an SMTP connection for orchestration summary emails: %s", str(e))
+        raise self.retry(exc=e)
 
-        try:
-            msg = EmailMultiAlternatives(
-                subject=subject,
-                body=text_content,
-                from_email=None,
-                to=recipients,
-            )
-            msg.attach_alternative(html_content, "text/html")
-            msg.send(fail_silently=False)
+    try:
+        for message in messages:
+            try:
+                email = EmailMultiAlternatives(
+                    subject=message["subject"],
+                    body=message["text_content"],
+                    from_email=None,
+                    to=message["recipients"],
+                    connection=email_connection,
+                )
+                email.attach_alternative(message["html_content"], "text/html")
+                email.send(fail_silently=False)
+
+                logging.info(
+                    "Sent orchestration summary email for DataConnection %s to: %s",
+                    message["data_connection_name"],
+                    message["recipients"]
+                )
+
+            except Exception as e:
+                logging.error(
+                    "Failed to send email for DataConnection %s to %s: %s",
+                    message["data_connection_name"],
+                    message["recipients"],
+                    str(e),
+                    exc_info=True
+                )
+                failed_messages.append(message)
+    finally:
+        email_connection.close()
+
+    if failed_messages:
+        raise self.retry(kwargs={"messages": failed_messages})
+
+
+@task_revoked.connect
+def mark_etl_task_expired(sender, request, expired=False, **extra):
+    """
+    Records ETL runs that expired in the queue before a worker could start them as EXPIRED.
+    """
 
-            logging.info(
-                "Sent orchestration summary email for DataConnection %s to: %s",
-                data_connection.name,
-                recipients
-            )
+    if not expired or sender not in (run_etl_task, run_etl_task_group):
+        return
 
-        except Exception as e:
-            logging.error(
-                "Failed to send email for DataConnection %s to %s: %s",
-                data_connection.name,
-                recipients,
-                str(e),
-                exc_info=True
-            )
+    record_skipped_etl_runs(
+        sender.name,
+        request.kwargs or {},
+        status="EXPIRED",
+        message=(
+            f"Run expired after waiting more than {settings.ETL_TASK_EXPIRE_SECONDS} seconds for an available "
+            "worker. The next scheduled run will load any data this run missed."
+        ),
+        run_id=request.id,
+    )
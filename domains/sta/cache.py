@@ -1,8 +1,14 @@
+import time
+import uuid
+import hashlib
+from typing import Callable, Iterable, Optional, Union
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 
 
-PUBLIC_THING_MARKERS_CACHE_KEY = "sta:thing-markers:public:v1"
+PUBLIC_THING_MARKERS_CACHE_PREFIX = "sta:thing-markers:public:v3"
+PUBLIC_THING_MARKERS_WAIT_INTERVAL = 0.05
 
 
 def get_public_thing_markers_cache_timeout() -> int:
@@ -12,17 +18,229 @@ def get_public_thing_markers_cache_timeout() -> int:
     )
 
 
-def get_public_thing_markers_cache():
-    return cache.get(PUBLIC_THING_MARKERS_CACHE_KEY)
+def get_public_thing_markers_lock_timeout() -> int:
+    return max(
+        int(getattr(settings, "PUBLIC_THING_MARKERS_LOCK_TIMEOUT", 30)),
+        1,
+    )
+
+
+def get_public_thing_markers_cache_version() -> str:
+    version_key = f"{PUBLIC_THING_MARKERS_CACHE_PREFIX}:version"
+    version = cache.get(version_key)
+
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(version_key, version, timeout=None):
+            version = cache.get(version_key, version)
+
+    return version
+
+
+def get_or_build_public_thing_markers(build: Callable[[], list[dict]]) -> list[dict]:
+    """
+    Returns the cached public markers, calling build() to rebuild them on a miss. Markers are cached under the
+    current cache version, so a rebuild that finishes after an invalidation can't store stale markers. Only one
+    process rebuilds a version at a time: the others wait up to PUBLIC_THING_MARKERS_LOCK_TIMEOUT seconds for its
+    result before building the markers themselves.
+    """
+
+    cache_timeout = get_public_thing_markers_cache_timeout()
+
+    if not cache_timeout:
+        return build()
 
+    cache_key = f"{PUBLIC_THING_MARKERS_CACHE_PREFIX}:{get_public_thing_markers_cache_version()}"
+    markers = cache.get(cache_key)
 
-def set_public_thing_markers_cache(markers: list[dict]) -> None:
+    if markers is not None:
+        return markers
+
+    lock_key = f"{cache_key}:lock"
+    lock_timeout = get_public_thing_markers_lock_timeout()
+    lock_acquired = cache.add(lock_key, True, timeout=lock_timeout)
+
+    if not lock_acquired:
+        deadline = time.monotonic() + lock_timeout
+
+        while time.monotonic() < deadline and cache.get(lock_key):
+            time.sleep(PUBLIC_THING_MARKERS_WAIT_INTERVAL)
+            markers = cache.get(cache_key)
+
+            if markers is not None:
+                return markers
+
+    try:
+        markers = build()
+        cache.set(cache_key, markers, timeout=cache_timeout)
+    finally:
+        if lock_acquired:
+            cache.delete(lock_key)
+
+    return markers
+
+
+def get_public_thing_tile_cache(tile_key: str) -> Optional[bytes]:
+    return cache.get(
+        f"{PUBLIC_THING_MARKERS_CACHE_PREFIX}:{get_public_thing_markers_cache_version()}:tile:{tile_key}"
+    )
+
+
+def set_public_thing_tile_cache(tile_key: str, tile: bytes) -> None:
     cache.set(
-        PUBLIC_THING_MARKERS_CACHE_KEY,
-        markers,
+        f"{PUBLIC_THING_MARKERS_CACHE_PREFIX}:{get_public_thing_markers_cache_version()}:tile:{tile_key}",
+        tile,
         timeout=get_public_thing_markers_cache_timeout(),
     )
 
 
 def invalidate_public_thing_markers_cache(*args, **kwargs) -> None:
-    cache.delete(PUBLIC_THING_MARKERS_CACHE_KEY)
+    cache.set(f"{PUBLIC_THING_MARKERS_CACHE_PREFIX}:version", uuid.uuid4().hex, timeout=None)
+
+
+FILE_ATTACHMENT_LINK_CACHE_PREFIX = "sta:file-attachment-link:v1"
+FILE_ATTACHMENT_LINK_REFRESH_MARGIN = 300
+FILE_ATTACHMENT_LINK_CACHE_SIZE = 10000
+
+_file_attachment_links: dict[str, tuple[str, float]] = {}
+
+
+def get_file_attachment_link_expire() -> int:
+    return max(
+        int(getattr(settings, "FILE_ATTACHMENT_LINK_EXPIRE", 3600)),
+        0,
+    )
+
+
+def get_file_attachment_link_cache_key(name: str) -> str:
+    return f"{FILE_ATTACHMENT_LINK_CACHE_PREFIX}:{hashlib.sha256(name.encode()).hexdigest()}"
+
+
+def sign_file_attachment_link(storage, name: str, expire: int) -> str:
+    try:
+        link = storage.url(name, expire=expire)
+    except TypeError:
+        link = storage.url(name)
+
+    if settings.DEPLOYMENT_BACKEND == "local":
+        link = settings.PROXY_BASE_URL + link
+
+    return link
+
+
+def get_file_attachment_links(storage, names: Iterable[str]) -> dict[str, str]:
+    """
+    Returns links to stored file attachments by storage name. Storages that sign URLs sign them for
+    FILE_ATTACHMENT_LINK_EXPIRE seconds. Signed links are shared between processes through the cache and reused
+    until FILE_ATTACHMENT_LINK_REFRESH_MARGIN seconds before they expire. Each process also keeps the links it has
+    looked up, so serializing attachments after a batch lookup doesn't go back to the cache.
+    """
+
+    now = time.time()
+    links = {}
+
+    for name in set(names):
+        local_link = _file_attachment_links.get(name)
+        if local_link and local_link[1] > now:
+            links[name] = local_link[0]
+
+    cache_keys = {
+        get_file_attachment_link_cache_key(name): name for name in set(names) if name not in links
+    }
+
+    if not cache_keys:
+        return links
+
+    if len(_file_attachment_links) + len(cache_keys) > FILE_ATTACHMENT_LINK_CACHE_SIZE:
+        _file_attachment_links.clear()
+
+    for cache_key, (link, expires_at) in cache.get_many(list(cache_keys)).items():
+        if expires_at > now:
+            links[cache_keys[cache_key]] = link
+            _file_attachment_links[cache_keys[cache_key]] = (link, expires_at)
+
+    expire = get_file_attachment_link_expire()
+    reuse_timeout = expire - FILE_ATTACHMENT_LINK_REFRESH_MARGIN
+    signed_links = {}
+
+    for cache_key, name in cache_keys.items():
+        if name in links:
+            continue
+
+        links[name] = sign_file_attachment_link(storage, name, expire)
+
+        if reuse_timeout > 0:
+            signed_links[cache_key] = (links[name], now + reuse_timeout)
+            _file_attachment_links[name] = signed_links[cache_key]
+
+    if signed_links:
+        cache.set_many(signed_links, timeout=reuse_timeout)
+
+    return links
+
+
+def get_file_attachment_link(storage, name: str) -> str:
+    return get_file_attachment_links(storage, [name])[name]
+
+
+SENSORTHINGS_RESPONSE_CACHE_PREFIX = "sta:sensorthings-response:v1"
+
+
+def get_sensorthings_response_cache_timeout() -> int:
+    return max(
+        int(getattr(settings, "ST_API_RESPONSE_CACHE_TIMEOUT", 60)),
+        0,
+    )
+
+
+def get_sensorthings_response_cache_versions(scopes: list[str]) -> list[str]:
+    version_keys = [
+        f"{SENSORTHINGS_RESPONSE_CACHE_PREFIX}:version:{scope}" for scope in scopes
+    ]
+    versions = cache.get_many(version_keys)
+
+    missing_versions = {
+        version_key: uuid.uuid4().hex
+        for version_key in version_keys
+        if version_key not in versions
+    }
+
+    if missing_versions:
+        cache.set_many(missing_versions, timeout=None)
+        versions.update(missing_versions)
+
+    return [versions[version_key] for version_key in version_keys]
+
+
+def get_sensorthings_response_cache(cache_key: str):
+    return cache.get(f"{SENSORTHINGS_RESPONSE_CACHE_PREFIX}:{cache_key}")
+
+
+def set_sensorthings_response_cache(cache_key: str, response) -> None:
+    cache.set(
+        f"{SENSORTHINGS_RESPONSE_CACHE_PREFIX}:{cache_key}",
+        response,
+        timeout=get_sensorthings_response_cache_timeout(),
+    )
+
+
+def invalidate_sensorthings_response_cache(
+    datastream_ids: Optional[Iterable[Union[uuid.UUID, str]]] = None,
+) -> None:
+    """
+    Bumps the cache versions of the affected SensorThings responses once the current transaction commits. Bumping
+    them earlier would let a concurrent request cache the pre-commit data under the new version.
+    """
+
+    scopes = ["datastreams"] if datastream_ids is not None else ["things"]
+    scopes += [f"datastream:{datastream_id}" for datastream_id in datastream_ids or []]
+
+    transaction.on_commit(
+        lambda: cache.set_many(
+            {
+                f"{SENSORTHINGS_RESPONSE_CACHE_PREFIX}:version:{scope}": uuid.uuid4().hex
+                for scope in scopes
+            },
+            timeout=None,
+        )
+    )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.2 on 2026-10-19 15:35
+
+import django.contrib.postgres.indexes
+import domains.sta.spatial
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sta', '0007_remove_thingfileattachment_download_token_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GistIndex(domains.sta.spatial.LocationPoint(), name='sta_location_point_gist'),
+        ),
+    ]
@@ -3,7 +3,9 @@ import typing
 from typing import Optional, Union
 from django.db import models
 from django.db.models import Q
+from django.contrib.postgres.indexes import GistIndex
 from domains.iam.models.utils import PermissionChecker
+from domains.sta.spatial import LocationPoint, bbox_filter, radius_filter, nearest_ordering
 from .thing import Thing
 
 if typing.TYPE_CHECKING:
@@ -20,6 +22,15 @@ class LocationQuerySet(models.QuerySet):
         invalidate_public_thing_markers_cache()
         return super().delete(*args, **kwargs)
 
+    def in_bbox(self, bbox_filters: list[tuple[float, float, float, float]]):
+        return self.filter(bbox_filter(bbox_filters))
+
+    def within_radius(self, longitude: float, latitude: float, radius_km: float):
+        return self.filter(radius_filter(longitude, latitude, radius_km))
+
+    def nearest(self, longitude: float, latitude: float):
+        return self.order_by(nearest_ordering(longitude, latitude))
+
     def visible(self, principal: Optional[Union["User", "APIKey"]]):
         if hasattr(principal, "account_type"):
             if principal.account_type == "admin":
@@ -84,6 +95,11 @@ class Location(models.Model, PermissionChecker):
     def __str__(self):
         return f"{self.name} - {self.id}"
 
+    class Meta:
+        indexes = [
+            GistIndex(LocationPoint(), name="sta_location_point_gist"),
+        ]
+
     def delete(self, *args, **kwargs):
         from domains.sta.cache import invalidate_public_thing_markers_cache
 
@@ -2,7 +2,7 @@ import io
 import uuid6
 import typing
 import operator
-from typing import Literal, Optional, Union
+from typing import Literal, Optional, Sequence, Union
 from django.db import models, connection
 from django.db.models import Q, OuterRef, Exists
 from domains.iam.models import Workspace, APIKey, Permission, Collaborator
@@ -17,6 +17,19 @@ if typing.TYPE_CHECKING:
     User = get_user_model()
 
 
+def escape_pg_copy(value):
+    if value is None:
+        return r"\N"
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return str(value)
+
+
 class ObservationQuerySet(models.QuerySet):
     def visible(self, principal: Optional[Union["User", "APIKey"]]):
         public_filter = Q(
@@ -97,18 +110,6 @@ class ObservationQuerySet(models.QuerySet):
 
         attr_getters = [operator.attrgetter(field) for field in db_fields]
 
-        def escape_pg_copy(value):
-            if value is None:
-                return r"\N"
-            if isinstance(value, str):
-                return (
-                    value.replace("\\", "\\\\")
-                    .replace("\t", "\\t")
-                    .replace("\n", "\\n")
-                    .replace("\r", "\\r")
-                )
-            return str(value)
-
         with connection.cursor() as cursor:
             with cursor.copy(
                 f"COPY {db_table_sql} ({db_fields_sql}) FROM STDIN"
@@ -160,6 +161,31 @@ class ObservationQuerySet(models.QuerySet):
 
         return observations
 
+    def bulk_copy_values(self, fields: list[str], rows, batch_size=100_000) -> None:
+        db_table_sql = connection.ops.quote_name(self.model._meta.db_table)  # noqa
+        db_fields_sql = ", ".join(
+            connection.ops.quote_name(self.model._meta.get_field(field).column)
+            for field in fields
+        )
+
+        with connection.cursor() as cursor:
+            with cursor.copy(
+                f"COPY {db_table_sql} ({db_fields_sql}) FROM STDIN"
+            ) as copy:
+                lines = []
+                for row in rows:
+                    lines.append("\t".join(escape_pg_copy(value) for value in row))
+                    if len(lines) >= batch_size:
+                        copy.write("\n".join(lines) + "\n")
+                        lines = []
+                if lines:
+                    copy.write("\n".join(lines) + "\n")
+
+    def bulk_copy_columns(self, columns: dict[str, Sequence], batch_size=100_000) -> None:
+        self.bulk_copy_values(
+            fields=list(columns), rows=zip(*columns.values()), batch_size=batch_size
+        )
+
 
 class Observation(models.Model, PermissionChecker):
     id = models.UUIDField(primary_key=True, default=uuid6.uuid7, editable=False)
@@ -239,6 +265,9 @@ class Observation(models.Model, PermissionChecker):
         return permissions
 
     def delete(self, *args, **kwargs):
+        from domains.sta.cache import invalidate_sensorthings_response_cache
+
+        invalidate_sensorthings_response_cache(datastream_ids=[self.datastream_id])
         self.delete_contents(filter_arg=self, filter_suffix="")
         super().delete(*args, **kwargs)
 
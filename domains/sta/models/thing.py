@@ -3,7 +3,6 @@ import typing
 from typing import Literal, Optional, Union
 from django.db import models
 from django.db.models import Q
-from django.conf import settings
 from domains.iam.models import Workspace
 from domains.iam.models.utils import PermissionChecker
 
@@ -213,17 +212,9 @@ class ThingFileAttachment(models.Model, PermissionChecker):
 
     @property
     def link(self):
-        storage = self.file_attachment.storage
+        from domains.sta.cache import get_file_attachment_link
 
-        try:
-            file_attachment_link = storage.url(self.file_attachment.name, expire=3600)
-        except TypeError:
-            file_attachment_link = storage.url(self.file_attachment.name)
-
-        if settings.DEPLOYMENT_BACKEND == "local":
-            file_attachment_link = settings.PROXY_BASE_URL + file_attachment_link
-
-        return file_attachment_link
+        return get_file_attachment_link(self.file_attachment.storage, self.file_attachment.name)
 
     class Meta:
         unique_together = ("thing", "name")
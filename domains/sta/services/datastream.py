@@ -3,12 +3,15 @@ from typing import Optional, Literal, Sequence, get_args
 from ninja.errors import HttpError
 from django.http import HttpResponse
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
-from django.db.models import QuerySet, Min, Max, Count, F
+from django.db import IntegrityError, connection
+from django.db.models import QuerySet, Min, Max, Count, F, OuterRef
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.expressions import ArraySubquery
 from django.utils import timezone
 from django.http import StreamingHttpResponse
 from interfaces.api.service import ServiceUtils
+from domains.sta.cache import invalidate_sensorthings_response_cache, get_file_attachment_links
+from domains.sta.uploads import validate_file_attachment_size
 from domains.iam.models import APIKey
 from domains.sta.models import (
     Datastream,
@@ -19,8 +22,17 @@ from domains.sta.models import (
     DatastreamStatus,
     SampledMedium,
     FileAttachmentType,
+    ThingFileAttachment,
 )
 from interfaces.api.schemas import (
+    TagGetResponse,
+    FileAttachmentGetResponse,
+    WorkspaceSummaryResponse,
+    ThingSummaryResponse,
+    SensorSummaryResponse,
+    ObservedPropertySummaryResponse,
+    ProcessingLevelSummaryResponse,
+    UnitSummaryResponse,
     DatastreamPostBody,
     DatastreamPatchBody,
     TagPostBody,
@@ -122,6 +134,47 @@ class DatastreamService(ServiceUtils):
 
         return queryset.distinct()
 
+    def list_expanded_rows(self, queryset: QuerySet) -> list[dict]:
+        """
+        Fetches one page of expanded datastreams as JSON rows in a single query, with the related objects, tags,
+        and file attachments built in SQL instead of selected and prefetched as model instances.
+        """
+
+        datastream_json = self.build_json_object(
+            DatastreamDetailResponse,
+            workspace=self.build_json_object(WorkspaceSummaryResponse, "thing__workspace__"),
+            thing=thing_service.get_thing_json_object(ThingSummaryResponse, "thing__", thing_ref="thing_id"),
+            sensor=self.build_json_object(SensorSummaryResponse, "sensor__"),
+            observed_property=self.build_json_object(ObservedPropertySummaryResponse, "observed_property__"),
+            processing_level=self.build_json_object(ProcessingLevelSummaryResponse, "processing_level__"),
+            unit=self.build_json_object(UnitSummaryResponse, "unit__"),
+            datastream_tags=ArraySubquery(
+                DatastreamTag.objects.filter(datastream_id=OuterRef("pk"))
+                .order_by("id")
+                .values(json=self.build_json_object(TagGetResponse))
+            ),
+            datastream_file_attachments=ArraySubquery(
+                DatastreamFileAttachment.objects.filter(datastream_id=OuterRef("pk"))
+                .order_by("id")
+                .values(json=self.build_json_object(FileAttachmentGetResponse, link=F("file_attachment")))
+            ),
+        )
+        rows = list(
+            Datastream.objects.filter(pk__in=queryset.values("pk"))
+            .order_by(*queryset.query.order_by)
+            .values_list(datastream_json, flat=True)
+        )
+        thing_service.resolve_file_attachment_links(
+            [file_attachment for row in rows for file_attachment in row["datastream_file_attachments"]],
+            DatastreamFileAttachment._meta.get_field("file_attachment").storage,
+        )
+        thing_service.resolve_file_attachment_links(
+            [file_attachment for row in rows for file_attachment in row["thing"]["thing_file_attachments"]],
+            ThingFileAttachment._meta.get_field("file_attachment").storage,
+        )
+
+        return rows
+
     def list(
         self,
         principal: Optional[User | APIKey],
@@ -131,6 +184,8 @@ class DatastreamService(ServiceUtils):
         order_by: Optional[list[str]] = None,
         filtering: Optional[dict] = None,
         expand_related: Optional[bool] = None,
+        cursor: Optional[uuid.UUID] = None,
+        count_mode: str = "exact",
     ):
         queryset = Datastream.objects
 
@@ -176,6 +231,11 @@ class DatastreamService(ServiceUtils):
 
         queryset = self.apply_tag_filter(queryset, filtering.get("tag"))
 
+        keyset = not order_by
+
+        if cursor is not None and not keyset:
+            raise HttpError(400, "Cursor pagination is only supported with the default ordering")
+
         if order_by:
             queryset = self.apply_ordering(
                 queryset,
@@ -185,25 +245,40 @@ class DatastreamService(ServiceUtils):
         else:
             queryset = queryset.order_by("id")
 
-        if expand_related:
-            queryset = self.select_expanded_fields(queryset)
-        else:
+        if not expand_related:
             queryset = queryset.select_related("thing").prefetch_related(
                 "datastream_tags", "datastream_file_attachments"
             )
 
         queryset = queryset.visible(principal=principal).distinct()
 
-        queryset, count = self.apply_pagination(queryset, response, page, page_size)
+        queryset, count = self.apply_pagination(
+            queryset, response, page, page_size, count_mode=count_mode, cursor=cursor
+        )
 
-        return [
-            (
+        if expand_related:
+            datastreams = [
                 DatastreamDetailResponse.model_validate(datastream)
-                if expand_related
-                else DatastreamSummaryResponse.model_validate(datastream)
+                for datastream in self.list_expanded_rows(queryset)
+            ]
+        else:
+            datastreams = list(queryset)
+            get_file_attachment_links(
+                DatastreamFileAttachment._meta.get_field("file_attachment").storage,
+                [
+                    file_attachment.file_attachment.name
+                    for datastream in datastreams
+                    for file_attachment in datastream.datastream_file_attachments.all()
+                ],
             )
-            for datastream in queryset.all()
-        ]
+            datastreams = [
+                DatastreamSummaryResponse.model_validate(datastream) for datastream in datastreams
+            ]
+
+        if keyset:
+            self.set_next_cursor(response, datastreams, page_size)
+
+        return datastreams
 
     def list_visualization_bootstrap(
         self,
@@ -598,7 +673,13 @@ class DatastreamService(ServiceUtils):
         if filtering.get("file_attachment_type"):
             queryset = self.apply_filters(queryset, "file_attachment_type", filtering["file_attachment_type"])
 
-        return queryset.all()
+        file_attachments = list(queryset.all())
+        get_file_attachment_links(
+            DatastreamFileAttachment._meta.get_field("file_attachment").storage,
+            [file_attachment.file_attachment.name for file_attachment in file_attachments],
+        )
+
+        return file_attachments
 
     def add_file_attachment(
         self, principal: User | APIKey, uid: uuid.UUID, file, data: FileAttachmentPostBody
@@ -607,6 +688,8 @@ class DatastreamService(ServiceUtils):
             principal=principal, uid=uid, action="edit"
         )
 
+        validate_file_attachment_size(file)
+
         if DatastreamFileAttachment.objects.filter(
             datastream=datastream, name=file.name
         ).exists():
@@ -623,6 +706,8 @@ class DatastreamService(ServiceUtils):
     def replace_file_attachment(
         self, principal: User | APIKey, uid: uuid.UUID, file, data: FileAttachmentPostBody
     ):
+        validate_file_attachment_size(file)
+
         self.remove_file_attachment(
             principal=principal, uid=uid, data=FileAttachmentDeleteBody(name=file.name)
         )
@@ -875,3 +960,62 @@ class DatastreamService(ServiceUtils):
             datastream.value_count = aggregate.get("value_count")
 
         datastream.save()
+
+    @staticmethod
+    def update_appended_observation_statistics(appended_statistics: dict[uuid.UUID, dict]) -> None:
+        """
+        Widens each datastream's time bounds and adds to its value count using the aggregates of the observations
+        just appended to it, keyed by datastream ID. Datastreams whose value count was never computed are counted
+        in full instead.
+        """
+
+        appended_statistics = {
+            datastream_id: statistics for datastream_id, statistics in appended_statistics.items()
+            if statistics.get("value_count")
+        }
+
+        if not appended_statistics:
+            return
+
+        datastream_table = connection.ops.quote_name(Datastream._meta.db_table)
+        observation_table = connection.ops.quote_name(Observation._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {datastream_table} AS datastream
+                SET phenomenon_begin_time = LEAST(datastream.phenomenon_begin_time, appended.phenomenon_begin_time),
+                    phenomenon_end_time = GREATEST(datastream.phenomenon_end_time, appended.phenomenon_end_time),
+                    result_begin_time = LEAST(datastream.result_begin_time, appended.result_begin_time),
+                    result_end_time = GREATEST(datastream.result_end_time, appended.result_end_time),
+                    value_count = CASE
+                        WHEN datastream.value_count IS NULL THEN (
+                            SELECT COUNT(*) FROM {observation_table} AS observation
+                            WHERE observation.datastream_id = datastream.id
+                        )
+                        ELSE datastream.value_count + appended.value_count
+                    END
+                FROM UNNEST(
+                    %s::uuid[], %s::timestamptz[], %s::timestamptz[], %s::timestamptz[], %s::timestamptz[], %s::integer[]
+                ) AS appended(
+                    datastream_id, phenomenon_begin_time, phenomenon_end_time, result_begin_time, result_end_time,
+                    value_count
+                )
+                WHERE datastream.id = appended.datastream_id
+                """,
+                [
+                    list(appended_statistics.keys()),
+                    *(
+                        [statistics.get(field) for statistics in appended_statistics.values()]
+                        for field in [
+                            "phenomenon_begin_time",
+                            "phenomenon_end_time",
+                            "result_begin_time",
+                            "result_end_time",
+                            "value_count",
+                        ]
+                    ),
+                ],
+            )
+
+        invalidate_sensorthings_response_cache(datastream_ids=list(appended_statistics.keys()))
@@ -14,6 +14,7 @@ from django.db.utils import IntegrityError
 from django.contrib.postgres.aggregates import ArrayAgg
 from domains.iam.models import APIKey
 from domains.sta.models import Observation, ResultQualifier
+from domains.sta.cache import invalidate_sensorthings_response_cache
 from interfaces.api.schemas.observation import (
     ObservationFields,
     ObservationOrderByFields,
@@ -444,6 +445,7 @@ class ObservationService(ServiceUtils):
             queryset = queryset.filter(phenomenon_time__lte=data.phenomenon_time_end)
 
         queryset.delete()
+        invalidate_sensorthings_response_cache(datastream_ids=[datastream.id])
 
         if update_datastream_statistics is True:
             datastream_service.update_observation_statistics(
@@ -1,4 +1,8 @@
+import math
 import uuid
+import heapq
+import hashlib
+import orjson
 from collections import defaultdict
 from typing import Optional, Literal, get_args
 from ninja.errors import HttpError
@@ -6,12 +10,26 @@ from django.http import HttpResponse
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.db import IntegrityError
-from django.db.models import QuerySet, F, Q, FloatField
-from django.db.models.functions import Cast
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import QuerySet, F, FloatField, JSONField, Subquery, OuterRef
+from django.db.models.functions import Cast, JSONObject
+from django.conf import settings
+from pydantic.alias_generators import to_camel
 from domains.iam.models import APIKey
 from domains.sta.cache import (
-    get_public_thing_markers_cache,
-    set_public_thing_markers_cache,
+    get_file_attachment_links,
+    get_or_build_public_thing_markers,
+    get_public_thing_tile_cache,
+    set_public_thing_tile_cache,
+)
+from domains.sta.spatial import bbox_filter, radius_filter, nearest_ordering
+from domains.sta.uploads import validate_file_attachment_size
+from domains.sta.tiles import (
+    is_valid_tile,
+    get_tile_bbox,
+    project_to_tile,
+    cluster_tile_features,
+    encode_tile,
 )
 from domains.sta.models import (
     Thing,
@@ -24,6 +42,8 @@ from domains.sta.models import (
 )
 from interfaces.api.schemas import (
     TagGetResponse,
+    FileAttachmentGetResponse,
+    WorkspaceSummaryResponse,
     ThingSummaryResponse,
     ThingDetailResponse,
     ThingPostBody,
@@ -33,7 +53,7 @@ from interfaces.api.schemas import (
     FileAttachmentPostBody,
     FileAttachmentDeleteBody,
 )
-from interfaces.api.schemas.thing import ThingFields, LocationFields, ThingOrderByFields
+from interfaces.api.schemas.thing import ThingFields, LocationFields, LocationDetailResponse, ThingOrderByFields
 from interfaces.api.service import ServiceUtils
 
 User = get_user_model()
@@ -82,39 +102,109 @@ class ThingService(ServiceUtils):
             .with_location()
         )
 
+    @classmethod
+    def get_thing_json_object(
+        cls,
+        schema: type[ThingSummaryResponse | ThingDetailResponse],
+        prefix: str = "",
+        thing_ref: str = "pk",
+    ) -> JSONObject:
+        """
+        Builds a thing response as one JSON object in SQL. The location, tags, and file attachments are read with
+        correlated subqueries on thing_ref, so expanded listings need no prefetch queries. Attachment links hold
+        the storage name until resolve_file_attachment_links replaces them.
+        """
+
+        expressions = {
+            "location": Subquery(
+                Location.objects.filter(thing_id=OuterRef(thing_ref))
+                .order_by("id")
+                .values(json=cls.build_json_object(LocationDetailResponse))[:1],
+                output_field=JSONField(),
+            ),
+            "thing_tags": ArraySubquery(
+                ThingTag.objects.filter(thing_id=OuterRef(thing_ref))
+                .order_by("id")
+                .values(json=cls.build_json_object(TagGetResponse))
+            ),
+            "thing_file_attachments": ArraySubquery(
+                ThingFileAttachment.objects.filter(thing_id=OuterRef(thing_ref))
+                .order_by("id")
+                .values(json=cls.build_json_object(FileAttachmentGetResponse, link=F("file_attachment")))
+            ),
+        }
+
+        if "workspace" in schema.model_fields:
+            expressions["workspace"] = cls.build_json_object(WorkspaceSummaryResponse, f"{prefix}workspace__")
+
+        return cls.build_json_object(schema, prefix, **expressions)
+
     @staticmethod
-    def apply_bbox_filter(queryset, bbox: Optional[list[str]]):
-        if not bbox:
+    def resolve_file_attachment_links(file_attachments: list[dict], storage) -> list[dict]:
+        links = get_file_attachment_links(storage, [file_attachment["link"] for file_attachment in file_attachments])
+
+        for file_attachment in file_attachments:
+            file_attachment["link"] = links[file_attachment["link"]]
+
+        return file_attachments
+
+    def list_expanded_rows(self, queryset: QuerySet) -> list[dict]:
+        """
+        Fetches one page of expanded things as JSON rows in a single query. The page is selected by the paginated
+        queryset, then re-ordered the same way, so JSON is only built for the rows returned.
+        """
+
+        rows = list(
+            Thing.objects.filter(pk__in=queryset.values("pk"))
+            .order_by(*queryset.query.order_by)
+            .values_list(self.get_thing_json_object(ThingDetailResponse), flat=True)
+        )
+        self.resolve_file_attachment_links(
+            [file_attachment for row in rows for file_attachment in row["thing_file_attachments"]],
+            ThingFileAttachment._meta.get_field("file_attachment").storage,
+        )
+
+        return rows
+
+    @classmethod
+    def apply_bbox_filter(cls, queryset, bbox: Optional[list[str]]):
+        parsed_bbox_filters = cls.parse_bbox_filters(bbox)
+
+        if not parsed_bbox_filters:
             return queryset
 
-        bbox_filter = Q()
+        return queryset.filter(bbox_filter(parsed_bbox_filters, prefix="locations__"))
 
-        for bbox_str in bbox:
-            try:
-                parts = [float(x) for x in bbox_str.split(",")]
-            except ValueError:
-                raise ValueError("Bounding box must contain only numeric values")
+    @classmethod
+    def apply_near_filter(cls, queryset, near: Optional[str]):
+        if not near:
+            return queryset
 
-            if len(parts) != 4:
-                raise ValueError(
-                    "Bounding box must have exactly 4 comma-separated values: min_lon,min_lat,max_lon,max_lat"
-                )
+        longitude, latitude, radius_km = cls.parse_near_filter(near)
 
-            min_lon, min_lat, max_lon, max_lat = parts
+        return queryset.filter(radius_filter(longitude, latitude, radius_km, prefix="locations__"))
 
-            if min_lon > max_lon or min_lat > max_lat:
-                raise ValueError(
-                    "Invalid bounding box coordinates: min must be less than or equal to max"
-                )
+    @staticmethod
+    def parse_near_filter(near: str) -> tuple[float, float, float]:
+        try:
+            parts = [float(x) for x in near.split(",")]
+        except ValueError:
+            raise HttpError(400, "Near filter must contain only numeric values")
 
-            bbox_filter |= Q(
-                locations__longitude__gte=min_lon,
-                locations__longitude__lte=max_lon,
-                locations__latitude__gte=min_lat,
-                locations__latitude__lte=max_lat,
+        if len(parts) != 3:
+            raise HttpError(
+                400, "Near filter must have exactly 3 comma-separated values: lon,lat,radius_km"
             )
 
-        return queryset.filter(bbox_filter)
+        longitude, latitude, radius_km = parts
+
+        if not -180 <= longitude <= 180 or not -90 <= latitude <= 90 or radius_km < 0:
+            raise HttpError(
+                400,
+                "Invalid near filter: coordinates must be valid and the radius must not be negative"
+            )
+
+        return longitude, latitude, radius_km
 
     @staticmethod
     def apply_tag_filter(queryset, tags: list[str]):
@@ -171,16 +261,7 @@ class ThingService(ServiceUtils):
         if not parsed_bbox_filters:
             return queryset
 
-        bbox_filter = Q()
-        for min_lon, min_lat, max_lon, max_lat in parsed_bbox_filters:
-            bbox_filter |= Q(
-                longitude__gte=min_lon,
-                longitude__lte=max_lon,
-                latitude__gte=min_lat,
-                latitude__lte=max_lat,
-            )
-
-        return queryset.filter(bbox_filter)
+        return queryset.filter(bbox_filter(parsed_bbox_filters))
 
     @staticmethod
     def apply_marker_filters(queryset: QuerySet, filtering: Optional[dict] = None) -> QuerySet:
@@ -289,54 +370,104 @@ class ThingService(ServiceUtils):
             for site in site_rows
         ]
 
+    @staticmethod
+    def encode_marker(marker: dict) -> bytes:
+        return orjson.dumps({to_camel(field): value for field, value in marker.items()})
+
     @classmethod
-    def filter_cached_markers(
-        cls, markers: list[dict], filtering: Optional[dict] = None
-    ) -> list[dict]:
-        filtering = filtering or {}
-        filtered_markers = markers
-
-        if filtering.get("workspace_id"):
-            workspace_ids = {str(workspace_id) for workspace_id in filtering["workspace_id"]}
-            filtered_markers = [
-                marker
-                for marker in filtered_markers
-                if marker["workspace_id"] in workspace_ids
-            ]
+    def build_marker_index(cls, markers: list[dict]) -> dict:
+        """
+        Buckets markers into a grid of PUBLIC_THING_MARKERS_TILE_SIZE degree tiles, each sorted by marker ID.
+        Every marker is stored with its pre-encoded JSON fragment, so cached markers never need to be serialized
+        again.
+        """
 
-        if filtering.get("site_type"):
-            site_types = set(filtering["site_type"])
-            filtered_markers = [
-                marker
-                for marker in filtered_markers
-                if marker["site_type"] in site_types
-            ]
+        tile_size = cls.get_marker_tile_size()
+        tiles = defaultdict(list)
+
+        for marker in markers:
+            tiles[(
+                math.floor(marker["longitude"] / tile_size),
+                math.floor(marker["latitude"] / tile_size),
+            )].append((marker, cls.encode_marker(marker)))
+
+        for tile in tiles.values():
+            tile.sort(key=lambda entry: entry[0]["id"])
+
+        return {"tile_size": tile_size, "tiles": dict(tiles)}
+
+    @staticmethod
+    def get_marker_tile_size() -> float:
+        return max(float(getattr(settings, "PUBLIC_THING_MARKERS_TILE_SIZE", 1.0)), 0.01)
+
+    @staticmethod
+    def get_marker_index_tiles(
+        marker_index: dict,
+        bbox_filters: list[tuple[float, float, float, float]],
+    ) -> list[list[tuple[dict, bytes]]]:
+        tiles = marker_index["tiles"]
+
+        if not bbox_filters:
+            return list(tiles.values())
+
+        tile_size = marker_index["tile_size"]
+        tile_keys = set()
 
-        parsed_bbox_filters = cls.parse_bbox_filters(filtering.get("bbox"))
-        if parsed_bbox_filters:
-            filtered_markers = [
-                marker
-                for marker in filtered_markers
-                if any(
-                    min_lon <= marker["longitude"] <= max_lon
-                    and min_lat <= marker["latitude"] <= max_lat
-                    for min_lon, min_lat, max_lon, max_lat in parsed_bbox_filters
+        for min_lon, min_lat, max_lon, max_lat in bbox_filters:
+            min_x, max_x = math.floor(min_lon / tile_size), math.floor(max_lon / tile_size)
+            min_y, max_y = math.floor(min_lat / tile_size), math.floor(max_lat / tile_size)
+
+            if (max_x - min_x + 1) * (max_y - min_y + 1) > len(tiles):
+                tile_keys.update(
+                    (x, y) for x, y in tiles if min_x <= x <= max_x and min_y <= y <= max_y
+                )
+            else:
+                tile_keys.update(
+                    (x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1) if (x, y) in tiles
                 )
-            ]
 
-        return filtered_markers
+        return [tiles[tile_key] for tile_key in tile_keys]
 
-    def get_public_markers(self, filtering: Optional[dict] = None) -> list[dict]:
-        public_markers = get_public_thing_markers_cache()
+    def get_public_markers(self, filtering: Optional[dict] = None) -> list[tuple[dict, bytes]]:
+        """
+        Returns the public markers matching the filters as (marker, encoded marker) pairs sorted by ID. Only the
+        cached tiles intersecting the bbox filters are read.
+        """
 
-        if public_markers is None:
-            public_marker_queryset = self.get_marker_values(
-                Location.objects.filter(**self.MARKER_PUBLIC_FILTER).order_by("thing_id")
+        filtering = filtering or {}
+        marker_index = get_or_build_public_thing_markers(
+            lambda: self.build_marker_index(
+                self.serialize_marker_rows(
+                    self.get_marker_values(
+                        Location.objects.filter(**self.MARKER_PUBLIC_FILTER).order_by("thing_id")
+                    )
+                )
             )
-            public_markers = self.serialize_marker_rows(public_marker_queryset)
-            set_public_thing_markers_cache(public_markers)
+        )
 
-        return self.filter_cached_markers(public_markers, filtering=filtering)
+        workspace_ids = {str(workspace_id) for workspace_id in filtering.get("workspace_id") or []}
+        site_types = set(filtering.get("site_type") or [])
+        bbox_filters = self.parse_bbox_filters(filtering.get("bbox"))
+        public_markers = []
+
+        for marker, fragment in heapq.merge(
+            *self.get_marker_index_tiles(marker_index, bbox_filters), key=lambda entry: entry[0]["id"]
+        ):
+            if workspace_ids and marker["workspace_id"] not in workspace_ids:
+                continue
+            if site_types and marker["site_type"] not in site_types:
+                continue
+            if bbox_filters and not any(
+                min_lon <= marker["longitude"] <= max_lon and min_lat <= marker["latitude"] <= max_lat
+                for min_lon, min_lat, max_lon, max_lat in bbox_filters
+            ):
+                continue
+            if public_markers and public_markers[-1][0]["id"] == marker["id"]:
+                continue
+
+            public_markers.append((marker, fragment))
+
+        return public_markers
 
     def get_private_markers(
         self,
@@ -367,12 +498,88 @@ class ThingService(ServiceUtils):
         principal: Optional[User | APIKey],
         filtering: Optional[dict] = None,
     ):
-        public_markers = self.get_public_markers(filtering=filtering)
+        public_markers = [marker for marker, _ in self.get_public_markers(filtering=filtering)]
         private_markers = self.get_private_markers(principal=principal, filtering=filtering)
         markers = public_markers + private_markers
         markers.sort(key=lambda marker: marker["id"])
         return markers
 
+    def render_markers(
+        self,
+        principal: Optional[User | APIKey],
+        filtering: Optional[dict] = None,
+    ) -> bytes:
+        """
+        Renders the same markers as list_markers straight to a JSON array, reusing the cached fragments of public
+        markers and only encoding private markers.
+        """
+
+        public_markers = self.get_public_markers(filtering=filtering)
+        private_markers = [
+            (marker, self.encode_marker(marker))
+            for marker in self.get_private_markers(principal=principal, filtering=filtering)
+        ]
+        markers = heapq.merge(
+            public_markers,
+            sorted(private_markers, key=lambda entry: entry[0]["id"]),
+            key=lambda entry: entry[0]["id"],
+        )
+
+        return b"[" + b",".join(fragment for _, fragment in markers) + b"]"
+
+    def render_marker_tile(
+        self,
+        principal: Optional[User | APIKey],
+        z: int,
+        x: int,
+        y: int,
+        filtering: Optional[dict] = None,
+    ) -> bytes:
+        """
+        Renders the markers visible to the principal inside a Web Mercator tile as a Mapbox Vector Tile. Up to
+        THING_TILE_CLUSTER_MAX_ZOOM, nearby markers are merged into clusters. Anonymous tiles are cached until the
+        public markers are next invalidated.
+        """
+
+        if not is_valid_tile(z, x, y):
+            raise HttpError(404, "Tile does not exist")
+
+        filtering = {
+            field: filtering[field] for field in ("workspace_id", "site_type") if (filtering or {}).get(field)
+        }
+        tile_key = None
+
+        if not principal:
+            tile_key = f"{z}/{x}/{y}:" + hashlib.sha256(orjson.dumps({
+                field: sorted(str(value) for value in values) for field, values in sorted(filtering.items())
+            })).hexdigest()
+            tile = get_public_thing_tile_cache(tile_key)
+
+            if tile is not None:
+                return tile
+
+        filtering["bbox"] = [",".join(str(value) for value in get_tile_bbox(z, x, y))]
+        markers = [marker for marker, _ in self.get_public_markers(filtering=filtering)]
+        markers += self.get_private_markers(principal=principal, filtering=filtering)
+
+        features = [
+            (
+                *project_to_tile(marker["longitude"], marker["latitude"], z, x, y),
+                {to_camel(field): value for field, value in marker.items() if field not in ("latitude", "longitude")},
+            )
+            for marker in markers
+        ]
+
+        if z <= settings.THING_TILE_CLUSTER_MAX_ZOOM:
+            features = cluster_tile_features(features)
+
+        tile = encode_tile("things", features)
+
+        if tile_key:
+            set_public_thing_tile_cache(tile_key, tile)
+
+        return tile
+
     def list_site_summaries(
         self,
         principal: Optional[User | APIKey],
@@ -400,6 +607,8 @@ class ThingService(ServiceUtils):
         order_by: Optional[list[str]] = None,
         filtering: Optional[dict] = None,
         expand_related: Optional[bool] = None,
+        cursor: Optional[uuid.UUID] = None,
+        count_mode: str = "exact",
     ):
         queryset = Thing.objects
 
@@ -424,8 +633,14 @@ class ThingService(ServiceUtils):
                     queryset = self.apply_filters(queryset, field, filtering[field])
 
         queryset = self.apply_bbox_filter(queryset, filtering.get("bbox"))
+        queryset = self.apply_near_filter(queryset, filtering.get("near"))
         queryset = self.apply_tag_filter(queryset, filtering.get("tag"))
 
+        keyset = not order_by and not filtering.get("near")
+
+        if cursor is not None and not keyset:
+            raise HttpError(400, "Cursor pagination is only supported with the default ordering")
+
         if order_by:
             queryset = self.apply_ordering(
                 queryset,
@@ -441,28 +656,46 @@ class ThingService(ServiceUtils):
                     "country": "location__country",
                 },
             )
+        elif filtering.get("near"):
+            longitude, latitude, _ = self.parse_near_filter(filtering["near"])
+            queryset = queryset.order_by(
+                nearest_ordering(longitude, latitude, prefix="locations__"), "id"
+            )
         else:
             queryset = queryset.order_by("id")
 
-        if expand_related:
-            queryset = self.select_expanded_fields(queryset)
-        else:
+        if not expand_related:
             queryset = queryset.prefetch_related(
                 "thing_tags", "thing_file_attachments"
             ).with_location()
 
         queryset = queryset.visible(principal=principal).distinct()
 
-        queryset, count = self.apply_pagination(queryset, response, page, page_size)
+        queryset, count = self.apply_pagination(
+            queryset, response, page, page_size, count_mode=count_mode, cursor=cursor
+        )
 
-        return [
-            (
+        if expand_related:
+            things = [
                 ThingDetailResponse.model_validate(thing)
-                if expand_related
-                else ThingSummaryResponse.model_validate(thing)
+                for thing in self.list_expanded_rows(queryset)
+            ]
+        else:
+            things = list(queryset)
+            get_file_attachment_links(
+                ThingFileAttachment._meta.get_field("file_attachment").storage,
+                [
+                    file_attachment.file_attachment.name
+                    for thing in things
+                    for file_attachment in thing.thing_file_attachments.all()
+                ],
             )
-            for thing in queryset.all()
-        ]
+            things = [ThingSummaryResponse.model_validate(thing) for thing in things]
+
+        if keyset:
+            self.set_next_cursor(response, things, page_size)
+
+        return things
 
     def get(
         self,
@@ -641,7 +874,13 @@ class ThingService(ServiceUtils):
         if filtering.get("file_attachment_type"):
             queryset = self.apply_filters(queryset, "file_attachment_type", filtering["file_attachment_type"])
 
-        return queryset.all()
+        file_attachments = list(queryset.all())
+        get_file_attachment_links(
+            ThingFileAttachment._meta.get_field("file_attachment").storage,
+            [file_attachment.file_attachment.name for file_attachment in file_attachments],
+        )
+
+        return file_attachments
 
     def add_file_attachment(
         self, principal: User | APIKey, uid: uuid.UUID, file, data: FileAttachmentPostBody
@@ -650,6 +889,8 @@ class ThingService(ServiceUtils):
             principal=principal, uid=uid, action="edit"
         )
 
+        validate_file_attachment_size(file)
+
         if ThingFileAttachment.objects.filter(
             thing=thing, name=file.name
         ).exists():
@@ -666,6 +907,8 @@ class ThingService(ServiceUtils):
     def replace_file_attachment(
         self, principal: User | APIKey, uid: uuid.UUID, file, data: FileAttachmentPostBody
     ):
+        validate_file_attachment_size(file)
+
         self.remove_file_attachment(
             principal=principal, uid=uid, data=FileAttachmentDeleteBody(name=file.name)
         )
@@ -1,8 +1,23 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from domains.iam.models import Workspace
-from domains.sta.cache import invalidate_public_thing_markers_cache
-from domains.sta.models import Location, Thing
+from domains.sta.cache import (
+    invalidate_public_thing_markers_cache,
+    invalidate_sensorthings_response_cache,
+)
+from domains.sta.models import (
+    Location,
+    Thing,
+    ThingTag,
+    ThingFileAttachment,
+    Sensor,
+    ObservedProperty,
+    Unit,
+    ProcessingLevel,
+    Datastream,
+    DatastreamTag,
+    DatastreamFileAttachment,
+)
 
 
 @receiver(post_save, sender=Thing)
@@ -10,3 +25,27 @@ from domains.sta.models import Location, Thing
 @receiver(post_save, sender=Workspace)
 def invalidate_public_thing_markers(*args, **kwargs) -> None:
     invalidate_public_thing_markers_cache()
+
+
+@receiver([post_save, post_delete], sender=Thing)
+@receiver([post_save, post_delete], sender=Location)
+@receiver([post_save, post_delete], sender=Workspace)
+@receiver([post_save, post_delete], sender=ThingTag)
+@receiver([post_save, post_delete], sender=ThingFileAttachment)
+@receiver([post_save, post_delete], sender=Sensor)
+@receiver([post_save, post_delete], sender=ObservedProperty)
+@receiver([post_save, post_delete], sender=Unit)
+@receiver([post_save, post_delete], sender=ProcessingLevel)
+def invalidate_sensorthings_responses(*args, **kwargs) -> None:
+    invalidate_sensorthings_response_cache()
+
+
+@receiver([post_save, post_delete], sender=Datastream)
+def invalidate_datastream_sensorthings_responses(instance, **kwargs) -> None:
+    invalidate_sensorthings_response_cache(datastream_ids=[instance.pk])
+
+
+@receiver([post_save, post_delete], sender=DatastreamTag)
+@receiver([post_save, post_delete], sender=DatastreamFileAttachment)
+def invalidate_datastream_detail_sensorthings_responses(instance, **kwargs) -> None:
+    invalidate_sensorthings_response_cache(datastream_ids=[instance.datastream_id])
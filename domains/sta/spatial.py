@@ -0,0 +1,129 @@
+import math
+from django.db import models
+from django.db.models import Func, Value, Q
+from django.db.models.functions import Cast, ASin, Sqrt, Power, Sin, Cos, Radians
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class LocationPoint(Func):
+    """
+    A location's coordinates as a native PostgreSQL point (longitude, latitude). This is the expression covered by
+    the location GiST index, so lookups must build it the same way for the planner to use the index.
+    """
+
+    function = "point"
+
+    def __init__(self, prefix: str = "", **extra):
+        super().__init__(
+            Cast(f"{prefix}longitude", models.FloatField()),
+            Cast(f"{prefix}latitude", models.FloatField()),
+            output_field=models.Field(),
+            **extra,
+        )
+
+
+class PointValue(Func):
+    function = "point"
+
+    def __init__(self, longitude: float, latitude: float, **extra):
+        super().__init__(
+            Value(float(longitude), output_field=models.FloatField()),
+            Value(float(latitude), output_field=models.FloatField()),
+            output_field=models.Field(),
+            **extra,
+        )
+
+
+class BoxValue(Func):
+    function = "box"
+
+    def __init__(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float, **extra):
+        super().__init__(
+            PointValue(min_lon, min_lat), PointValue(max_lon, max_lat), output_field=models.Field(), **extra
+        )
+
+
+class ContainedIn(Func):
+    template = "%(expressions)s"
+    arg_joiner = " <@ "
+    output_field = models.BooleanField()
+
+
+class PointDistance(Func):
+    template = "%(expressions)s"
+    arg_joiner = " <-> "
+    output_field = models.FloatField()
+
+
+def bbox_filter(bbox_filters: list[tuple[float, float, float, float]], prefix: str = "") -> Q:
+    """
+    Matches locations inside any of the (min_lon, min_lat, max_lon, max_lat) boxes with point containment, which
+    the location GiST index answers directly instead of range-scanning both coordinate columns.
+    """
+
+    location_filter = Q()
+
+    for min_lon, min_lat, max_lon, max_lat in bbox_filters:
+        location_filter |= Q(ContainedIn(LocationPoint(prefix), BoxValue(min_lon, min_lat, max_lon, max_lat)))
+
+    return location_filter
+
+
+def get_radius_bboxes(longitude: float, latitude: float, radius_km: float) -> list[tuple[float, float, float, float]]:
+    """
+    Returns the boxes enclosing a circle on the earth's surface, split in two where the circle crosses the
+    antimeridian. Used to narrow radius lookups to an index scan before the exact distance check.
+    """
+
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+
+    if min_lat <= -90 or max_lat >= 90:
+        return [(-180.0, min_lat, 180.0, max_lat)]
+
+    lon_delta = math.degrees(
+        math.asin(min(math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(latitude)), 1.0))
+    )
+    min_lon, max_lon = longitude - lon_delta, longitude + lon_delta
+
+    if max_lon - min_lon >= 360:
+        return [(-180.0, min_lat, 180.0, max_lat)]
+    if min_lon < -180:
+        return [(min_lon + 360, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon, max_lat)]
+    if max_lon > 180:
+        return [(min_lon, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon - 360, max_lat)]
+
+    return [(min_lon, min_lat, max_lon, max_lat)]
+
+
+def great_circle_distance(longitude: float, latitude: float, prefix: str = "") -> Func:
+    """
+    The haversine distance in kilometers between each location and the given coordinates.
+    """
+
+    location_latitude = Radians(Cast(f"{prefix}latitude", models.FloatField()))
+    location_longitude = Radians(Cast(f"{prefix}longitude", models.FloatField()))
+    latitude = math.radians(latitude)
+    longitude = math.radians(longitude)
+
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(
+        Power(Sin((location_latitude - latitude) / 2), 2)
+        + math.cos(latitude) * Cos(location_latitude) * Power(Sin((location_longitude - longitude) / 2), 2)
+    ))
+
+
+def radius_filter(longitude: float, latitude: float, radius_km: float, prefix: str = "") -> Q:
+    return bbox_filter(get_radius_bboxes(longitude, latitude, radius_km), prefix) & Q(
+        models.lookups.LessThanOrEqual(great_circle_distance(longitude, latitude, prefix), radius_km)
+    )
+
+
+def nearest_ordering(longitude: float, latitude: float, prefix: str = "") -> PointDistance:
+    """
+    Orders locations by planar distance to the given coordinates with the point distance operator, which the GiST
+    index serves as a nearest-neighbour scan.
+    """
+
+    return PointDistance(LocationPoint(prefix), PointValue(longitude, latitude))
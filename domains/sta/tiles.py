@@ -0,0 +1,142 @@
+import math
+import struct
+from collections import defaultdict
+
+
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+TILE_MAX_ZOOM = 22
+CLUSTER_CELL_SIZE = 256
+MAX_LATITUDE = 85.0511287798066
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= TILE_MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+def get_tile_bbox(z: int, x: int, y: int, buffer: int = TILE_BUFFER) -> tuple[float, float, float, float]:
+    """
+    Returns the min_lon, min_lat, max_lon, max_lat bounds of a Web Mercator tile, grown by buffer tile units on
+    each side so markers drawn across a tile edge appear in both tiles.
+    """
+
+    tile_count = 2 ** z
+    margin = buffer / TILE_EXTENT
+
+    def to_lon(tile_x):
+        return max(min(tile_x / tile_count * 360 - 180, 180), -180)
+
+    def to_lat(tile_y):
+        tile_y = max(min(tile_y, tile_count), 0)
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / tile_count))))
+
+    return to_lon(x - margin), to_lat(y + 1 + margin), to_lon(x + 1 + margin), to_lat(y - margin)
+
+
+def project_to_tile(longitude: float, latitude: float, z: int, x: int, y: int) -> tuple[int, int]:
+    tile_count = 2 ** z
+    latitude = math.radians(max(min(latitude, MAX_LATITUDE), -MAX_LATITUDE))
+    world_x = (longitude + 180) / 360 * tile_count
+    world_y = (1 - math.log(math.tan(latitude) + 1 / math.cos(latitude)) / math.pi) / 2 * tile_count
+
+    return round((world_x - x) * TILE_EXTENT), round((world_y - y) * TILE_EXTENT)
+
+
+def cluster_tile_features(features: list[tuple[int, int, dict]]) -> list[tuple[int, int, dict]]:
+    """
+    Merges features inside the tile that share a CLUSTER_CELL_SIZE grid cell into one cluster feature at their
+    mean position. Buffer features outside the tile are dropped, since the neighbouring tile clusters them.
+    """
+
+    cells = defaultdict(list)
+
+    for tile_x, tile_y, properties in features:
+        if 0 <= tile_x < TILE_EXTENT and 0 <= tile_y < TILE_EXTENT:
+            cells[(tile_x // CLUSTER_CELL_SIZE, tile_y // CLUSTER_CELL_SIZE)].append((tile_x, tile_y, properties))
+
+    clustered_features = []
+
+    for cell_features in cells.values():
+        if len(cell_features) == 1:
+            clustered_features.append(cell_features[0])
+            continue
+
+        clustered_features.append((
+            round(sum(feature[0] for feature in cell_features) / len(cell_features)),
+            round(sum(feature[1] for feature in cell_features) / len(cell_features)),
+            {"cluster": True, "pointCount": len(cell_features)},
+        ))
+
+    return clustered_features
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def _encode_zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _encode_field(field_number: int, payload: bytes) -> bytes:
+    return _encode_varint(field_number << 3 | 2) + _encode_varint(len(payload)) + payload
+
+
+def _encode_value(value) -> bytes:
+    if isinstance(value, bool):
+        return _encode_varint(7 << 3) + _encode_varint(int(value))
+    if isinstance(value, int):
+        return _encode_varint(6 << 3) + _encode_varint(_encode_zigzag(value))
+    if isinstance(value, float):
+        return _encode_varint(3 << 3 | 1) + struct.pack("<d", value)
+
+    return _encode_field(1, str(value).encode())
+
+
+def encode_tile(layer_name: str, features: list[tuple[int, int, dict]]) -> bytes:
+    """
+    Encodes point features, given as (tile_x, tile_y, properties) in tile units, as a single layer Mapbox Vector
+    Tile (version 2 of the specification).
+    """
+
+    keys, values = {}, {}
+    encoded_features = []
+
+    for tile_x, tile_y, properties in features:
+        tags = []
+
+        for key, value in properties.items():
+            if value is None:
+                continue
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault((type(value), value), len(values)))
+
+        encoded_features.append(_encode_field(2, b"".join([
+            _encode_field(2, b"".join(_encode_varint(tag) for tag in tags)),
+            _encode_varint(3 << 3) + _encode_varint(1),
+            _encode_field(4, b"".join([
+                _encode_varint(1 | 1 << 3),
+                _encode_varint(_encode_zigzag(tile_x)),
+                _encode_varint(_encode_zigzag(tile_y)),
+            ])),
+        ])))
+
+    layer = b"".join([
+        _encode_varint(15 << 3) + _encode_varint(2),
+        _encode_field(1, layer_name.encode()),
+        *encoded_features,
+        *(_encode_field(3, key.encode()) for key in keys),
+        *(_encode_field(4, _encode_value(value)) for _, value in values),
+        _encode_varint(5 << 3) + _encode_varint(TILE_EXTENT),
+    ])
+
+    return _encode_field(3, layer)
@@ -0,0 +1,28 @@
+from ninja.errors import HttpError
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler, StopUpload
+
+
+class FileAttachmentUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams uploaded files to a temporary file chunk by chunk instead of holding them in worker memory. Once an upload
+    passes FILE_ATTACHMENT_MAX_SIZE the rest of the request body is not read, and the request is flagged so the API
+    can answer with a 413.
+    """
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > settings.FILE_ATTACHMENT_MAX_SIZE:
+            if self.request is not None:
+                self.request.file_attachment_too_large = True
+            raise StopUpload(connection_reset=True)
+
+        self.file.write(raw_data)
+
+
+def get_file_attachment_size_error() -> str:
+    return f"File attachment exceeds the maximum size of {settings.FILE_ATTACHMENT_MAX_SIZE} bytes"
+
+
+def validate_file_attachment_size(file):
+    if file.size > settings.FILE_ATTACHMENT_MAX_SIZE:
+        raise HttpError(413, get_file_attachment_size_error())
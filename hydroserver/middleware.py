@@ -10,3 +10,18 @@ class CloudHealthCheckMiddleware:
             return HttpResponse("OK", status=200)
 
         return self.get_response(request)
+
+
+class SensorThingsCountModeMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        count_mode = getattr(request, "count_mode", None)
+
+        if count_mode:
+            response["X-Count-Mode"] = count_mode
+
+        return response
@@ -69,6 +69,8 @@ if DEPLOYMENT_BACKEND == "dev":
 CORS_EXPOSE_HEADERS = [
     "X-Total-Pages",
     "X-Total-Count",
+    "X-Count-Mode",
+    "X-Next-Cursor",
 ]
 
 # Celery
@@ -76,10 +78,78 @@ CORS_EXPOSE_HEADERS = [
 CELERY_ENABLED = config("CELERY_ENABLED", default=True, cast=bool)
 CELERY_BROKER_URL = config("CELERY_BROKER_URL", default="redis://127.0.0.1:6379/0")
 CELERY_RESULT_BACKEND = "django-db"
-CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+CELERY_BEAT_SCHEDULER = "domains.etl.scheduler:ETLDatabaseScheduler"
+
+# Compute Aggregation task results in PostgreSQL with INSERT ... SELECT. Set to False to aggregate source
+# observations in Python with hydroserverpy instead, reading ETL_AGGREGATION_CHUNK_DAYS of source data at a time.
+
+ETL_SQL_AGGREGATION = config("ETL_SQL_AGGREGATION", default=True, cast=bool)
+ETL_AGGREGATION_CHUNK_DAYS = config("ETL_AGGREGATION_CHUNK_DAYS", default=30, cast=int)
+
+# ETL tasks with at least this many target datastreams extract and transform their source once, then load the
+# transformed observations with parallel Celery subtasks of ETL_PARALLEL_LOAD_GROUP_SIZE targets each. Set to 0 to
+# run every task in a single worker.
+
+ETL_PARALLEL_LOAD_MIN_TARGETS = config("ETL_PARALLEL_LOAD_MIN_TARGETS", default=0, cast=int)
+ETL_PARALLEL_LOAD_GROUP_SIZE = config("ETL_PARALLEL_LOAD_GROUP_SIZE", default=20, cast=int)
+
+# Maximum number of parallel ETL subtasks one workspace may run at once. Subtasks that can't get a slot are
+# retried after ETL_WORKSPACE_LOAD_RETRY_DELAY seconds, up to ETL_WORKSPACE_LOAD_MAX_RETRIES times before their
+# targets are recorded as failed.
+
+ETL_WORKSPACE_LOAD_CONCURRENCY = config("ETL_WORKSPACE_LOAD_CONCURRENCY", default=4, cast=int)
+ETL_WORKSPACE_LOAD_RETRY_DELAY = config("ETL_WORKSPACE_LOAD_RETRY_DELAY", default=15, cast=int)
+ETL_WORKSPACE_LOAD_MAX_RETRIES = config("ETL_WORKSPACE_LOAD_MAX_RETRIES", default=40, cast=int)
+
+# Seconds an HTTP extraction payload is reused by tasks requesting the same source. Stale payloads are revalidated
+# with ETag/Last-Modified before being fetched again. Payloads are kept on the private "etl_extraction_cache" storage
+# backend, outside the served media files. Set to 0 to disable the cache.
+
+ETL_EXTRACTION_CACHE_TIMEOUT = config("ETL_EXTRACTION_CACHE_TIMEOUT", default=60, cast=int)
+
+# Run unpaused internal tasks that share a data connection and crontab schedule from one beat entry, so their
+# shared source is extracted once per run. Each task still records its own TaskRun. Disabled by default; run the
+# update_coalesced_etl_schedules management command after changing this to rebuild existing schedules.
+
+ETL_COALESCE_SCHEDULES = config("ETL_COALESCE_SCHEDULES", default=False, cast=bool)
+
+# Seconds a queued ETL run may wait for a worker before it expires and is recorded as an EXPIRED task run.
+
+ETL_TASK_EXPIRE_SECONDS = config("ETL_TASK_EXPIRE_SECONDS", default=3600, cast=int)
+
+# Scheduled ETL runs can be delayed by a stable per-entry offset of up to ETL_SCHEDULE_JITTER seconds so runs sharing
+# a crontab minute don't all start at once. Jitter is off by default (0), so runs start at their scheduled time.
+# While more than ETL_SCHEDULE_MAX_QUEUE_DEPTH messages are waiting in the broker queue, scheduled runs are recorded
+# as MISSED instead of being dispatched (0 disables the check).
+
+ETL_SCHEDULE_JITTER = config("ETL_SCHEDULE_JITTER", default=0, cast=int)
+ETL_SCHEDULE_MAX_QUEUE_DEPTH = config("ETL_SCHEDULE_MAX_QUEUE_DEPTH", default=0, cast=int)
+
+# Split ETL beat entries across ETL_BEAT_SHARD_COUNT beat processes by orchestration system. Each beat process sets
+# its own ETL_BEAT_SHARD_INDEX, and shard 0 also runs all non-ETL entries.
+
+ETL_BEAT_SHARD_COUNT = config("ETL_BEAT_SHARD_COUNT", default=1, cast=int)
+ETL_BEAT_SHARD_INDEX = config("ETL_BEAT_SHARD_INDEX", default=0, cast=int)
+
+# Limits on ETL runs per source, enforced across workers in Redis. A source is the extractor's host when
+# ETL_SOURCE_LIMIT_SCOPE is "host" (falling back to the data connection if it has no host), or the data connection
+# when it is "data_connection". ETL_SOURCE_CONCURRENCY caps concurrent runs per source and ETL_SOURCE_RATE_LIMIT caps
+# run starts per minute per source (0 disables either). Runs over a limit are deferred, not failed, and retried after
+# the token bucket refills or ETL_SOURCE_RETRY_DELAY seconds.
+
+ETL_SOURCE_LIMIT_SCOPE = config("ETL_SOURCE_LIMIT_SCOPE", default="host")
+ETL_SOURCE_CONCURRENCY = config("ETL_SOURCE_CONCURRENCY", default=0, cast=int)
+ETL_SOURCE_RATE_LIMIT = config("ETL_SOURCE_RATE_LIMIT", default=0, cast=int)
+ETL_SOURCE_RETRY_DELAY = config("ETL_SOURCE_RETRY_DELAY", default=30, cast=int)
+ETL_SOURCE_LIMIT_REDIS_URL = config("ETL_SOURCE_LIMIT_REDIS_URL", default=CELERY_BROKER_URL)
 
 DATA_CONNECTION_NOTIFICATION_CRONTAB = config("DATA_CONNECTION_NOTIFICATION_CRONTAB", default="0 0 * * *").split()
 
+# Orchestration notification emails are rendered for this many data connections at a time, and each page of emails
+# is sent by its own retryable Celery task over a single SMTP connection.
+
+DATA_CONNECTION_NOTIFICATION_BATCH_SIZE = config("DATA_CONNECTION_NOTIFICATION_BATCH_SIZE", default=100, cast=int)
+
 CELERY_BEAT_SCHEDULE = {
     "cleanup_task_runs": {
         "task": "domains.etl.tasks.cleanup_etl_task_runs",
@@ -149,6 +219,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "easyaudit.middleware.easyaudit.EasyAuditMiddleware",
+    "hydroserver.middleware.SensorThingsCountModeMiddleware",
     "sensorthings.middleware.SensorThingsMiddleware",
 ]
 
@@ -300,17 +371,53 @@ AUTH_PASSWORD_VALIDATORS = [
 
 # Caching settings
 
-if DEBUG:
+# Set CACHE_URL to a Redis URL (e.g. redis://127.0.0.1:6379/1) to share one cache between all API processes. Without
+# it, every process keeps its own local memory cache and rebuilds cached data such as thing markers independently.
+# Raise CACHE_VERSION to invalidate every cached entry at once, e.g. after a deploy that changes cached payloads.
+
+CACHE_URL = config("CACHE_URL", default=None)
+CACHE_VERSION = config("CACHE_VERSION", default=1, cast=int)
+
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": "hydroserver",
+            "VERSION": CACHE_VERSION,
+        }
+    }
+elif DEBUG:
     CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "hydroserver-dev-cache",
+            "VERSION": CACHE_VERSION,
         }
     }
 
+# Seconds public thing markers stay cached. After an invalidation, one process rebuilds the markers while the
+# others wait up to PUBLIC_THING_MARKERS_LOCK_TIMEOUT seconds for its result.
+
 PUBLIC_THING_MARKERS_CACHE_TIMEOUT = config(
     "PUBLIC_THING_MARKERS_CACHE_TIMEOUT", default=300, cast=int
 )
+PUBLIC_THING_MARKERS_LOCK_TIMEOUT = config(
+    "PUBLIC_THING_MARKERS_LOCK_TIMEOUT", default=30, cast=int
+)
+
+# Size in degrees of the grid tiles cached public thing markers are bucketed into. Bounding box requests only read
+# the tiles they intersect.
+
+PUBLIC_THING_MARKERS_TILE_SIZE = config(
+    "PUBLIC_THING_MARKERS_TILE_SIZE", default=1.0, cast=float
+)
+
+# Thing vector tiles merge nearby markers into clusters up to this zoom level.
+
+THING_TILE_CLUSTER_MAX_ZOOM = config(
+    "THING_TILE_CLUSTER_MAX_ZOOM", default=10, cast=int
+)
 
 # Storage settings
 
@@ -340,6 +447,14 @@ if DEPLOYMENT_BACKEND == "aws":
                 "default_acl": None,
             },
         },
+        "etl_extraction_cache": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "bucket_name": config("MEDIA_BUCKET_NAME", default=None),
+                "location": "etl-extraction-cache",
+                "default_acl": "private",
+            },
+        },
     }
 elif DEPLOYMENT_BACKEND == "gcp":
     GS_PROJECT_ID = config("GS_PROJECT_ID", default=None)
@@ -361,6 +476,14 @@ elif DEPLOYMENT_BACKEND == "gcp":
                 "default_acl": "publicRead",
             },
         },
+        "etl_extraction_cache": {
+            "BACKEND": "storages.backends.gcloud.GoogleCloudStorage",
+            "OPTIONS": {
+                "bucket_name": config("MEDIA_BUCKET_NAME", default=None),
+                "location": "etl-extraction-cache",
+                "default_acl": "private",
+            },
+        },
     }
 else:
     STORAGES = {
@@ -372,8 +495,35 @@ else:
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
             "OPTIONS": {"location": str(BASE_DIR / "static")},
         },
+        "etl_extraction_cache": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(BASE_DIR / "etl-extraction-cache")},
+        },
     }
 
+# Seconds signed file attachment links stay valid. Signed links are shared between processes through the cache and
+# reused until shortly before they expire.
+
+FILE_ATTACHMENT_LINK_EXPIRE = config("FILE_ATTACHMENT_LINK_EXPIRE", default=3600, cast=int)
+
+# Largest file attachment upload accepted, in bytes. Uploads above FILE_UPLOAD_MAX_MEMORY_SIZE are streamed to a
+# temporary file in chunks rather than buffered in memory, and stop being read as soon as they pass this limit.
+
+FILE_ATTACHMENT_MAX_SIZE = config("FILE_ATTACHMENT_MAX_SIZE", default=50 * 1024 * 1024, cast=int)
+
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "domains.sta.uploads.FileAttachmentUploadHandler",
+]
+
+# How filesystem media files are sent in local/dev deployments. "django" streams them from the worker,
+# "x-accel-redirect" (nginx) and "x-sendfile" (Apache, Caddy) return headers only and let the web server send the
+# file. With x-accel-redirect, MEDIA_ACCEL_REDIRECT_LOCATION is the internal nginx location aliased to the media
+# directory. Cloud backends serve media from signed storage links and never pass through Django.
+
+MEDIA_SERVE_MODE = config("MEDIA_SERVE_MODE", default="django")
+MEDIA_ACCEL_REDIRECT_LOCATION = config("MEDIA_ACCEL_REDIRECT_LOCATION", default="/protected-media/")
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
@@ -395,3 +545,23 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ST_API_PREFIX = "api/sensorthings"
 ST_API_ID_QUALIFIER = "'"
 ST_API_ID_TYPE = UUID
+
+# Controls how @iot.count is computed for SensorThings Observation collections. "exact" runs a full
+# COUNT query; "estimated" uses cached datastream value counts or PostgreSQL planner row estimates.
+
+ST_API_COUNT_MODE = config("ST_API_COUNT_MODE", default="exact")
+
+# Observation filters that don't constrain an indexed property are rejected once the table is estimated
+# to hold more than this many rows.
+
+ST_API_UNINDEXED_FILTER_MAX_ROWS = config(
+    "ST_API_UNINDEXED_FILTER_MAX_ROWS", default=10_000_000, cast=int
+)
+
+# Seconds anonymous SensorThings GET responses are cached for. Set to 0 to disable the response cache. Invalidation
+# only reaches other processes through a shared cache, so the response cache is off by default unless CACHE_URL is
+# set.
+
+ST_API_RESPONSE_CACHE_TIMEOUT = config(
+    "ST_API_RESPONSE_CACHE_TIMEOUT", default=60 if CACHE_URL else 0, cast=int
+)
@@ -3,7 +3,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, re_path, include
 from django.views.static import serve
-from interfaces.web.views import index
+from interfaces.web.views import index, media
 
 
 urlpatterns = [
@@ -21,20 +21,22 @@ urlpatterns += static(
     settings.STATIC_URL,
     document_root=settings.STORAGES["staticfiles"]["OPTIONS"]["location"],
 )
-urlpatterns += static(
-    settings.MEDIA_URL,
-    document_root=settings.STORAGES["default"]["OPTIONS"]["location"],
-)
 
 # In local/dev environments we want file attachments to remain accessible from the
-# Django process even when DEBUG is false.
+# Django process even when DEBUG is false. The media view can hand the transfer off
+# to the web server with X-Accel-Redirect or X-Sendfile (see MEDIA_SERVE_MODE).
+if settings.DEPLOYMENT_BACKEND in {"dev", "local"}:
+    urlpatterns += [
+        re_path(r"^media/(?P<path>.*)$", media),
+    ]
+else:
+    urlpatterns += static(
+        settings.MEDIA_URL,
+        document_root=settings.STORAGES["default"]["OPTIONS"]["location"],
+    )
+
 if settings.DEPLOYMENT_BACKEND in {"dev", "local"} and not settings.DEBUG:
     urlpatterns += [
-        re_path(
-            r"^media/(?P<path>.*)$",
-            serve,
-            {"document_root": settings.STORAGES["default"]["OPTIONS"]["location"]},
-        ),
         re_path(
             r"^static/(?P<path>.*)$",
             serve,
@@ -1,11 +1,12 @@
-from datetime import timedelta
 from django.core.management.base import BaseCommand
-from django.utils import timezone
-from domains.etl.models import Task, TaskRun
+from domains.etl.retention import delete_expired_task_runs
 
 
 class Command(BaseCommand):
-    help = "Removes old TaskRun records, keeping the most recent per Task."
+    help = (
+        "Removes old TaskRun records, keeping the most recent per Task. Workspaces with a task run retention "
+        "policy keep runs for the policy's number of days instead."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -14,30 +15,32 @@ class Command(BaseCommand):
             default=14,
             help="Number of days to keep TaskRun records. Older runs will be deleted. Default is 14.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Maximum number of TaskRun records deleted per transaction. Default is 5000.",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches. By default, runs until no expired records remain.",
+        )
 
     def handle(self, *args, **options):
         days = options["days"]
-        now = timezone.now()
-        cutoff = now - timedelta(days=days)
 
-        total_deleted = 0
-
-        tasks = Task.objects.filter(
-            taskrun__started_at__lt=cutoff
-        ).distinct()
-
-        for task in tasks:
-            most_recent_run = TaskRun.objects.filter(task=task).order_by("-started_at").first()
-
-            deleted, _ = TaskRun.objects.filter(
-                task=task,
-                started_at__lt=cutoff
-            ).exclude(pk=most_recent_run.pk).delete()
-
-            total_deleted += deleted
+        report = delete_expired_task_runs(
+            default_days=days,
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+        )
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Cleanup complete. Deleted {total_deleted} old TaskRun records older than {days} days."
+                f"Cleanup complete. Deleted {report['deleted']} old TaskRun records older than {days} days "
+                f"in {report['batches']} batch(es) and {report['seconds']} seconds "
+                f"({report['runs_per_second']} records/second)."
             )
         )
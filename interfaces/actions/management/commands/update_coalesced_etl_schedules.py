@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from domains.etl.models import DataConnection
+from domains.etl.services import TaskService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the coalesced beat entries of every data connection's scheduled tasks. Run after deploying or "
+        "changing ETL_COALESCE_SCHEDULES, since schedules are otherwise only updated when a task is saved."
+    )
+
+    def handle(self, *args, **options):
+        data_connection_ids = list(DataConnection.objects.values_list("id", flat=True))
+
+        for data_connection_id in data_connection_ids:
+            with transaction.atomic():
+                TaskService.update_coalesced_scheduling(data_connection_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated coalesced ETL schedules for {len(data_connection_ids)} data connection(s)."
+            )
+        )
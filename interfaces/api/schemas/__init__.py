@@ -1,5 +1,5 @@
 from .base import (BaseGetResponse, BasePostBody, BasePatchBody, BaseQueryParameters, CollectionQueryParameters,
-                   VocabularyQueryParameters)
+                   KeysetQueryParameters, VocabularyQueryParameters)
 from .workspace import (
     WorkspaceSummaryResponse,
     WorkspaceDetailResponse,
@@ -29,6 +29,7 @@ from .role import RoleDetailResponse, RoleSummaryResponse, RoleQueryParameters
 from .thing import (
     ThingMarkerResponse,
     ThingMarkerQueryParameters,
+    ThingTileQueryParameters,
     ThingSiteSummaryResponse,
     ThingSiteSummaryQueryParameters,
     ThingSummaryResponse,
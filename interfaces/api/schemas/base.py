@@ -1,5 +1,6 @@
 from ninja import Schema, Query
-from typing import Optional, Any
+import uuid
+from typing import Optional, Any, Literal
 from pydantic import AliasGenerator, AliasChoices, ConfigDict, field_validator
 from pydantic.alias_generators import to_camel
 from sensorthings.validators import PartialSchema
@@ -32,6 +33,18 @@ class CollectionQueryParameters(BaseQueryParameters):
     )
 
 
+class KeysetQueryParameters(CollectionQueryParameters):
+    cursor: Optional[uuid.UUID] = Query(
+        None,
+        description="Return the page after this ID, taken from the X-Next-Cursor header of the previous page. "
+                    "Only supported with the default ordering.",
+    )
+    count_mode: Literal["exact", "estimated", "none"] = Query(
+        "exact",
+        description="How X-Total-Count is computed: an exact count, a query planner estimate, or not at all.",
+    )
+
+
 class VocabularyQueryParameters(CollectionQueryParameters):
     order_desc: Optional[bool] = Query(
         False,
@@ -8,7 +8,7 @@ from interfaces.api.schemas import (
     BasePostBody,
     BasePatchBody,
     BaseQueryParameters,
-    CollectionQueryParameters,
+    KeysetQueryParameters,
 )
 from .attachment import TagGetResponse, FileAttachmentGetResponse
 
@@ -74,7 +74,7 @@ DatastreamOrderByFields = Literal[
 ]
 
 
-class DatastreamQueryParameters(CollectionQueryParameters):
+class DatastreamQueryParameters(KeysetQueryParameters):
     expand_related: Optional[bool] = None
     order_by: Optional[list[DatastreamOrderByFields]] = Query(
         [], description="Select one or more fields to order the response by."
@@ -41,7 +41,7 @@ class TaskRunQueryParameters(CollectionQueryParameters):
 
 
 class TaskRunFields(Schema):
-    status: Literal["RUNNING", "SUCCESS", "FAILURE"]
+    status: Literal["RUNNING", "SUCCESS", "FAILURE", "MISSED", "EXPIRED"]
     result: dict | None = None
     started_at: datetime
     finished_at: datetime | None = None
@@ -8,7 +8,7 @@ from interfaces.api.schemas import (
     BasePostBody,
     BasePatchBody,
     BaseQueryParameters,
-    CollectionQueryParameters,
+    KeysetQueryParameters,
 )
 from .attachment import TagGetResponse, FileAttachmentGetResponse
 
@@ -102,7 +102,7 @@ _order_by_fields = (
 ThingOrderByFields = Literal[*_order_by_fields, *[f"-{f}" for f in _order_by_fields]]
 
 
-class ThingQueryParameters(CollectionQueryParameters):
+class ThingQueryParameters(KeysetQueryParameters):
     expand_related: Optional[bool] = None
     order_by: Optional[list[ThingOrderByFields]] = Query(
         [], description="Select one or more fields to order the response by."
@@ -114,6 +114,10 @@ class ThingQueryParameters(CollectionQueryParameters):
         [],
         description="Filter things by bounding box. Format bounding box as {min_lon},{min_lat},{max_lon},{max_lat}",
     )
+    near: Optional[str] = Query(
+        None,
+        description="Filter things within a radius of a point, nearest first unless ordered otherwise. Format as {lon},{lat},{radius_km}",
+    )
     locations__admin_area_1: list[str] = Query(
         [], description="Filter things by admin area 1.", alias="adminArea1"
     )
@@ -147,6 +151,13 @@ class ThingMarkerQueryParameters(BaseQueryParameters):
     site_type: list[str] = Query([], description="Filter markers by site type.")
 
 
+class ThingTileQueryParameters(BaseQueryParameters):
+    workspace_id: list[uuid.UUID] = Query(
+        [], description="Filter tile markers by workspace ID."
+    )
+    site_type: list[str] = Query([], description="Filter tile markers by site type.")
+
+
 class ThingMarkerResponse(BaseGetResponse):
     id: uuid.UUID
     workspace_id: uuid.UUID
@@ -1,10 +1,13 @@
 import uuid
+import json
 from typing import Union, Any, Optional, Type
+from ninja import Schema
 from ninja.errors import HttpError
 from pydantic.alias_generators import to_snake
 from django.http import HttpResponse
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet, Model, Q
+from django.db.models import QuerySet, Model, Q, F
+from django.db.models.functions import JSONObject
 from domains.iam.models import Workspace, APIKey
 
 User = get_user_model()
@@ -96,12 +99,43 @@ class ServiceUtils:
         return queryset.order_by(*order_by_fields)
 
     @staticmethod
+    def build_json_object(schema: Type[Schema], prefix: str = "", **expressions) -> JSONObject:
+        """
+        Builds a JSON object in SQL with one key per schema field, read from the column of the same name under
+        prefix. Fields that aren't columns, like nested objects and related lists, are given as expressions.
+        """
+
+        return JSONObject(**{
+            field: expressions.get(field, F(f"{prefix}{field}")) for field in schema.model_fields
+        })
+
+    @staticmethod
+    def count_queryset(queryset: QuerySet, count_mode: str = "exact") -> Optional[int]:
+        if count_mode == "none":
+            return None
+
+        if count_mode == "estimated":
+            plan = json.loads(queryset.order_by().explain(format="json"))
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+        return queryset.count()
+
+    @classmethod
     def apply_pagination(
+        cls,
         queryset: QuerySet,
         response: Optional[HttpResponse] = None,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        count_mode: str = "exact",
+        cursor: Optional[uuid.UUID] = None,
     ):
+        """
+        Slices the queryset to one page. Pages are addressed by page number, or with a cursor by the id the previous
+        page ended on, which requires the queryset to be ordered by id. The total count is exact, estimated from the
+        query plan, or skipped entirely with count_mode "none".
+        """
+
         page = page or 1
         page_size = page_size if page_size is not None else 100
 
@@ -111,20 +145,43 @@ class ServiceUtils:
             raise ValueError("Page size must be >= 0.")
         if page_size > 100000:
             raise ValueError("Page size must be <= 100000.")
+        if cursor is not None and page > 1:
+            raise HttpError(400, "Page and cursor cannot be combined")
+
+        count = cls.count_queryset(queryset, count_mode)
 
-        count = queryset.count()
-        offset = (page - 1) * page_size
+        if cursor is not None:
+            queryset = queryset.filter(id__gt=cursor)
+            offset = 0
+        else:
+            offset = (page - 1) * page_size
 
         if response:
-            response["X-Total-Count"] = str(count)
             response["X-Page-Size"] = str(page_size)
 
-            if page_size > 0:
+            if count is not None:
+                response["X-Total-Count"] = str(count)
+                response["X-Count-Mode"] = count_mode
+
+            if page_size > 0 and cursor is None:
                 response["X-Page"] = str(page)
-                response["X-Total-Pages"] = str((count + page_size - 1) // page_size)
+
+                if count is not None:
+                    response["X-Total-Pages"] = str((count + page_size - 1) // page_size)
 
         return queryset[offset : offset + page_size], count
 
+    @staticmethod
+    def set_next_cursor(response: Optional[HttpResponse], items: list, page_size: Optional[int] = None):
+        """
+        Points the client at the next keyset page when this page came back full.
+        """
+
+        page_size = page_size if page_size is not None else 100
+
+        if response and items and len(items) == page_size:
+            response["X-Next-Cursor"] = str(items[-1].id)
+
 
 class VocabularyService(ServiceUtils):
     def list(
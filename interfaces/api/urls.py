@@ -1,10 +1,12 @@
 from ninja import NinjaAPI
+from ninja.errors import ValidationError
 from ninja.throttling import AnonRateThrottle, AuthRateThrottle
 from django.urls import path
 from django.views.decorators.csrf import ensure_csrf_cookie
 from sensorthings import SensorThingsAPI
 from sensorthings.extensions.dataarray import data_array_extension
 from hydroserver import __version__
+from domains.sta.uploads import get_file_attachment_size_error
 from interfaces.api.renderer import ORJSONRenderer
 from interfaces.sensorthings.api import hydroserver_extension
 from interfaces.sensorthings.engine import HydroServerSensorThingsEngine
@@ -38,6 +40,17 @@ api = NinjaAPI(
     ],
 )
 
+
+@api.exception_handler(ValidationError)
+def validation_error(request, exc):
+    # An upload stopped by FileAttachmentUploadHandler leaves the file field empty, so report the size limit
+    # instead of a missing field.
+    if getattr(request, "file_attachment_too_large", False):
+        return api.create_response(request, {"detail": get_file_attachment_size_error()}, status=413)
+
+    return api.create_response(request, {"detail": exc.errors}, status=422)
+
+
 api.add_router("workspaces", workspace_router)
 api.add_router("roles", role_router)
 
@@ -56,6 +56,8 @@ def get_datastreams(
         order_by=query.order_by,
         filtering=query.dict(exclude_unset=True),
         expand_related=query.expand_related,
+        cursor=query.cursor,
+        count_mode=query.count_mode,
     )
 
 
@@ -4,12 +4,15 @@ from ninja import Router, Path, Query, File, Form
 from ninja.files import UploadedFile
 from django.db import transaction
 from django.http import HttpResponse
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
 from interfaces.http.auth import bearer_auth, session_auth, apikey_auth, anonymous_auth
 from interfaces.http.request import HydroServerHttpRequest
 from interfaces.api.schemas import VocabularyQueryParameters
 from interfaces.api.schemas import (
     ThingMarkerResponse,
     ThingMarkerQueryParameters,
+    ThingTileQueryParameters,
     ThingSiteSummaryResponse,
     ThingSiteSummaryQueryParameters,
     ThingSummaryResponse,
@@ -57,6 +60,8 @@ def get_things(
         order_by=query.order_by,
         filtering=query.dict(exclude_unset=True),
         expand_related=query.expand_related,
+        cursor=query.cursor,
+        count_mode=query.count_mode,
     )
 
 
@@ -77,12 +82,51 @@ def get_thing_markers(
     Get lean marker data for public Things plus private Things visible to the authenticated user.
     """
 
-    return 200, thing_service.list_markers(
-        principal=request.principal,
-        filtering=query.dict(exclude_unset=True),
+    return HttpResponse(
+        thing_service.render_markers(
+            principal=request.principal,
+            filtering=query.dict(exclude_unset=True),
+        ),
+        content_type="application/json",
     )
 
 
+@thing_router.get(
+    "/tiles/{z}/{x}/{y}.mvt",
+    auth=[session_auth, bearer_auth, apikey_auth, anonymous_auth],
+    response={200: None, 401: str, 404: str},
+)
+def get_thing_tile(
+    request: HydroServerHttpRequest,
+    z: Path[int],
+    x: Path[int],
+    y: Path[int],
+    query: Query[ThingTileQueryParameters],
+):
+    """
+    Get a Mapbox Vector Tile of public Things plus private Things visible to the authenticated user. Nearby Things
+    are clustered at low zoom levels.
+    """
+
+    response = HttpResponse(
+        thing_service.render_marker_tile(
+            principal=request.principal,
+            z=z,
+            x=x,
+            y=y,
+            filtering=query.dict(exclude_unset=True),
+        ),
+        content_type="application/vnd.mapbox-vector-tile",
+    )
+    response["Cache-Control"] = (
+        f"public, max-age={settings.PUBLIC_THING_MARKERS_CACHE_TIMEOUT}"
+        if request.principal is None else "private, no-cache"
+    )
+    patch_vary_headers(response, ["Authorization", "Cookie", "X-Api-Key"])
+
+    return response
+
+
 @thing_router.get(
     "/site-summaries",
     auth=[session_auth, bearer_auth, apikey_auth, anonymous_auth],
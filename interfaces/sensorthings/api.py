@@ -2,6 +2,8 @@ from django.db import transaction
 from sensorthings import SensorThingsExtension
 from sensorthings.factories import SensorThingsEndpointHookFactory
 from interfaces.http.auth import session_auth, bearer_auth, apikey_auth, anonymous_auth
+from .cache import cache_anonymous_response
+from .views import create_data_array_observations, list_observations
 from .schemas import (DatastreamListResponse, DatastreamGetResponse, ThingListResponse, ThingGetResponse,
                       LocationListResponse, LocationGetResponse, ObservationListResponse, ObservationGetResponse,
                       ObservationPostBody, ObservationDataArrayPostBody, ObservedPropertyListResponse,
@@ -18,6 +20,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=DatastreamListResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -28,6 +31,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=DatastreamGetResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -53,6 +57,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
         ),
         SensorThingsEndpointHookFactory(
             endpoint_name="get_feature_of_interest",
@@ -62,6 +67,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
         ),
         SensorThingsEndpointHookFactory(
             endpoint_name="create_feature_of_interest",
@@ -86,6 +92,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
         ),
         SensorThingsEndpointHookFactory(
             endpoint_name="get_historical_location",
@@ -95,6 +102,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
         ),
         SensorThingsEndpointHookFactory(
             endpoint_name="create_historical_location",
@@ -119,6 +127,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=LocationListResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -129,6 +138,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=LocationGetResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -154,6 +164,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=list_observations,
             view_response_schema=ObservationListResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -164,6 +175,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=ObservationGetResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -179,7 +191,7 @@ hydroserver_extension = SensorThingsExtension(
         ),
         SensorThingsEndpointHookFactory(
             endpoint_name="create_observations",
-            view_wrapper=transaction.atomic,
+            view_wrapper=create_data_array_observations,
             view_authentication=[
                 session_auth,
                 bearer_auth,
@@ -206,6 +218,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=ObservedPropertyListResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -216,6 +229,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=ObservedPropertyGetResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -241,6 +255,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=SensorListResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -251,6 +266,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=SensorGetResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -276,6 +292,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=ThingListResponse,
         ),
         SensorThingsEndpointHookFactory(
@@ -286,6 +303,7 @@ hydroserver_extension = SensorThingsExtension(
                 apikey_auth,
                 anonymous_auth,
             ],
+            view_wrapper=cache_anonymous_response,
             view_response_schema=ThingGetResponse,
         ),
         SensorThingsEndpointHookFactory(
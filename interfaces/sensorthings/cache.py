@@ -0,0 +1,94 @@
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+from django.http import HttpResponse
+from domains.sta.cache import (
+    get_sensorthings_response_cache_timeout,
+    get_sensorthings_response_cache_versions,
+    get_sensorthings_response_cache,
+    set_sensorthings_response_cache,
+)
+
+
+DATASTREAM_DEPENDENT_PATH_SEGMENTS = (
+    "datastream",
+    "observation",
+    "featuresofinterest",
+    "featureofinterest",
+)
+
+
+def get_response_cache_scopes(request, view_kwargs: dict, query_string: str) -> list[str]:
+    request_path = f"{request.path_info}?{query_string}".lower()
+
+    if not any(segment in request_path for segment in DATASTREAM_DEPENDENT_PATH_SEGMENTS):
+        return ["things"]
+
+    nested_path = getattr(request, "nested_path", [])
+
+    if len(nested_path) == 1 and nested_path[0][0].__name__ == "Datastream":
+        datastream_id = nested_path[0][2]
+    elif not nested_path:
+        datastream_id = view_kwargs.get("datastream_id")
+    else:
+        datastream_id = None
+
+    if datastream_id is not None and "$expand" not in request.GET:
+        return ["things", f"datastream:{datastream_id}"]
+
+    return ["things", "datastreams"]
+
+
+def build_response_cache_key(request, view_kwargs: dict) -> str:
+    query_string = urlencode(sorted(request.GET.lists()), doseq=True)
+    scopes = get_response_cache_scopes(request, view_kwargs, query_string)
+
+    return hashlib.sha256(
+        "|".join(
+            [
+                getattr(request, "sensorthings_url", ""),
+                request.path_info,
+                query_string,
+                *get_sensorthings_response_cache_versions(scopes),
+            ]
+        ).encode()
+    ).hexdigest()
+
+
+def cache_anonymous_response(view_function):
+    @wraps(view_function)
+    def wrapper(request, *args, **kwargs):
+        if (
+            request.method != "GET"
+            or getattr(request, "principal", None) is not None
+            or not get_sensorthings_response_cache_timeout()
+        ):
+            return view_function(request, *args, **kwargs)
+
+        cache_key = build_response_cache_key(request, kwargs)
+        cached_response = get_sensorthings_response_cache(cache_key)
+
+        if cached_response is not None:
+            response, count_mode, response_string = cached_response
+            if count_mode:
+                request.count_mode = count_mode
+            if response_string is not None:
+                request.response_string = response_string
+            return response
+
+        response = view_function(request, *args, **kwargs)
+
+        if not isinstance(response, (HttpResponse, tuple)):
+            set_sensorthings_response_cache(
+                cache_key,
+                (
+                    response,
+                    getattr(request, "count_mode", None),
+                    getattr(request, "response_string", None),
+                ),
+            )
+
+        return response
+
+    return wrapper
+
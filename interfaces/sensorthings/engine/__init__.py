@@ -8,6 +8,7 @@ from .observation import ObservationEngine
 from .observed_property import ObservedPropertyEngine
 from .sensor import SensorEngine
 from .thing import ThingEngine
+from .filters import parse_filter
 
 
 class HydroServerSensorThingsEngine(
@@ -22,4 +23,11 @@ class HydroServerSensorThingsEngine(
     SensorThingsBaseEngine,
     DataArrayBaseEngine,
 ):
-    pass
+    @staticmethod
+    def parse_filters(query_params: dict):
+        filter_string = query_params.get("filters")
+
+        if not filter_string:
+            return None
+
+        return parse_filter(filter_string.strip())
@@ -0,0 +1,274 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+from django.db.models import F, Q
+from ninja.errors import HttpError
+from odata_query import ast
+from odata_query.visitor import NodeTransformer
+from odata_query.django.django_q import AstToDjangoQVisitor
+from odata_query.exceptions import ParsingException, TokenizingException
+from odata_query.grammar import ODataParser, ODataLexer
+from sensorthings.components import field_schemas
+from domains.sta import models as sta_models
+
+
+FILTER_CACHE_SIZE = 1024
+
+FIELD_MAPPINGS = {
+    "Thing": {
+        "properties__samplingFeatureType": "sampling_feature_type",
+        "properties__samplingFeatureCode": "sampling_feature_code",
+        "properties__siteType": "site_type",
+        "properties__dataDisclaimer": "data_disclaimer",
+        "properties__isPrivate": "is_private",
+        "properties__workspace__id": "workspace_id",
+        "properties__workspace__name": "workspace__name",
+        "properties__workspace__isPrivate": "workspace__is_private",
+        "Location__id": "locations__id",
+    },
+    "Location": {
+        "encodingType": "encoding_type",
+        "properties__workspace__id": "thing__workspace_id",
+        "properties__workspace__name": "thing__workspace__name",
+        "properties__workspace__isPrivate": "thing__workspace__is_private",
+        "Thing__id": "thing_id",
+    },
+    "Sensor": {
+        "encodingType": "encoding_type",
+        "properties__workspace__id": "workspace_id",
+        "properties__workspace__name": "workspace__name",
+        "properties__workspace__isPrivate": "workspace__is_private",
+        "metadata__methodCode": "method_code",
+        "metadata__methodType": "method_type",
+        "metadata__methodLink": "method_link",
+        "metadata__sensorModel__sensorModelName": "model",
+        "metadata__sensorModel__sensorModelUrl": "model_link",
+        "metadata__sensorModel__sensorManufacturer": "manufacturer",
+    },
+    "ObservedProperty": {
+        "properties__variableCode": "code",
+        "properties__variableType": "type",
+        "properties__workspace__id": "workspace_id",
+        "properties__workspace__name": "workspace__name",
+        "properties__workspace__isPrivate": "workspace__is_private",
+    },
+    "Datastream": {
+        "unitOfMeasurement__name": "unit__name",
+        "unitOfMeasurement__symbol": "unit__symbol",
+        "unitOfMeasurement__definition": "unit__definition",
+        "observationType": "observation_type",
+        "observedArea": "observed_area",
+        "properties__workspace__id": "thing__workspace_id",
+        "properties__workspace__name": "thing__workspace__name",
+        "properties__workspace__isPrivate": "thing__workspace__is_private",
+        "properties__resultType": "result_type",
+        "properties__status": "status",
+        "properties__sampledMedium": "sampled_medium",
+        "properties__valueCount": "value_count",
+        "properties__noDataValue": "no_data_value",
+        "properties__processingLevelCode": "processing_level__code",
+        "properties__intendedTimeSpacing": "intended_time_spacing",
+        "properties__intendedTimeSpacingUnitOfMeasurement": "intended_time_spacing_unit",
+        "properties__aggregationStatistic": "aggregation_statistic",
+        "properties__timeAggregationInterval": "time_aggregation_interval",
+        "properties__timeAggregationIntervalUnitOfMeasurement": "time_aggregation_interval_unit",
+    },
+    "Observation": {
+        "phenomenonTime": "phenomenon_time",
+        "resultTime": "result_time",
+    },
+}
+
+RELATED_COMPONENTS = {
+    "Datastream": ("Thing", "Sensor", "ObservedProperty"),
+    "Observation": ("Datastream", "FeatureOfInterest"),
+}
+
+RELATED_FIELD_PREFIXES = {
+    related_component: getattr(field_schemas, related_component).model_config[
+        "json_schema_extra"
+    ]["name_ref"][1]
+    for related_components in RELATED_COMPONENTS.values()
+    for related_component in related_components
+}
+
+# Filters on these collections must constrain at least one of the listed model fields (or a field
+# reached through one of the listed relations) before they are run against a large table.
+INDEXED_FILTER_FIELDS = {
+    "Observation": ("id", "datastream_id", "datastream__"),
+}
+
+TIME_RANGE_FIELDS = {
+    "Observation": ("phenomenonTime",),
+}
+
+
+@dataclass(frozen=True)
+class CompiledFilter:
+    query_filter: Q
+    indexed: bool
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def transform_model_field(component_name: str, prop: str) -> str:
+    related_component, _, related_prop = prop.partition("__")
+
+    if related_component in RELATED_COMPONENTS.get(component_name, ()):
+        return (
+            RELATED_FIELD_PREFIXES[related_component]
+            + "__"
+            + transform_model_field(related_component, related_prop)
+        )
+
+    return FIELD_MAPPINGS.get(component_name, {}).get(prop, prop)
+
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def parse_filter(filter_string: str):
+    try:
+        return ODataParser().parse(ODataLexer().tokenize(filter_string))
+    except (ParsingException, TokenizingException):
+        raise HttpError(422, "Failed to parse filter parameter.")
+
+
+def get_field_path(node) -> Optional[str]:
+    if isinstance(node, ast.Identifier):
+        return node.name
+    elif isinstance(node, ast.Attribute):
+        owner_path = get_field_path(node.owner)
+        return f"{owner_path}__{node.attr}" if owner_path else None
+    else:
+        return None
+
+
+class SensorThingsQVisitor(AstToDjangoQVisitor):
+    def __init__(self, component_name: str):
+        super().__init__(getattr(sta_models, component_name))
+        self.component_name = component_name
+
+    def visit_Identifier(self, node: ast.Identifier) -> F:
+        return F(transform_model_field(self.component_name, node.name))
+
+    def visit_Attribute(self, node: ast.Attribute) -> F:
+        return F(transform_model_field(self.component_name, get_field_path(node)))
+
+
+class TimeRangeTransformer(NodeTransformer):
+    """
+    Rewrites year() and date() comparisons on indexed timestamp fields into half-open UTC ranges on the
+    raw field, so PostgreSQL can use the index instead of evaluating EXTRACT/date_trunc on every row.
+    """
+
+    def __init__(self, fields: tuple[str, ...]):
+        self.fields = fields
+
+    def visit_Compare(self, node: ast.Compare) -> ast._Node:
+        if not (
+            isinstance(node.left, ast.Call)
+            and get_field_path(node.left.func) in ("year", "date")
+            and len(node.left.args) == 1
+            and isinstance(node.left.args[0], ast.Identifier)
+            and node.left.args[0].name in self.fields
+            and isinstance(node.right, (ast.Integer, ast.Date))
+        ):
+            return self.generic_visit(node)
+
+        try:
+            if isinstance(node.right, ast.Integer):
+                start = datetime(node.right.py_val, 1, 1, tzinfo=timezone.utc)
+                end = datetime(node.right.py_val + 1, 1, 1, tzinfo=timezone.utc)
+            else:
+                start = datetime.combine(node.right.py_val, time.min, tzinfo=timezone.utc)
+                end = start + timedelta(days=1)
+        except (ValueError, OverflowError):
+            return self.generic_visit(node)
+
+        field = node.left.args[0]
+        start = ast.DateTime(val=start.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        end = ast.DateTime(val=end.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+        if isinstance(node.comparator, ast.Eq):
+            return ast.BoolOp(
+                op=ast.And(),
+                left=ast.Compare(comparator=ast.GtE(), left=field, right=start),
+                right=ast.Compare(comparator=ast.Lt(), left=field, right=end),
+            )
+        elif isinstance(node.comparator, ast.NotEq):
+            return ast.BoolOp(
+                op=ast.Or(),
+                left=ast.Compare(comparator=ast.Lt(), left=field, right=start),
+                right=ast.Compare(comparator=ast.GtE(), left=field, right=end),
+            )
+        elif isinstance(node.comparator, ast.Gt):
+            return ast.Compare(comparator=ast.GtE(), left=field, right=end)
+        elif isinstance(node.comparator, ast.GtE):
+            return ast.Compare(comparator=ast.GtE(), left=field, right=start)
+        elif isinstance(node.comparator, ast.Lt):
+            return ast.Compare(comparator=ast.Lt(), left=field, right=start)
+        elif isinstance(node.comparator, ast.LtE):
+            return ast.Compare(comparator=ast.Lt(), left=field, right=end)
+        else:
+            return self.generic_visit(node)
+
+
+def is_indexed_filter(component_name: str, node) -> bool:
+    if isinstance(node, ast.BoolOp):
+        if isinstance(node.op, ast.And):
+            return is_indexed_filter(component_name, node.left) or is_indexed_filter(
+                component_name, node.right
+            )
+        return is_indexed_filter(component_name, node.left) and is_indexed_filter(
+            component_name, node.right
+        )
+
+    if isinstance(node, ast.Compare) and not isinstance(node.comparator, ast.NotEq):
+        field_path = get_field_path(node.left)
+
+        if field_path is None:
+            return False
+
+        model_field = transform_model_field(component_name, field_path)
+
+        return any(
+            model_field == indexed_field
+            or (indexed_field.endswith("__") and model_field.startswith(indexed_field))
+            for indexed_field in INDEXED_FILTER_FIELDS[component_name]
+        )
+
+    return False
+
+
+compiled_filters: "OrderedDict[tuple[str, str], CompiledFilter]" = OrderedDict()
+compiled_filters_lock = threading.Lock()
+
+
+def compile_filter(component_name: str, filters) -> CompiledFilter:
+    cache_key = (component_name, repr(filters))
+
+    with compiled_filters_lock:
+        compiled_filter = compiled_filters.get(cache_key)
+        if compiled_filter is not None:
+            compiled_filters.move_to_end(cache_key)
+            return compiled_filter
+
+    if component_name in TIME_RANGE_FIELDS:
+        filters = TimeRangeTransformer(TIME_RANGE_FIELDS[component_name]).visit(filters)
+
+    compiled_filter = CompiledFilter(
+        query_filter=SensorThingsQVisitor(component_name).visit(filters),
+        indexed=(
+            is_indexed_filter(component_name, filters)
+            if component_name in INDEXED_FILTER_FIELDS
+            else True
+        ),
+    )
+
+    with compiled_filters_lock:
+        compiled_filters[cache_key] = compiled_filter
+        if len(compiled_filters) > FILTER_CACHE_SIZE:
+            compiled_filters.popitem(last=False)
+
+    return compiled_filter
@@ -1,12 +1,20 @@
 import math
+import orjson
+import uuid6
+from datetime import datetime, timezone
+from dateutil.parser import isoparse
+from itertools import groupby
+from operator import itemgetter
 from uuid import UUID
 from typing import Optional
+from django.conf import settings
 from django.db.models.functions import Coalesce
 from django.db.models import Min, Max, Count, Q, Value, OuterRef, Subquery
 from django.db.utils import IntegrityError, DatabaseError, DataError
 from django.contrib.postgres.aggregates import ArrayAgg
-from psycopg.errors import UniqueViolation
+from psycopg.errors import UniqueViolation, DataError as CopyDataError
 from ninja.errors import HttpError
+from odata_query import ast
 from domains.sta.models import Observation, Datastream
 from sensorthings.components.observations.engine import ObservationBaseEngine
 from sensorthings.components.observations.schemas import (
@@ -21,6 +29,27 @@ from domains.sta.services.datastream import DatastreamService
 observation_service = ObservationService()
 datastream_service = DatastreamService()
 
+# Observation response fields the compact serializer can render, in response schema order, mapped to
+# getters over the values_list rows it fetches. Navigation links are added per request.
+COMPACT_OBSERVATION_FIELDS = {
+    "@iot.id": itemgetter(0),
+    "@iot.selfLink": None,
+    "phenomenonTime": itemgetter(2),
+    "result": itemgetter(3),
+    "resultTime": itemgetter(4),
+    "resultQuality": lambda row: {"qualityCode": row[5], "resultQualifiers": row[6]},
+    "Datastream@iot.navigationLink": None,
+    "FeatureOfInterest@iot.navigationLink": None,
+}
+
+COMPACT_OBSERVATION_SELECT_FIELDS = (
+    "id",
+    "phenomenonTime",
+    "result",
+    "resultTime",
+    "resultQuality",
+)
+
 
 class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
     def get_observations(
@@ -35,6 +64,175 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
         get_count: bool = False,
     ) -> (list[dict], int):
 
+        observations, count, count_mode = self.query_observations(
+            observation_ids=observation_ids,
+            datastream_ids=datastream_ids,
+            pagination=pagination,
+            ordering=ordering,
+            filters=filters,
+            get_count=get_count,
+        )
+
+        try:
+            response = {
+                observation.id: {
+                    "id": observation.id,
+                    "phenomenon_time": str(observation.phenomenon_time),
+                    "result": observation.result,
+                    "result_time": (
+                        str(observation.result_time)
+                        if observation.result_time
+                        else None
+                    ),
+                    "datastream_id": observation.datastream_id,
+                    "result_quality": {
+                        "quality_code": observation.quality_code,
+                        "result_qualifiers": observation.result_qualifier_codes
+                        if observation.result_qualifiers is not None else []
+                    }
+                }
+                for observation in observations
+            }
+        except (
+            DatabaseError,
+            DataError,
+        ) as e:
+            raise HttpError(400, str(e))
+
+        if not datastream_ids:
+            count = self.tighten_estimated_count(
+                count=count,
+                count_mode=count_mode,
+                length=len(response),
+                pagination=pagination,
+            )
+
+        return response, count
+
+    def list_compact_observations(
+        self,
+        query_params: dict,
+        result_format: Optional[str] = None,
+    ) -> bytes:
+        """
+        Renders an Observation collection straight from database rows to JSON bytes. This produces the
+        same document as list_entities for requests without $expand, but skips the per-observation
+        entity dicts and response schema validation, which dominate the cost of large pages.
+        """
+
+        nested_entity_id = self.check_nested_path()
+
+        if nested_entity_id:
+            nested_entity_filter = (
+                f"{self.request.nested_path[-1][0].__name__}/id eq '{nested_entity_id}'"
+            )
+            query_params["filters"] = (
+                f'{query_params["filters"]} and {nested_entity_filter}'
+                if query_params["filters"]
+                else nested_entity_filter
+            )
+
+        select = query_params["select"].split(",") if query_params.get("select") else []
+        get_count = query_params.get("count") is True
+        pagination = self.parse_pagination(query_params)
+
+        if result_format == "dataArray":
+            fields = (
+                (["@iot.id"] if "id" in select else [])
+                + [field for field in COMPACT_OBSERVATION_FIELDS if field in select]
+                if select
+                else ["phenomenonTime", "result"]
+            )
+        else:
+            fields = [
+                field
+                for field in COMPACT_OBSERVATION_FIELDS
+                if not select or field in select or (field == "@iot.id" and "id" in select)
+            ]
+
+        observations_url = f"{self.request.sensorthings_url}/Observations"
+        getters = {
+            **COMPACT_OBSERVATION_FIELDS,
+            "@iot.selfLink": lambda row: f"{observations_url}('{row[0]}')",
+            "Datastream@iot.navigationLink": (
+                lambda row: f"{observations_url}('{row[0]}')/Datastream"
+            ),
+            "FeatureOfInterest@iot.navigationLink": (
+                lambda row: f"{observations_url}('{row[0]}')/FeatureOfInterest"
+            ),
+        }
+        getters = [(field, getters[field]) for field in fields]
+
+        observations, count, count_mode = self.query_observations(
+            pagination=pagination,
+            ordering=self.parse_ordering(query_params),
+            filters=self.parse_filters(query_params),
+            get_count=get_count,
+            annotate_result_qualifiers="resultQuality" in fields,
+        )
+
+        columns = ["id", "datastream_id", "phenomenon_time", "result", "result_time", "quality_code"]
+
+        if "resultQuality" in fields:
+            columns.append("result_qualifier_codes")
+
+        try:
+            rows = list(observations.values_list(*columns))
+        except (
+            DatabaseError,
+            DataError,
+        ) as e:
+            raise HttpError(400, str(e))
+
+        count = self.tighten_estimated_count(
+            count=count,
+            count_mode=count_mode,
+            length=len(rows),
+            pagination=pagination,
+        )
+
+        next_link = self.build_next_link(
+            query_params=query_params, length=len(rows), count=count
+        )
+
+        response = {}
+
+        if get_count:
+            response["@iot.count"] = count
+
+        if result_format == "dataArray":
+            response["value"] = [
+                {
+                    "Datastream@iot.navigationLink": (
+                        f"{self.request.sensorthings_url}/Datastreams('{datastream_id}')"
+                    ),
+                    "components": fields,
+                    "dataArray": [
+                        [getter(row) for _, getter in getters] for row in datastream_rows
+                    ],
+                }
+                for datastream_id, datastream_rows in groupby(rows, key=itemgetter(1))
+            ]
+        else:
+            response["value"] = [
+                {field: getter(row) for field, getter in getters} for row in rows
+            ]
+
+        if next_link:
+            response["@iot.nextLink"] = next_link
+
+        return orjson.dumps(response)
+
+    def query_observations(
+        self,
+        observation_ids: Optional[list[UUID]] = None,
+        datastream_ids: Optional[list[UUID]] = None,
+        pagination: Optional[dict] = None,
+        ordering: Optional[dict] = None,
+        filters: Optional[dict] = None,
+        get_count: bool = False,
+        annotate_result_qualifiers: bool = True,
+    ):
         if observation_ids:
             observation_ids = self.strings_to_uuids(observation_ids)
 
@@ -43,11 +241,19 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
         if observation_ids:
             observations = observations.filter(id__in=observation_ids)
 
+        if datastream_ids:
+            observations = observations.filter(
+                datastream_id__in=self.strings_to_uuids(datastream_ids)
+            )
+
         observations = observations.visible(principal=self.request.principal)  # noqa
 
         if filters:
             observations = self.apply_filters(
-                queryset=observations, component=ObservationSchema, filters=filters
+                queryset=observations,
+                component=ObservationSchema,
+                filters=filters,
+                indexed_scope=bool(observation_ids or datastream_ids),
             )
 
         if not ordering:
@@ -76,26 +282,27 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
                 if order_rule["field"] not in ["Datastream/id", "phenomenonTime"]
             ]
 
-        result_qualifier_subquery = (
-            Observation.result_qualifiers.through.objects.filter(
-                **{"observation": OuterRef("pk")}
-            )
-            .values("observation")
-            .annotate(
-                codes=ArrayAgg(
-                    f"resultqualifier__code",
-                    distinct=True,
-                    filter=~Q(**{"resultqualifier__code": None}),
+        if annotate_result_qualifiers:
+            result_qualifier_subquery = (
+                Observation.result_qualifiers.through.objects.filter(
+                    **{"observation": OuterRef("pk")}
+                )
+                .values("observation")
+                .annotate(
+                    codes=ArrayAgg(
+                        f"resultqualifier__code",
+                        distinct=True,
+                        filter=~Q(**{"resultqualifier__code": None}),
+                    )
                 )
+                .values("codes")[:1]
             )
-            .values("codes")[:1]
-        )
 
-        observations = observations.annotate(
-            result_qualifier_codes=Coalesce(
-                Subquery(result_qualifier_subquery), Value([])
+            observations = observations.annotate(
+                result_qualifier_codes=Coalesce(
+                    Subquery(result_qualifier_subquery), Value([])
+                )
             )
-        )
 
         observations = self.apply_order(
             queryset=observations, component=ObservationSchema, order_by=ordering
@@ -104,49 +311,95 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
         observations = observations.distinct()
 
         if get_count:
-            count = observations.count()
+            count, count_mode = self.count_observations(
+                observations=observations,
+                filters=filters,
+                observation_ids=observation_ids,
+            )
+            self.request.count_mode = count_mode
         else:
-            count = None
+            count, count_mode = None, None
+
+        top = pagination.get("top") if pagination else 100
+        skip = pagination.get("skip") if pagination else 0
 
         if datastream_ids:
             observations = self.apply_window(
                 queryset=observations,
                 partition_field="datastream_id",
-                top=pagination.get("top") if pagination else 100,
-                skip=pagination.get("skip") if pagination else 0,
+                top=top,
+                skip=skip,
             )
         else:
             observations = self.apply_pagination(
                 queryset=observations,
-                top=pagination.get("top") if pagination else 100,
-                skip=pagination.get("skip") if pagination else 0,
+                top=top,
+                skip=skip,
+            )
+
+        return observations, count, count_mode
+
+    @staticmethod
+    def tighten_estimated_count(
+        count: Optional[int],
+        count_mode: Optional[str],
+        length: int,
+        pagination: Optional[dict] = None,
+    ) -> Optional[int]:
+        if count_mode != "estimated":
+            return count
+
+        top = pagination.get("top") if pagination else 100
+        skip = pagination.get("skip") if pagination else 0
+
+        if length < top and (length or skip == 0):
+            return skip + length
+        elif length == top:
+            return max(count, skip + top + 1)
+
+        return count
+
+    def count_observations(
+        self,
+        observations,
+        filters: Optional[dict] = None,
+        observation_ids: Optional[list[UUID]] = None,
+    ) -> tuple[int, str]:
+        if settings.ST_API_COUNT_MODE != "estimated":
+            return observations.count(), "exact"
+
+        datastream_id = (
+            self.get_filtered_datastream_id(filters) if not observation_ids else None
+        )
+
+        if datastream_id:
+            value_count = (
+                Datastream.objects.filter(pk=datastream_id)
+                .visible(principal=self.request.principal)  # noqa
+                .values_list("value_count", flat=True)
+                .first()
             )
+            return value_count or 0, "estimated"
+
+        return self.estimate_count(observations), "estimated"
+
+    @staticmethod
+    def get_filtered_datastream_id(filters) -> Optional[UUID]:
+        if not (
+            isinstance(filters, ast.Compare)
+            and isinstance(filters.comparator, ast.Eq)
+            and isinstance(filters.left, ast.Attribute)
+            and isinstance(filters.left.owner, ast.Identifier)
+            and filters.left.owner.name == "Datastream"
+            and filters.left.attr == "id"
+            and isinstance(filters.right, ast.String)
+        ):
+            return None
 
         try:
-            return {
-                observation.id: {
-                    "id": observation.id,
-                    "phenomenon_time": str(observation.phenomenon_time),
-                    "result": observation.result,
-                    "result_time": (
-                        str(observation.result_time)
-                        if observation.result_time
-                        else None
-                    ),
-                    "datastream_id": observation.datastream_id,
-                    "result_quality": {
-                        "quality_code": observation.quality_code,
-                        "result_qualifiers": observation.result_qualifier_codes
-                        if observation.result_qualifiers is not None else []
-                    }
-                }
-                for observation in observations
-            }, count
-        except (
-            DatabaseError,
-            DataError,
-        ) as e:
-            raise HttpError(400, str(e))
+            return UUID(filters.right.val)
+        except ValueError:
+            return None
 
     def create_observation(self, observation: ObservationPostBody) -> UUID:
         datastream = datastream_service.get_datastream_for_action(
@@ -188,73 +441,200 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
         return new_observation.id
 
     def create_observations(self, observations) -> list[UUID]:
+        return self.copy_observation_rows(
+            {
+                datastream_id: [
+                    (
+                        observation.phenomenon_time,
+                        observation.result,
+                        observation.result_time,
+                        (
+                            observation.result_quality.quality_code
+                            if observation.result_quality
+                            else None
+                        ),
+                    )
+                    for observation in datastream_observations
+                ]
+                for datastream_id, datastream_observations in observations.items()
+            }
+        )
 
-        new_observations = []
+    def create_data_array_observations(self, observations) -> list[UUID]:
+        observation_rows = {}
 
-        for datastream_id, datastream_observations in observations.items():
-            datastream = datastream_service.get_datastream_for_action(
-                principal=self.request.principal,  # noqa
-                uid=datastream_id,
-                action="view",
-            )
+        for data_array in observations:
+            components = {
+                component: index for index, component in enumerate(data_array.components)
+            }
 
-            if not Observation.can_principal_create(
-                principal=self.request.principal,  # noqa
-                workspace=datastream.thing.workspace,
-            ):
+            if "phenomenonTime" not in components or "result" not in components:
                 raise HttpError(
-                    403, "You do not have permission to create these observations"
+                    422, "Data array components must include phenomenonTime and result."
                 )
 
-            # for result_qualifier_id in list(set([result_qualifier for result_qualifiers in [
-            #     observation.result_quality.result_qualifiers
-            #     for observation in datastream_observations
-            #     if observation.result_quality and observation.result_quality.result_qualifiers
-            # ] for result_qualifier in result_qualifiers])):
-            #     ResultQualifier.objects.get_by_id(
-            #         result_qualifier_id=result_qualifier_id,
-            #         principal=getattr(self, "http").principal,
-            #         method="GET",
-            #         fetch=False,
-            #         raise_404=True
-            #     )
-
-            try:
-                new_observations_for_datastream = Observation.objects.bulk_copy(
-                    [
-                        Observation(
-                            datastream_id=observation.datastream.id,
-                            phenomenon_time=observation.phenomenon_time,
-                            result=(
-                                observation.result
-                                if not math.isnan(observation.result)
-                                else datastream.no_data_value
-                            ),
-                            result_time=observation.result_time,
-                            quality_code=(
-                                observation.result_quality.quality_code
-                                if observation.result_quality
-                                else None
-                            ),
-                            # result_qualifiers=observation.result_quality.result_qualifiers
-                            # if observation.result_quality else []
-                        )
-                        for observation in datastream_observations
-                    ]
-                )
-            except (
-                IntegrityError,
-                UniqueViolation,
-            ):
+            if any(len(row) != len(data_array.components) for row in data_array.data_array):
                 raise HttpError(
-                    409, "Duplicate phenomenonTime found on this datastream."
+                    422, "Each data array row must have one value for each of its components."
+                )
+
+            phenomenon_time_index = components["phenomenonTime"]
+            result_index = components["result"]
+            result_time_index = components.get("resultTime")
+            result_quality_index = components.get("resultQuality")
+
+            observation_rows.setdefault(data_array.datastream.id, []).extend(
+                (
+                    row[phenomenon_time_index],
+                    row[result_index],
+                    row[result_time_index] if result_time_index is not None else None,
+                    (
+                        self.get_quality_code(row[result_quality_index])
+                        if result_quality_index is not None
+                        else None
+                    ),
                 )
+                for row in data_array.data_array
+            )
+
+        return self.copy_observation_rows(observation_rows)
+
+    def copy_observation_rows(self, observation_rows: dict) -> list[UUID]:
+        datastream_ids = self.strings_to_uuids(list(observation_rows.keys()))
+
+        datastreams = {
+            datastream.id: datastream
+            for datastream in Datastream.objects.filter(pk__in=datastream_ids)
+            .visible(principal=self.request.principal)  # noqa
+            .select_related("thing__workspace")
+        }
+
+        if any(datastream_id not in datastreams for datastream_id in datastream_ids):
+            raise HttpError(404, "Datastream does not exist")
 
-            new_observations.extend(new_observations_for_datastream)
+        workspaces = {
+            datastream.thing.workspace_id: datastream.thing.workspace
+            for datastream in datastreams.values()
+        }
 
-            self.update_value_count(datastream_id=datastream_id)
+        if not all(
+            Observation.can_principal_create(
+                principal=self.request.principal,  # noqa
+                workspace=workspace,
+            )
+            for workspace in workspaces.values()
+        ):
+            raise HttpError(
+                403, "You do not have permission to create these observations"
+            )
+
+        observation_ids = []
+        appended_statistics = {}
+
+        def generate_rows():
+            for datastream_id, rows in observation_rows.items():
+                datastream_uuid = UUID(str(datastream_id))
+                no_data_value = datastreams[datastream_uuid].no_data_value
+                statistics = appended_statistics.setdefault(datastream_uuid, {"value_count": 0})
+
+                for phenomenon_time, result, result_time, quality_code in rows:
+                    observation_id = uuid6.uuid7()
+                    observation_ids.append(observation_id)
+                    phenomenon_time = self.parse_observation_time(phenomenon_time, "phenomenonTime")
+                    result_time = (
+                        self.parse_observation_time(result_time, "resultTime")
+                        if result_time is not None
+                        else None
+                    )
+
+                    self.accumulate_observation_time(statistics, "phenomenon", phenomenon_time)
+                    self.accumulate_observation_time(statistics, "result", result_time)
+                    statistics["value_count"] += 1
+
+                    yield (
+                        observation_id,
+                        datastream_uuid,
+                        phenomenon_time,
+                        self.parse_observation_result(result, no_data_value),
+                        result_time,
+                        quality_code,
+                    )
+
+        try:
+            Observation.objects.bulk_copy_values(
+                fields=[
+                    "id",
+                    "datastream",
+                    "phenomenon_time",
+                    "result",
+                    "result_time",
+                    "quality_code",
+                ],
+                rows=generate_rows(),
+            )
+        except (
+            IntegrityError,
+            UniqueViolation,
+        ):
+            raise HttpError(409, "Duplicate phenomenonTime found on this datastream.")
+        except CopyDataError as e:
+            raise HttpError(422, str(e))
+        except (
+            DatabaseError,
+            DataError,
+        ) as e:
+            raise HttpError(400, str(e))
+
+        datastream_service.update_appended_observation_statistics(appended_statistics)
+
+        return observation_ids
+
+    @staticmethod
+    def accumulate_observation_time(statistics: dict, prefix: str, value: Optional[datetime]) -> None:
+        if value is None:
+            return
+
+        begin_time = statistics.get(f"{prefix}_begin_time")
+        end_time = statistics.get(f"{prefix}_end_time")
+
+        statistics[f"{prefix}_begin_time"] = value if begin_time is None else min(begin_time, value)
+        statistics[f"{prefix}_end_time"] = value if end_time is None else max(end_time, value)
+
+    @staticmethod
+    def parse_observation_time(value, component: str) -> datetime:
+        """
+        Parses an observation timestamp the way the observation schemas validate it: an ISO 8601 time, read as UTC
+        when it has no offset. Intervals and non-string values are rejected.
+        """
+
+        try:
+            if not isinstance(value, str):
+                raise ValueError
+            parsed_value = isoparse(value)
+        except (ValueError, OverflowError):
+            raise HttpError(422, f"Observation {component} must be an ISO 8601 timestamp: {value!r}")
+
+        if parsed_value.tzinfo is None:
+            return parsed_value.replace(tzinfo=timezone.utc)
+
+        return parsed_value.astimezone(timezone.utc)
+
+    @staticmethod
+    def parse_observation_result(value, no_data_value: float) -> float:
+        if value is None:
+            return no_data_value
+
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise HttpError(422, "Observation results must be numeric.")
+
+        return float(value) if not math.isnan(value) else no_data_value
+
+    @staticmethod
+    def get_quality_code(result_quality) -> Optional[str]:
+        if isinstance(result_quality, dict):
+            return result_quality.get("qualityCode", result_quality.get("quality_code"))
 
-        return [observation.id for observation in new_observations]
+        return getattr(result_quality, "quality_code", None)
 
     def update_observation(
         self, observation_id: str, observation: ObservationPatchBody
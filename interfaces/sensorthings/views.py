@@ -0,0 +1,53 @@
+from functools import wraps
+from django.db import transaction
+from sensorthings.components.observations.schemas import Observation
+from .cache import cache_anonymous_response
+from .engine.observation import COMPACT_OBSERVATION_SELECT_FIELDS
+
+
+def create_data_array_observations(view_function):
+    @wraps(view_function)
+    def wrapper(request, observations, **kwargs):
+        with transaction.atomic():
+            observation_ids = request.engine.create_data_array_observations(
+                observations=observations
+            )
+
+        return 201, [
+            request.engine.build_ref_link(Observation, observation_id)
+            for observation_id in observation_ids
+        ]
+
+    return wrapper
+
+
+def serialize_compact_observations(view_function):
+    @wraps(view_function)
+    def wrapper(request, *args, **kwargs):
+        params = kwargs["params"]
+
+        if (
+            params.expand
+            or request.ref_response
+            or request.value_response
+            or (
+                params.select
+                and not set(params.select.split(",")).issubset(
+                    COMPACT_OBSERVATION_SELECT_FIELDS
+                )
+            )
+        ):
+            return view_function(request, *args, **kwargs)
+
+        request.response_string = request.engine.list_compact_observations(
+            query_params=params.dict(),
+            result_format=params.result_format,
+        )
+
+        return {"value": []}
+
+    return wrapper
+
+
+def list_observations(view_function):
+    return cache_anonymous_response(serialize_compact_observations(view_function))
@@ -1,11 +1,52 @@
+import mimetypes
+import posixpath
+from pathlib import Path
+from urllib.parse import quote
 from allauth.socialaccount.models import SocialApp
+from django.http import Http404, HttpResponse
 from django.templatetags.static import static
 from django.shortcuts import render
+from django.utils._os import safe_join
 from django.views.decorators.cache import cache_page
+from django.views.static import serve
 from django.conf import settings
 from domains.web.models import InstanceConfiguration, MapLayer, ContactInformation
 
 
+def media(request, path):
+    """
+    Serves file attachments from filesystem storage. Unless MEDIA_SERVE_MODE is "django", the response only carries
+    an X-Accel-Redirect or X-Sendfile header and the web server sends the file, so large downloads don't hold a
+    worker for the whole transfer.
+    """
+
+    document_root = settings.STORAGES["default"]["OPTIONS"]["location"]
+
+    if settings.MEDIA_SERVE_MODE == "django":
+        return serve(request, path, document_root=document_root)
+
+    path = posixpath.normpath(path).lstrip("/")
+    fullpath = Path(safe_join(document_root, path))
+
+    if not fullpath.is_file():
+        raise Http404("File attachment does not exist")
+
+    content_type, encoding = mimetypes.guess_type(str(fullpath))
+    response = HttpResponse(content_type=content_type or "application/octet-stream")
+
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+
+    if settings.MEDIA_SERVE_MODE == "x-accel-redirect":
+        response.headers["X-Accel-Redirect"] = quote(
+            f"{settings.MEDIA_ACCEL_REDIRECT_LOCATION.rstrip('/')}/{path}"
+        )
+    else:
+        response.headers["X-Sendfile"] = str(fullpath)
+
+    return response
+
+
 @cache_page(60 * 10)
 def index(request):
 
@@ -30,6 +30,23 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+@pytest.fixture(autouse=True)
+def use_temporary_file_storage(settings, tmp_path_factory):
+    storage_root = tmp_path_factory.getbasetemp() / "storage"
+    settings.MEDIA_ROOT = str(storage_root / "media")
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": settings.MEDIA_ROOT},
+        },
+        "etl_extraction_cache": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(storage_root / "etl-extraction-cache")},
+        },
+    }
+
+
 @pytest.fixture
 def get_principal():
     def _get_principal(identifier):
@@ -1,13 +1,13 @@
 import pytest
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import Counter
 from types import SimpleNamespace
 from ninja.errors import HttpError
 from django.http import HttpResponse
 from django.utils import timezone
 from domains.etl.models import Task, TaskRun
-from domains.etl.services import TaskService
+from domains.etl.services import TaskService, TaskRunService
 from domains.etl.tasks import mark_etl_task_failure, run_etl_task
 from hydroserverpy.etl.exceptions import ETLError
 from interfaces.api.schemas import (
@@ -236,6 +236,71 @@ def test_list_task_can_expose_failure_count_without_latest_run_result(get_princi
     assert lean_task["latest_run"]["result"] is None
 
 
+def test_task_run_summary_columns_and_log_entries(get_principal):
+    task_id = uuid.UUID("019adbc3-35e8-7f25-bc68-171fb66d446e")
+    started_at = timezone.now()
+    task_run = TaskRun.objects.create(
+        task_id=task_id,
+        status="SUCCESS",
+        started_at=started_at,
+        finished_at=started_at + timedelta(minutes=2),
+        result={
+            "summary": "Loaded 12 values",
+            "failureCount": "1",
+            "values_loaded_total": 12,
+            "log_entries": [{"level": "INFO", "message": "Starting extract step."}],
+        },
+    )
+
+    task_run.refresh_from_db()
+    assert task_run.message == "Loaded 12 values"
+    assert task_run.failure_count == 1
+    assert task_run.values_loaded == 12
+    assert task_run.duration == timedelta(minutes=2)
+    assert "log_entries" not in task_run.result
+    assert task_run.log_entries == [{"level": "INFO", "message": "Starting extract step."}]
+
+    detail = TaskRunService.get(principal=get_principal("owner"), uid=task_run.id, task_id=task_id)
+    assert detail.result["log_entries"] == task_run.log_entries
+
+    task_run.result = {"error": "Failed."}
+    task_run.save(update_fields=["result"])
+    task_run.refresh_from_db()
+    assert task_run.message == "Failed."
+    assert task_run.failure_count is None
+    assert task_run.log_entries == [{"level": "INFO", "message": "Starting extract step."}]
+
+
+def test_task_latest_run_pointer_follows_runs(get_principal):
+    task_id = uuid.UUID("019adbc3-35e8-7f25-bc68-171fb66d446e")
+    fixture_run_id = uuid.UUID("019adb60-8cb6-70cc-a1b1-91c2f0ded756")
+
+    older_run = TaskRun.objects.create(task_id=task_id, status="FAILURE")
+    TaskRun.objects.filter(pk=older_run.pk).update(started_at=timezone.make_aware(datetime(2024, 1, 1)))
+    assert Task.refresh_latest_runs([task_id]) == 1
+    task = Task.objects.get(pk=task_id)
+    assert task.latest_run_id == fixture_run_id
+    assert task.latest_run_status == "SUCCESS"
+
+    latest_run = TaskRun.objects.create(task_id=task_id, status="RUNNING")
+    task.refresh_from_db()
+    assert task.latest_run_id == latest_run.id
+    assert task.latest_run_status == "RUNNING"
+    assert task.latest_run_finished_at is None
+
+    latest_run.status = "SUCCESS"
+    latest_run.finished_at = timezone.now()
+    latest_run.save(update_fields=["status", "finished_at"])
+    task.refresh_from_db()
+    assert task.latest_run_status == "SUCCESS"
+    assert task.latest_run_finished_at == latest_run.finished_at
+
+    TaskRunService.delete(principal=get_principal("owner"), uid=latest_run.id, task_id=task_id)
+    task.refresh_from_db()
+    assert task.latest_run_id == fixture_run_id
+    assert task.latest_run_started_at == TaskRun.objects.get(pk=fixture_run_id).started_at
+
+
 def test_list_task_can_filter_and_order_by_latest_run_fields(get_principal):
     task = Task.objects.create(
         name="Later Task",
@@ -382,7 +447,8 @@ def test_mark_etl_task_failure_keeps_structured_log_entries_from_exception_resul
     assert task_run.result["runtime_variables"]["extractor"]["source_uri"] == (
         "https://example.com/runtime.csv"
     )
-    assert task_run.result["log_entries"] == [
+    assert "log_entries" not in task_run.result
+    assert task_run.log_entries == [
         {
             "timestamp": "2026-03-16T00:00:00Z",
             "level": "INFO",
@@ -0,0 +1,243 @@
+import json
+import uuid
+import pytest
+import requests
+import pandas as pd
+from datetime import datetime, timedelta, timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from hydroserverpy.etl.exceptions import ETLError
+from domains.etl.internal import (
+    HydroServerHTTPExtractor,
+    HydroServerInternalExtractor,
+    HydroServerInternalTransformer,
+    HydroServerInternalLoader,
+    HydroServerAggregationPipeline,
+)
+from domains.etl.cache import purge_extraction_cache
+from domains.etl.models import Task
+from domains.sta.models import Datastream, Observation
+
+
+def build_payload(target_id, timestamps, values):
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(timestamps, utc=True),
+        "value": values,
+        "target_id": str(target_id),
+    })
+
+
+def test_internal_loader_appends_observations():
+    task = Task.objects.select_related("workspace__owner").get(
+        pk="019adbc3-35e8-7f25-bc68-171fb66d446e"
+    )
+    datastream = Datastream.objects.filter(
+        thing__workspace_id=task.workspace_id
+    ).order_by("id").first()
+    value_count = Observation.objects.filter(datastream=datastream).count()
+    end_time = datastream.phenomenon_end_time or datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    payload = build_payload(
+        datastream.id,
+        [end_time - timedelta(hours=1)] + [end_time + timedelta(hours=hour) for hour in range(1, 5)],
+        [0.5, 1.0, float("nan"), 2.0, 3.0],
+    )
+
+    with CaptureQueriesContext(connection) as context:
+        result = HydroServerInternalLoader().load(payload, task_instance=task)
+
+    datastream.refresh_from_db()
+    target_result = result.target_results[str(datastream.id)]
+
+    assert target_result.status == "success"
+    assert target_result.values_loaded == (3 if datastream.phenomenon_end_time else 4)
+    assert datastream.value_count == value_count + target_result.values_loaded
+    assert datastream.phenomenon_end_time == end_time + timedelta(hours=4)
+    assert len(context.captured_queries) < 15
+
+
+def test_internal_loader_missing_target():
+    task = Task.objects.get(pk="019adbc3-35e8-7f25-bc68-171fb66d446e")
+    payload = build_payload(uuid.uuid4(), ["2030-01-01T00:00:00Z"], [1.0])
+
+    with pytest.raises(ETLError) as exc_info:
+        HydroServerInternalLoader().load(payload, task_instance=task)
+
+    assert "Missing datastream IDs" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("sql_aggregation", [True, False])
+@pytest.mark.parametrize("aggregation_statistic, aggregation_interval, timezone_type, timezone_value", [
+    ("simple_mean", 1, "utc", None),
+    ("last_value_of_period", 1, "offset", "-0700"),
+    ("time_weighted_mean", 1, "iana", "America/Denver"),
+    ("time_weighted_mean", 1, "offset", "+0530"),
+    ("simple_mean", 3, "utc", None),
+    ("time_weighted_mean", 2, "iana", "America/Denver"),
+])
+def test_internal_aggregation_pipeline(
+    settings, sql_aggregation, aggregation_statistic, aggregation_interval, timezone_type, timezone_value
+):
+    from hydroserverpy.etl.operations import TemporalAggregationOperation
+    from hydroserverpy.etl.transformers import ETLDataMapping, ETLTargetPath
+
+    task = Task.objects.select_related("workspace__owner").get(
+        pk="019adbc3-35e8-7f25-bc68-171fb66d446e"
+    )
+    source, target = Datastream.objects.filter(
+        thing__workspace_id=task.workspace_id
+    ).order_by("id")[:2]
+    Observation.objects.filter(datastream__in=[source, target]).delete()
+    Datastream.objects.filter(pk=target.pk).update(
+        phenomenon_begin_time=None, phenomenon_end_time=None, value_count=0
+    )
+
+    start = datetime(2025, 3, 7, 3, 15, tzinfo=timezone.utc)
+    timestamps = [start + timedelta(minutes=97 * i + (i % 5) * 13) for i in range(80)]
+    values = [float((i * 7) % 11) + 0.25 * i for i in range(80)]
+    Observation.objects.bulk_create([
+        Observation(datastream=source, phenomenon_time=timestamp, result=value)
+        for timestamp, value in zip(timestamps, values)
+    ])
+
+    operation = TemporalAggregationOperation(
+        target_identifier=str(target.id),
+        aggregation_statistic=aggregation_statistic,
+        aggregation_interval=aggregation_interval,
+        timezone_type=timezone_type,
+        timezone=timezone_value,
+    )
+    expected = operation.apply(pd.DataFrame({
+        "timestamp": pd.to_datetime(timestamps, utc=True),
+        "value": values,
+    }))
+
+    settings.ETL_SQL_AGGREGATION = sql_aggregation
+    settings.ETL_AGGREGATION_CHUNK_DAYS = 1
+
+    pipeline = HydroServerAggregationPipeline(
+        extractor=HydroServerInternalExtractor(),
+        transformer=HydroServerInternalTransformer(
+            timestamp_key="phenomenon_time", timestamp_type="iso", timezone_type="utc"
+        ),
+        loader=HydroServerInternalLoader(),
+    )
+    context = pipeline.run(
+        data_mappings=[ETLDataMapping(
+            source_identifier=str(source.id),
+            target_paths=[ETLTargetPath(
+                target_identifier=str(target.id), data_operations=[operation]
+            )],
+        )],
+        task_instance=task,
+    )
+    result = context.results
+
+    loaded = list(
+        Observation.objects.filter(datastream=target)
+        .order_by("phenomenon_time")
+        .values_list("phenomenon_time", "result")
+    )
+    loaded_ids = Observation.objects.filter(datastream=target).values_list("id", flat=True)
+    target.refresh_from_db()
+
+    assert result.target_results[str(target.id)].status == "success"
+    assert result.values_loaded_total == len(expected) > 0
+    assert [timestamp for timestamp, _ in loaded] == expected["timestamp"].tolist()
+    assert [value for _, value in loaded] == pytest.approx(expected["value"].tolist())
+    assert target.value_count == len(expected)
+    assert target.phenomenon_end_time == expected["timestamp"].max()
+    assert {observation_id.version for observation_id in loaded_ids} == {7}
+
+
+class MockResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size):
+        yield self.content
+
+
+def test_http_extractor_cache(settings, tmp_path, monkeypatch):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "etl_extraction_cache": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path)},
+        },
+    }
+    settings.ETL_EXTRACTION_CACHE_TIMEOUT = 60
+
+    requests_made = []
+    responses = [
+        MockResponse(200, b"timestamp,value\n", {"ETag": '"v1"'}),
+        MockResponse(304),
+        MockResponse(200, b"timestamp,value\n2025-01-01T00:00:00Z,1\n", {"ETag": '"v2"'}),
+    ]
+
+    def mock_get(url, headers=None, timeout=None):
+        requests_made.append(headers or {})
+        return responses.pop(0)
+
+    monkeypatch.setattr("domains.etl.internal.requests.get", mock_get)
+    extractor = HydroServerHTTPExtractor(source_uri="https://example.com/data.csv")
+
+    assert extractor.extract().read() == b"timestamp,value\n"
+    assert extractor.extract().read() == b"timestamp,value\n"
+    assert requests_made == [{}]
+
+    def expire_cache_entries():
+        for metadata_path in tmp_path.glob("v1/*.json"):
+            metadata = json.loads(metadata_path.read_text())
+            metadata["fetched_at"] = (
+                datetime.fromisoformat(metadata["fetched_at"]) - timedelta(minutes=5)
+            ).isoformat()
+            metadata_path.write_text(json.dumps(metadata))
+
+    expire_cache_entries()
+    assert extractor.extract().read() == b"timestamp,value\n"
+    assert requests_made[-1] == {"If-None-Match": '"v1"'}
+
+    expire_cache_entries()
+    assert extractor.extract().read() == b"timestamp,value\n2025-01-01T00:00:00Z,1\n"
+    assert requests_made[-1] == {"If-None-Match": '"v1"'}
+    assert extractor.extract().read() == b"timestamp,value\n2025-01-01T00:00:00Z,1\n"
+    assert len(requests_made) == 3
+
+    assert purge_extraction_cache(max_age=timedelta(days=1)) == 0
+    expire_cache_entries()
+    assert purge_extraction_cache(max_age=timedelta(minutes=1)) == 1
+    assert not list(tmp_path.glob("v1/*"))
+
+
+@pytest.mark.parametrize("response, error", [
+    (MockResponse(503), "status code 503"),
+    (MockResponse(200), "No data was returned"),
+    (requests.exceptions.ConnectionError("refused"), "Failed to connect"),
+])
+def test_http_extractor_does_not_refetch_failed_request(settings, tmp_path, monkeypatch, response, error):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "etl_extraction_cache": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path)},
+        },
+    }
+    settings.ETL_EXTRACTION_CACHE_TIMEOUT = 60
+    requests_made = []
+
+    def mock_get(url, headers=None, timeout=None):
+        requests_made.append(url)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr("domains.etl.internal.requests.get", mock_get)
+
+    with pytest.raises(ETLError, match=error):
+        HydroServerHTTPExtractor(source_uri="https://example.com/data.csv").extract()
+
+    assert len(requests_made) == 1
+    assert not list(tmp_path.glob("v1/*"))
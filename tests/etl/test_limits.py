@@ -0,0 +1,29 @@
+import pytest
+from domains.etl.limits import get_source_limit_key, acquire_source_slot
+from domains.etl.models import DataConnection
+
+DATA_CONNECTION_ID = "019adb5c-da8b-7970-877d-c3b4ca37cc60"
+
+
+@pytest.mark.parametrize("scope, source_uri, concurrency, expected_key", [
+    ("host", "https://Example.com/data/{start}.csv", 2, "host:example.com"),
+    ("host", "/local/data.csv", 2, f"data-connection:{DATA_CONNECTION_ID}"),
+    ("data_connection", "https://example.com/data.csv", 2, f"data-connection:{DATA_CONNECTION_ID}"),
+    ("host", "https://example.com/data.csv", 0, None),
+])
+def test_get_source_limit_key(settings, scope, source_uri, concurrency, expected_key):
+    settings.ETL_SOURCE_LIMIT_SCOPE = scope
+    settings.ETL_SOURCE_CONCURRENCY = concurrency
+    settings.ETL_SOURCE_RATE_LIMIT = 0
+    data_connection = DataConnection.objects.get(pk=DATA_CONNECTION_ID)
+    data_connection.extractor_settings = {"sourceUri": source_uri}
+
+    assert get_source_limit_key(data_connection) == expected_key
+
+
+def test_acquire_source_slot_without_redis(settings, monkeypatch):
+    monkeypatch.setattr("domains.etl.limits._redis_client", None)
+    settings.ETL_SOURCE_LIMIT_REDIS_URL = "redis://127.0.0.1:1/0"
+    settings.ETL_SOURCE_CONCURRENCY = 1
+
+    assert acquire_source_slot("host:example.com", "run-1") == 0
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from domains.etl.models import Task, TaskRun, TaskRunLog, TaskRunRetentionPolicy
+from domains.etl.retention import delete_expired_task_runs
+
+WORKSPACE_ID = "b27c51a0-7374-462d-8a53-d97d47176c10"
+
+
+def create_task_runs(name, ages_in_days):
+    task = Task.objects.create(
+        name=name,
+        workspace_id=WORKSPACE_ID,
+        data_connection_id="019adb5c-da8b-7970-877d-c3b4ca37cc60",
+        orchestration_system_id="019aead4-df4e-7a08-a609-dbc96df6befe",
+    )
+    task_runs = []
+
+    for age in ages_in_days:
+        task_run = TaskRun.objects.create(
+            task=task, status="SUCCESS", result={"log_entries": [{"message": f"{age} days old"}]}
+        )
+        TaskRun.objects.filter(pk=task_run.pk).update(started_at=timezone.now() - timedelta(days=age))
+        task_runs.append(task_run)
+
+    Task.refresh_latest_runs([task.id])
+
+    return task, task_runs
+
+
+def test_delete_expired_task_runs():
+    recent_task, recent_runs = create_task_runs("Recent Task", [1, 20, 30, 40])
+    stale_task, stale_runs = create_task_runs("Stale Task", [20, 30, 40])
+
+    report = delete_expired_task_runs(default_days=14, batch_size=2)
+
+    assert set(TaskRun.objects.filter(task=recent_task).values_list("id", flat=True)) == {recent_runs[0].id}
+    assert set(TaskRun.objects.filter(task=stale_task).values_list("id", flat=True)) == {stale_runs[0].id}
+    assert not TaskRunLog.objects.filter(task_run_id__in=[run.id for run in recent_runs[1:]]).exists()
+    assert report["deleted"] == 5
+    assert report["batches"] == 3
+
+    stale_task.refresh_from_db()
+    assert stale_task.latest_run_id == stale_runs[0].id
+
+
+def test_delete_expired_task_runs_uses_workspace_policy():
+    task, task_runs = create_task_runs("Policy Task", [1, 20, 40])
+    TaskRunRetentionPolicy.objects.create(workspace_id=WORKSPACE_ID, days=30)
+
+    delete_expired_task_runs(default_days=14, max_batches=1)
+
+    assert set(TaskRun.objects.filter(task=task).values_list("id", flat=True)) == {
+        task_runs[0].id, task_runs[1].id
+    }
+
+
+def test_cleanup_etl_task_runs_reports_throughput(capsys):
+    create_task_runs("Reported Task", [1, 20])
+
+    call_command("cleanup_etl_task_runs", "--days=14", "--batch-size=100")
+
+    output = capsys.readouterr().out
+    assert "Cleanup complete. Deleted" in output
+    assert "records/second" in output
@@ -0,0 +1,113 @@
+import uuid
+from types import SimpleNamespace
+from django_celery_beat.models import PeriodicTask, CrontabSchedule
+from hydroserver.celery import app
+from domains.etl.models import Task, TaskRun
+from domains.etl.scheduler import ETLDatabaseScheduler, get_etl_dispatch_countdown
+from domains.etl.tasks import run_etl_task, mark_etl_task_expired
+
+TASK_ID = "019adbc3-35e8-7f25-bc68-171fb66d446e"
+
+
+def create_scheduled_task(name, orchestration_system_id):
+    task = Task.objects.create(
+        name=name,
+        workspace_id="b27c51a0-7374-462d-8a53-d97d47176c10",
+        data_connection_id="019adb5c-da8b-7970-877d-c3b4ca37cc60",
+        orchestration_system_id=orchestration_system_id,
+        periodic_task=PeriodicTask.objects.create(
+            name=name,
+            task="domains.etl.tasks.run_etl_task",
+            enabled=True,
+            crontab=CrontabSchedule.objects.create(minute="0"),
+        ),
+    )
+    task.periodic_task.kwargs = f'{{"task_id": "{task.id}"}}'
+    task.periodic_task.save()
+
+    return task
+
+
+def test_etl_dispatch_countdown(settings):
+    settings.ETL_SCHEDULE_JITTER = 0
+    assert get_etl_dispatch_countdown("Task A") == 0
+
+    settings.ETL_SCHEDULE_JITTER = 300
+    countdowns = [get_etl_dispatch_countdown(f"Task {i}") for i in range(50)]
+    assert all(0 <= countdown <= 300 for countdown in countdowns)
+    assert len(set(countdowns)) > 1
+    assert get_etl_dispatch_countdown("Task 1") == countdowns[1]
+
+
+def test_scheduler_shards_entries_by_orchestration_system(settings):
+    tasks = [
+        create_scheduled_task(f"Sharded Task {i}", orchestration_system_id)
+        for i, orchestration_system_id in enumerate([
+            "019aead4-df4e-7a08-a609-dbc96df6befe",
+            "7cb900d2-eb11-4a59-a05b-dd02d95af312",
+        ] * 2)
+    ]
+    scheduler = ETLDatabaseScheduler(app=app, lazy=True)
+
+    settings.ETL_BEAT_SHARD_COUNT = 1
+    all_names = {periodic_task.name for periodic_task in scheduler.enabled_models()}
+    assert {task.periodic_task.name for task in tasks} <= all_names
+
+    settings.ETL_BEAT_SHARD_COUNT = 3
+    shards = []
+    for shard_index in range(3):
+        settings.ETL_BEAT_SHARD_INDEX = shard_index
+        shards.append({periodic_task.name for periodic_task in scheduler.enabled_models()})
+
+    assert set().union(*shards) == all_names
+    assert sum(len(shard) for shard in shards) == len(all_names)
+    for shard in shards:
+        assert (tasks[0].periodic_task.name in shard) == (tasks[2].periodic_task.name in shard)
+        assert (tasks[1].periodic_task.name in shard) == (tasks[3].periodic_task.name in shard)
+
+
+def test_scheduler_dispatch(settings, monkeypatch):
+    settings.ETL_SCHEDULE_JITTER = 300
+    settings.ETL_SCHEDULE_MAX_QUEUE_DEPTH = 5
+    settings.ETL_TASK_EXPIRE_SECONDS = 600
+    task = create_scheduled_task("Dispatched Task", "019aead4-df4e-7a08-a609-dbc96df6befe")
+    scheduler = ETLDatabaseScheduler(app=app, lazy=True)
+    entry = scheduler.Entry(task.periodic_task, app=app)
+
+    dispatched = []
+    monkeypatch.setattr(run_etl_task, "apply_async", lambda *args, **kwargs: dispatched.append(kwargs))
+    monkeypatch.setattr(scheduler, "get_queue_depth", lambda queue: 5)
+
+    assert scheduler.apply_async(entry, advance=False) is None
+    assert dispatched == []
+    task_run = TaskRun.objects.get(task=task)
+    assert task_run.status == "MISSED"
+    assert task_run.finished_at is not None
+
+    monkeypatch.setattr(scheduler, "get_queue_depth", lambda queue: 4)
+    scheduler.apply_async(entry, advance=False)
+
+    countdown = get_etl_dispatch_countdown(entry.name)
+    assert dispatched[0]["countdown"] == countdown
+    assert dispatched[0]["expires"] == countdown + 600
+
+
+def test_expired_etl_task_run_is_recorded():
+    task_run = TaskRun.objects.create(id=uuid.uuid4(), task_id=TASK_ID, status="RUNNING")
+
+    mark_etl_task_expired(
+        sender=run_etl_task,
+        request=SimpleNamespace(id=str(task_run.id), kwargs={"task_id": TASK_ID}),
+        expired=False,
+    )
+    task_run.refresh_from_db()
+    assert task_run.status == "RUNNING"
+
+    mark_etl_task_expired(
+        sender=run_etl_task,
+        request=SimpleNamespace(id=str(task_run.id), kwargs={"task_id": TASK_ID}),
+        expired=True,
+    )
+    task_run.refresh_from_db()
+    assert task_run.status == "EXPIRED"
+    assert "expired" in task_run.result["message"]
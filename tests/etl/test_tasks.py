@@ -0,0 +1,362 @@
+import uuid
+import pytest
+import pandas as pd
+from io import BytesIO
+from types import SimpleNamespace
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+from django_celery_beat.models import PeriodicTask, CrontabSchedule
+from hydroserverpy.etl.exceptions import ETLError
+from hydroserverpy.etl.extractors import Extractor
+from domains.etl.internal import HydroServerSharedExtractor
+from domains.etl.cache import (
+    get_extraction_cache_storage,
+    stage_load_payload,
+    read_staged_load_payload,
+)
+from domains.etl.models import Task, TaskRun, DataConnectionNotificationRecipient
+from domains.sta.models import Datastream
+from domains.etl.services import TaskService
+from domains.etl.tasks import (
+    _use_parallel_load,
+    _get_parallel_load_target_groups,
+    _acquire_workspace_load_slot,
+    _release_workspace_load_slot,
+    _claim_source_slot,
+    finalize_etl_task_run,
+    run_etl_task_targets,
+    run_etl_task_group,
+    send_orchestration_notifications,
+    send_orchestration_notification_batch,
+)
+
+TASK_ID = "019adbc3-35e8-7f25-bc68-171fb66d446e"
+DATA_CONNECTION_ID = "019adb5c-da8b-7970-877d-c3b4ca37cc60"
+INTERNAL_ORCHESTRATION_SYSTEM_ID = "019aead4-df4e-7a08-a609-dbc96df6befe"
+
+
+def test_parallel_load_target_groups(settings):
+    task = Task.objects.prefetch_related("mappings__paths").get(pk=TASK_ID)
+    path_count = sum(mapping.paths.count() for mapping in task.mappings.all())
+
+    settings.ETL_PARALLEL_LOAD_MIN_TARGETS = 0
+    assert not _use_parallel_load(task)
+
+    settings.ETL_PARALLEL_LOAD_MIN_TARGETS = path_count + 1
+    assert not _use_parallel_load(task)
+
+    settings.ETL_PARALLEL_LOAD_MIN_TARGETS = 1
+    assert _use_parallel_load(task)
+
+    settings.ETL_PARALLEL_LOAD_GROUP_SIZE = 2
+    assert _get_parallel_load_target_groups(["a", "b", "c"]) == [["a", "b"], ["c"]]
+
+
+def test_staged_payload_round_trip():
+    payload = pd.DataFrame({
+        "timestamp": pd.to_datetime(["2030-01-01T00:00:00Z", "2030-01-01T00:15:00.5Z"], utc=True, format="ISO8601"),
+        "value": [1.5, 2.0],
+        "target_id": ["a", "b"],
+    })
+
+    stage_path = stage_load_payload(payload)
+
+    pd.testing.assert_frame_equal(read_staged_load_payload(stage_path, ["a", "b"]), payload)
+    pd.testing.assert_frame_equal(
+        read_staged_load_payload(stage_path, ["b"]), payload[payload["target_id"] == "b"].reset_index(drop=True)
+    )
+    assert read_staged_load_payload(stage_path, ["c"]).empty
+
+
+def test_run_etl_task_targets_loads_staged_payload():
+    task = Task.objects.get(pk=TASK_ID)
+    datastream = Datastream.objects.filter(thing__workspace_id=task.workspace_id).order_by("id").first()
+    payload = pd.DataFrame({
+        "timestamp": pd.to_datetime(["2031-01-01T00:00:00Z", "2031-01-01T01:00:00Z"], utc=True),
+        "value": [1.0, 2.0],
+        "target_id": str(datastream.id),
+    })
+
+    result = run_etl_task_targets.apply(
+        kwargs={"task_id": TASK_ID, "stage_path": stage_load_payload(payload), "target_ids": [str(datastream.id)]}
+    ).get()
+
+    assert result["values_loaded_total"] == 2
+    assert result["target_results"][str(datastream.id)]["status"] == "success"
+
+
+def test_run_etl_task_targets_stops_retrying_for_workspace_slot(monkeypatch):
+    monkeypatch.setattr("domains.etl.tasks._acquire_workspace_load_slot", lambda workspace_id: None)
+
+    result = run_etl_task_targets.apply(
+        kwargs={"task_id": TASK_ID, "stage_path": "staged-loads/missing.csv", "target_ids": []},
+        retries=run_etl_task_targets.max_retries,
+    ).get()
+
+    assert run_etl_task_targets.max_retries is not None
+    assert "Timed out waiting for a parallel load slot" in result["error"]
+
+
+def test_workspace_load_slot(settings):
+    settings.ETL_WORKSPACE_LOAD_CONCURRENCY = 2
+    workspace_id = uuid.uuid4()
+
+    lock_id = _acquire_workspace_load_slot(workspace_id)
+    assert lock_id is not None
+    _release_workspace_load_slot(lock_id)
+
+
+def test_finalize_etl_task_run():
+    task_run = TaskRun.objects.create(
+        id=uuid.uuid4(), task_id=TASK_ID, status="RUNNING", started_at=timezone.now()
+    )
+
+    results = [
+        {
+            "runtime_variables": {"start": "2025-01-01"},
+            "log_entries": [{"message": "first"}],
+            "target_results": {
+                "a": {"target_identifier": "a", "status": "success", "values_loaded": 3},
+                "b": {"target_identifier": "b", "status": "skipped", "values_loaded": 0},
+            },
+        },
+        {
+            "log_entries": [{"message": "second"}],
+            "target_results": {
+                "c": {"target_identifier": "c", "status": "success", "values_loaded": 2},
+            },
+        },
+    ]
+
+    stage_path = stage_load_payload(pd.DataFrame({"timestamp": [], "value": [], "target_id": []}))
+
+    finalize_etl_task_run.apply(
+        args=[results], kwargs={"task_id": TASK_ID, "stage_path": stage_path}, task_id=str(task_run.id)
+    )
+    task_run.refresh_from_db()
+
+    assert not get_extraction_cache_storage().exists(stage_path)
+    assert task_run.status == "SUCCESS"
+    assert task_run.finished_at is not None
+    assert task_run.message == "Loaded 5 total observation(s) into 2 datastream(s)."
+    assert task_run.result["skipped_count"] == 1
+    assert len(task_run.result["target_results"]) == 3
+    assert len(task_run.log_entries) == 2
+
+    finalize_etl_task_run.apply(
+        args=[results + [{"error": "Extraction failed.", "traceback": "..."}]],
+        kwargs={"task_id": TASK_ID},
+        task_id=str(task_run.id),
+    )
+    task_run.refresh_from_db()
+
+    assert task_run.status == "FAILURE"
+    assert task_run.message == "Extraction failed."
+    assert task_run.result["values_loaded_total"] == 5
+
+
+def create_scheduled_task(name, crontab="0 * * * *", paused=False):
+    minute, hour, day_of_month, month_of_year, day_of_week = crontab.split()
+    task = Task.objects.create(
+        name=name,
+        workspace_id="b27c51a0-7374-462d-8a53-d97d47176c10",
+        data_connection_id=DATA_CONNECTION_ID,
+        orchestration_system_id=INTERNAL_ORCHESTRATION_SYSTEM_ID,
+        paused=paused,
+        periodic_task=PeriodicTask.objects.create(
+            name=name,
+            task="domains.etl.tasks.run_etl_task",
+            enabled=not paused,
+            crontab=CrontabSchedule.objects.create(
+                minute=minute,
+                hour=hour,
+                day_of_month=day_of_month,
+                month_of_year=month_of_year,
+                day_of_week=day_of_week,
+            ),
+        ),
+    )
+    task.periodic_task.kwargs = f'{{"task_id": "{task.id}"}}'
+    task.periodic_task.save()
+
+    return task
+
+
+def get_group_periodic_tasks():
+    return PeriodicTask.objects.filter(task="domains.etl.tasks.run_etl_task_group")
+
+
+def test_update_coalesced_scheduling(settings):
+    settings.ETL_COALESCE_SCHEDULES = True
+    tasks = [create_scheduled_task(f"Coalesced Task {i}") for i in range(3)]
+    other_task = create_scheduled_task("Other Schedule Task", crontab="30 * * * *")
+    paused_task = create_scheduled_task("Paused Task", paused=True)
+
+    TaskService.update_coalesced_scheduling(DATA_CONNECTION_ID)
+
+    group_periodic_task = get_group_periodic_tasks().get()
+    assert group_periodic_task.enabled is True
+    assert group_periodic_task.kwargs == (
+        f'{{"data_connection_id": "{DATA_CONNECTION_ID}", "crontab": "0 * * * *"}}'
+    )
+    for task in tasks + [paused_task]:
+        task.periodic_task.refresh_from_db()
+        assert task.periodic_task.enabled is False
+    other_task.periodic_task.refresh_from_db()
+    assert other_task.periodic_task.enabled is True
+
+    TaskService.update_coalesced_scheduling(DATA_CONNECTION_ID)
+    assert get_group_periodic_tasks().count() == 1
+
+    settings.ETL_COALESCE_SCHEDULES = False
+    TaskService.update_coalesced_scheduling(DATA_CONNECTION_ID)
+
+    assert not get_group_periodic_tasks().exists()
+    for task in tasks:
+        task.periodic_task.refresh_from_db()
+        assert task.periodic_task.enabled is True
+    paused_task.periodic_task.refresh_from_db()
+    assert paused_task.periodic_task.enabled is False
+
+
+def test_update_coalesced_etl_schedules_command(settings, capsys):
+    settings.ETL_COALESCE_SCHEDULES = True
+    tasks = [create_scheduled_task(f"Coalesced Task {i}") for i in range(2)]
+
+    call_command("update_coalesced_etl_schedules")
+
+    assert get_group_periodic_tasks().count() == 1
+    for task in tasks:
+        task.periodic_task.refresh_from_db()
+        assert task.periodic_task.enabled is False
+    assert "Updated coalesced ETL schedules" in capsys.readouterr().out
+
+
+def test_run_etl_task_group(settings, monkeypatch):
+    settings.ETL_COALESCE_SCHEDULES = True
+    tasks = [create_scheduled_task(f"Coalesced Task {i}") for i in range(2)]
+    TaskService.update_coalesced_scheduling(DATA_CONNECTION_ID)
+
+    shared_extraction_dicts = []
+
+    def mock_run_etl_pipeline(task, shared_extractions=None, stage_load=False):
+        shared_extraction_dicts.append(shared_extractions)
+        if task.id == tasks[1].id:
+            raise ETLError("Extraction failed.")
+        return SimpleNamespace(
+            results=SimpleNamespace(
+                values_loaded_total=0, success_count=0, dict=lambda: {"earliest_timestamp": timezone.now()}
+            ),
+            runtime_variables={},
+            log_entries=[],
+        )
+
+    monkeypatch.setattr("domains.etl.tasks._run_etl_pipeline", mock_run_etl_pipeline)
+
+    statuses = run_etl_task_group.apply(
+        kwargs={"data_connection_id": DATA_CONNECTION_ID, "crontab": "0 * * * *"}
+    ).get()
+
+    assert statuses == {str(tasks[0].id): "SUCCESS", str(tasks[1].id): "FAILURE"}
+    assert shared_extraction_dicts[0] is shared_extraction_dicts[1]
+    assert TaskRun.objects.get(task=tasks[1]).result["message"] == "Extraction failed."
+    for task in tasks:
+        task.refresh_from_db()
+        assert task.next_run_at is not None
+
+
+def test_shared_extractor():
+    calls = []
+
+    class CountingExtractor(Extractor):
+        source_uri: str
+
+        def extract(self, **kwargs):
+            calls.append(self.source_uri)
+            return BytesIO(b"timestamp,value\n")
+
+    payloads = {}
+    shared_extractors = [
+        HydroServerSharedExtractor(extractor=CountingExtractor(source_uri=source_uri), payloads=payloads)
+        for source_uri in ["a", "a", "b"]
+    ]
+
+    assert [extractor.extract().read() for extractor in shared_extractors] == [b"timestamp,value\n"] * 3
+    assert calls == ["a", "b"]
+
+
+def test_claim_source_slot_defers_run(settings, monkeypatch):
+    settings.ETL_SOURCE_CONCURRENCY = 1
+    task = Task.objects.select_related("data_connection").get(pk=TASK_ID)
+    task_run = TaskRun.objects.create(id=uuid.uuid4(), task=task, status="RUNNING")
+    retries = []
+
+    def retry(countdown, expires, kwargs):
+        retries.append((countdown, kwargs))
+        return RuntimeError("retry")
+
+    task_instance = SimpleNamespace(
+        request=SimpleNamespace(is_eager=False, id=str(task_run.id), kwargs={"task_id": TASK_ID}),
+        retry=retry,
+    )
+
+    monkeypatch.setattr("domains.etl.tasks.acquire_source_slot", lambda source_key, holder_id: 0)
+    assert _claim_source_slot(task_instance, task.data_connection, None) is not None
+
+    monkeypatch.setattr("domains.etl.tasks.acquire_source_slot", lambda source_key, holder_id: 12.5)
+    with pytest.raises(RuntimeError):
+        _claim_source_slot(task_instance, task.data_connection, None, (task_run.id,))
+
+    countdown, retry_kwargs = retries[0]
+    assert countdown == 13
+    assert retry_kwargs["task_id"] == TASK_ID
+    task_run.refresh_from_db()
+    assert task_run.status == "RUNNING"
+    assert task_run.result["deferred_at"] == retry_kwargs["deferred_at"]
+
+
+def test_claim_source_slot_renews_expiry_for_long_deferral(settings, monkeypatch):
+    settings.ETL_SOURCE_CONCURRENCY = 1
+    settings.ETL_TASK_EXPIRE_SECONDS = 60
+    task = Task.objects.select_related("data_connection").get(pk=TASK_ID)
+    retries = []
+
+    def retry(countdown, expires, kwargs):
+        retries.append((countdown, expires))
+        return RuntimeError("retry")
+
+    task_instance = SimpleNamespace(
+        request=SimpleNamespace(is_eager=False, id=str(uuid.uuid4()), kwargs={"task_id": TASK_ID}),
+        retry=retry,
+    )
+
+    monkeypatch.setattr("domains.etl.tasks.acquire_source_slot", lambda source_key, holder_id: 600)
+    with pytest.raises(RuntimeError):
+        _claim_source_slot(task_instance, task.data_connection, None)
+
+    assert retries == [(600, 660)]
+
+
+def test_send_orchestration_notifications(settings, monkeypatch):
+    settings.DATA_CONNECTION_NOTIFICATION_BATCH_SIZE = 1
+    DataConnectionNotificationRecipient.objects.create(data_connection_id=DATA_CONNECTION_ID, email="a@example.com")
+    TaskRun.objects.create(task_id=TASK_ID, status="FAILURE", result={"message": "Extraction failed."})
+    TaskRun.objects.create(task_id=TASK_ID, status="SUCCESS", result={"message": "Loaded 3 values."})
+    dispatched = []
+
+    monkeypatch.setattr(
+        send_orchestration_notification_batch, "apply_async", lambda *args, **kwargs: dispatched.append(kwargs)
+    )
+    send_orchestration_notifications.apply()
+
+    assert len(dispatched) == 1
+    messages = dispatched[0]["kwargs"]["messages"]
+    assert [message["recipients"] for message in messages] == [["a@example.com"]]
+    assert "Test ETL Task" in messages[0]["html_content"]
+    assert "Loaded 3 values." in messages[0]["html_content"]
+
+    send_orchestration_notification_batch.apply(kwargs={"messages": messages})
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["a@example.com"]
+    assert mail.outbox[0].subject == messages[0]["subject"]
@@ -75,7 +75,7 @@ def test_update_account(get_principal, principal, account_data):
 @pytest.mark.parametrize(
     "principal, max_queries",
     [
-        ("owner", 79),
+        ("owner", 90),
         ("admin", 45),
         ("limited", 45),
     ],
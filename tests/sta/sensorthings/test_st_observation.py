@@ -0,0 +1,224 @@
+import math
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from ninja.errors import HttpError
+from odata_query import ast
+from domains.sta.models import Datastream, Observation
+from interfaces.sensorthings.engine.observation import ObservationEngine
+
+
+@pytest.mark.parametrize("principal, status_code", [
+    ("owner", 201),
+    ("viewer", 403),
+    ("anonymous", 403),
+])
+def test_create_data_array_observations(client, get_principal, principal, status_code):
+    user = get_principal(principal)
+    if user:
+        client.force_login(user)
+
+    datastreams = list(
+        Datastream.objects.filter(thing__workspace__owner__email="owner@example.com")
+        .visible(principal=user)
+        .distinct()
+        .order_by("id")[:2]
+    )
+    value_counts = {datastream.id: datastream.value_count or 0 for datastream in datastreams}
+
+    body = [
+        {
+            "Datastream": {"@iot.id": str(datastream.id)},
+            "components": ["phenomenonTime", "result", "resultQuality"],
+            "dataArray": [
+                ["2031-01-01T00:00:00Z", 1.5, {"qualityCode": "A"}],
+                ["2031-01-02T00:00:00Z", 2.5, {"qualityCode": None}],
+            ],
+        }
+        for datastream in datastreams
+    ]
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.post(
+            "/api/sensorthings/v1.1/CreateObservations", body, content_type="application/json"
+        )
+
+    assert response.status_code == status_code
+
+    if status_code == 201:
+        assert len(response.json()) == 4
+        assert len(context.captured_queries) < 12
+        for datastream in Datastream.objects.filter(id__in=value_counts):
+            assert datastream.value_count == value_counts[datastream.id] + 2
+            assert datastream.value_count == Observation.objects.filter(datastream=datastream).count()
+            assert datastream.phenomenon_end_time.year == 2031
+        assert Observation.objects.filter(
+            datastream_id__in=value_counts, quality_code="A"
+        ).count() == 2
+
+
+def test_create_data_array_observations_appends_statistics(client, get_principal):
+    client.force_login(get_principal("owner"))
+    datastream = Datastream.objects.filter(
+        thing__workspace__owner__email="owner@example.com"
+    ).order_by("id").first()
+    value_count = Observation.objects.filter(datastream=datastream).count()
+
+    response = client.post(
+        "/api/sensorthings/v1.1/CreateObservations",
+        [{
+            "Datastream": {"@iot.id": str(datastream.id)},
+            "components": ["phenomenonTime", "result", "resultTime"],
+            "dataArray": [
+                ["2031-01-02T00:00:00Z", 1.0, "2031-01-05T00:00:00Z"],
+                ["2031-01-01T00:00:00+01:00", 2.0, "2031-01-03T00:00:00Z"],
+                ["2031-01-03T00:00:00Z", 3.0, "2031-01-04T00:00:00Z"],
+            ],
+        }],
+        content_type="application/json",
+    )
+
+    assert response.status_code == 201
+    datastream.refresh_from_db()
+    assert datastream.value_count == value_count + 3
+    assert datastream.phenomenon_end_time == datetime(2031, 1, 3, tzinfo=timezone.utc)
+    assert datastream.result_end_time == datetime(2031, 1, 5, tzinfo=timezone.utc)
+    assert datastream.result_begin_time <= datetime(2031, 1, 3, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("row", [
+    ["2031-01-01T00:00:00Z/2031-01-02T00:00:00Z", 1.0],
+    ["1.5", 1.0],
+    ["2031-01-01T00:00:00Z", 1.0, "not a timestamp"],
+    ["2031-01-01T00:00:00Z", 1.0, "2031-01-01T00:00:00Z", {"qualityCode": "A" * 256}],
+])
+def test_create_data_array_observations_rejects_invalid_rows(client, get_principal, row):
+    client.force_login(get_principal("owner"))
+    datastream = Datastream.objects.filter(
+        thing__workspace__owner__email="owner@example.com"
+    ).order_by("id").first()
+    value_count = Observation.objects.filter(datastream=datastream).count()
+
+    response = client.post(
+        "/api/sensorthings/v1.1/CreateObservations",
+        [{
+            "Datastream": {"@iot.id": str(datastream.id)},
+            "components": ["phenomenonTime", "result", "resultTime", "resultQuality"][:len(row)],
+            "dataArray": [row],
+        }],
+        content_type="application/json",
+    )
+
+    assert response.status_code == 422
+    assert Observation.objects.filter(datastream=datastream).count() == value_count
+
+
+@pytest.mark.parametrize("row", [
+    ["2031-01-01T00:00:00Z"],
+    ["2031-01-01T00:00:00Z", 1.0, {"qualityCode": "A"}, "extra"],
+])
+def test_create_data_array_observations_rejects_rows_not_matching_components(client, get_principal, row):
+    client.force_login(get_principal("owner"))
+    datastream = Datastream.objects.filter(
+        thing__workspace__owner__email="owner@example.com"
+    ).order_by("id").first()
+
+    response = client.post(
+        "/api/sensorthings/v1.1/CreateObservations",
+        [{
+            "Datastream": {"@iot.id": str(datastream.id)},
+            "components": ["phenomenonTime", "result", "resultQuality"],
+            "dataArray": [["2031-01-01T00:00:00Z", 1.0, {"qualityCode": "A"}], row],
+        }],
+        content_type="application/json",
+    )
+
+    assert response.status_code == 422
+
+
+def test_parse_observation_row_values():
+    assert ObservationEngine.parse_observation_time("2031-01-01T00:00:00", "phenomenonTime") == datetime(
+        2031, 1, 1, tzinfo=timezone.utc
+    )
+    assert ObservationEngine.parse_observation_time("2031-01-01T02:00:00+02:00", "phenomenonTime") == datetime(
+        2031, 1, 1, tzinfo=timezone.utc
+    )
+    assert ObservationEngine.parse_observation_result(None, -9999) == -9999
+    assert ObservationEngine.parse_observation_result(math.nan, -9999) == -9999
+    assert ObservationEngine.parse_observation_result(2, -9999) == 2.0
+
+    for value in [True, "1.5"]:
+        with pytest.raises(HttpError) as exc_info:
+            ObservationEngine.parse_observation_result(value, -9999)
+        assert exc_info.value.status_code == 422
+
+
+@pytest.mark.parametrize("query_string", [
+    "$top=2&$count=true",
+    "$top=1&$select=result",
+    "$select=id,phenomenonTime,resultQuality",
+    "$resultFormat=dataArray",
+    "$top=3&$resultFormat=dataArray&$select=id,result,resultQuality",
+    "$filter=result gt 2&$orderby=phenomenonTime desc",
+])
+def test_list_compact_observations(client, get_principal, monkeypatch, query_string):
+    client.force_login(get_principal("owner"))
+
+    response = client.get(f"/api/sensorthings/v1.1/Observations?{query_string}")
+    monkeypatch.setattr(
+        "interfaces.sensorthings.views.serialize_compact_observations",
+        lambda view_function: view_function,
+    )
+    expected_response = client.get(f"/api/sensorthings/v1.1/Observations?{query_string}")
+
+    assert response.status_code == expected_response.status_code == 200
+    assert response.json()["value"]
+    assert response.json() == expected_response.json()
+
+
+def test_count_observations(settings):
+    engine = ObservationEngine()
+    engine.request = SimpleNamespace(principal=None)
+    datastream = Datastream.objects.visible(principal=None).filter(observation__isnull=False).first()
+    Datastream.objects.filter(pk=datastream.pk).update(value_count=12345)
+    observations = Observation.objects.filter(datastream=datastream)
+    datastream_filter = ast.Compare(
+        ast.Eq(), ast.Attribute(ast.Identifier("Datastream"), "id"), ast.String(str(datastream.id))
+    )
+
+    settings.ST_API_COUNT_MODE = "exact"
+    assert engine.count_observations(observations, datastream_filter) == (observations.count(), "exact")
+
+    settings.ST_API_COUNT_MODE = "estimated"
+    assert engine.count_observations(observations, datastream_filter) == (12345, "estimated")
+    assert engine.count_observations(
+        observations, datastream_filter, observation_ids=[observations.first().id]
+    ) == (engine.estimate_count(observations), "estimated")
+    assert engine.count_observations(observations) == (engine.estimate_count(observations), "estimated")
+
+
+def test_estimate_count():
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Observation._meta.db_table}")
+
+    assert ObservationEngine.estimate_count(Observation.objects.all()) == Observation.objects.count()
+    assert ObservationEngine.estimate_count(Observation.objects.filter(result__gt=1e12)) >= 0
+
+
+@pytest.mark.parametrize("count_mode, query_string, expected_header", [
+    ("exact", "$count=true", "exact"),
+    ("estimated", "$count=true", "estimated"),
+    ("estimated", "$count=false", None),
+])
+def test_count_mode_header(settings, client, count_mode, query_string, expected_header):
+    settings.ST_API_COUNT_MODE = count_mode
+    settings.ST_API_RESPONSE_CACHE_TIMEOUT = 0
+
+    response = client.get(f"/api/sensorthings/v1.1/Observations?{query_string}")
+
+    assert response.status_code == 200
+    assert response.headers.get("X-Count-Mode") == expected_header
+    if expected_header == "exact":
+        assert response.json()["@iot.count"] == Observation.objects.visible(principal=None).count()
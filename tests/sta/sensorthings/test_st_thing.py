@@ -0,0 +1,90 @@
+import uuid
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from domains.sta.cache import get_sensorthings_response_cache_versions
+from domains.sta.models import Thing, Datastream, ThingTag, Location, DatastreamTag
+from domains.sta.services import ObservationService
+from interfaces.api.schemas.observation import ObservationBulkDeleteBody
+
+
+@pytest.fixture(autouse=True)
+def enable_response_cache(settings):
+    settings.ST_API_RESPONSE_CACHE_TIMEOUT = 60
+
+
+def test_anonymous_responses_are_cached(
+    client, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    response = client.get("/api/sensorthings/v1.1/Things")
+    assert response.status_code == 200
+
+    with django_assert_num_queries(0):
+        cached_response = client.get("/api/sensorthings/v1.1/Things")
+    assert cached_response.content == response.content
+
+    thing = Thing.objects.visible(principal=None).first()
+    thing.name = "Renamed Thing"
+    with django_capture_on_commit_callbacks(execute=True):
+        thing.save()
+
+    response = client.get("/api/sensorthings/v1.1/Things")
+    assert b"Renamed Thing" in response.content
+
+
+def test_datastream_responses_are_invalidated_per_datastream(
+    client, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    datastream, other_datastream = Datastream.objects.visible(principal=None)[:2]
+    url = f"/api/sensorthings/v1.1/Datastreams('{datastream.id}')/Observations"
+
+    assert client.get(url).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        other_datastream.save()
+    with django_assert_num_queries(0):
+        client.get(url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        datastream.save()
+    with CaptureQueriesContext(connection) as context:
+        client.get(url)
+    assert len(context.captured_queries) > 0
+
+
+def test_bulk_observation_delete_invalidates_after_commit(
+    client, django_assert_num_queries, django_capture_on_commit_callbacks, get_principal
+):
+    datastream_id = uuid.UUID("27c70b41-e845-40ea-8cc7-d1b40f89816b")
+    url = f"/api/sensorthings/v1.1/Datastreams('{datastream_id}')/Observations"
+
+    assert client.get(url).json()["value"]
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        ObservationService().bulk_delete(
+            principal=get_principal("owner"),
+            datastream_id=datastream_id,
+            data=ObservationBulkDeleteBody(),
+            update_datastream_statistics=False,
+        )
+        with django_assert_num_queries(0):
+            client.get(url)
+
+    for callback in callbacks:
+        callback()
+    response = client.get(url)
+    assert response.json()["value"] == []
+
+
+@pytest.mark.parametrize("model, scope", [
+    (ThingTag, "things"),
+    (Location, "things"),
+    (DatastreamTag, "datastreams"),
+])
+def test_deletes_invalidate_responses(django_capture_on_commit_callbacks, model, scope):
+    versions = get_sensorthings_response_cache_versions([scope])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        model.objects.filter(pk=model.objects.values("pk")[:1]).delete()
+
+    assert get_sensorthings_response_cache_versions([scope]) != versions
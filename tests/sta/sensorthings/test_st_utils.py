@@ -0,0 +1,76 @@
+import pytest
+from ninja.errors import HttpError
+from interfaces.sensorthings.engine.filters import (
+    compile_filter,
+    parse_filter,
+    transform_model_field,
+)
+
+
+@pytest.mark.parametrize(
+    "component_name, prop, model_field",
+    [
+        ("Thing", "properties__siteType", "site_type"),
+        ("Thing", "name", "name"),
+        ("Location", "name", "name"),
+        ("Location", "Thing__id", "thing_id"),
+        ("Datastream", "Thing__properties__siteType", "thing__site_type"),
+        ("Datastream", "properties__valueCount", "value_count"),
+        ("Observation", "phenomenonTime", "phenomenon_time"),
+        ("Observation", "Datastream__id", "datastream__id"),
+        (
+            "Observation",
+            "Datastream__Thing__properties__workspace__id",
+            "datastream__thing__workspace_id",
+        ),
+    ],
+)
+def test_transform_model_field(component_name, prop, model_field):
+    assert transform_model_field(component_name, prop) == model_field
+
+
+@pytest.mark.parametrize(
+    "filter_string, sql_fragments, indexed",
+    [
+        (
+            "Datastream/id eq '27c70b41-e845-40ea-8cc7-d1b40f89816b'",
+            ['"sta_observation"."datastream_id" ='],
+            True,
+        ),
+        ("result gt 5", ['"sta_observation"."result" >'], False),
+        (
+            "result gt 5 or Datastream/id eq '27c70b41-e845-40ea-8cc7-d1b40f89816b'",
+            [],
+            False,
+        ),
+        (
+            "year(phenomenonTime) eq 2020",
+            [
+                '"sta_observation"."phenomenon_time" >= 2020-01-01 00:00:00+00:00',
+                '"sta_observation"."phenomenon_time" < 2021-01-01 00:00:00+00:00',
+            ],
+            False,
+        ),
+        (
+            "date(phenomenonTime) le 2020-03-01",
+            ['"sta_observation"."phenomenon_time" < 2020-03-02 00:00:00+00:00'],
+            False,
+        ),
+    ],
+)
+def test_compile_observation_filter(filter_string, sql_fragments, indexed):
+    from domains.sta.models import Observation
+
+    compiled_filter = compile_filter("Observation", parse_filter(filter_string))
+    sql = str(Observation.objects.filter(compiled_filter.query_filter).query)
+
+    assert compiled_filter.indexed is indexed
+    assert "EXTRACT" not in sql and "::date" not in sql
+    assert all(fragment in sql for fragment in sql_fragments)
+    assert compile_filter("Observation", parse_filter(filter_string)) is compiled_filter
+
+
+def test_parse_filter_error():
+    with pytest.raises(HttpError) as exc_info:
+        parse_filter("name eq")
+    assert exc_info.value.status_code == 422
@@ -3,13 +3,17 @@ import uuid
 from collections import Counter
 from ninja.errors import HttpError
 from django.http import HttpResponse
+from django.core.files.uploadedfile import SimpleUploadedFile
+from domains.sta.models import Datastream, DatastreamFileAttachment
 from domains.sta.services import DatastreamService
 from interfaces.api.schemas import (
     DatastreamPostBody,
     DatastreamPatchBody,
     DatastreamSummaryResponse,
+    DatastreamDetailResponse,
     TagPostBody,
     TagDeleteBody,
+    FileAttachmentPostBody,
 )
 
 datastream_service = DatastreamService()
@@ -170,6 +174,127 @@ def test_list_datastream(
         assert (DatastreamSummaryResponse.from_orm(thing) for thing in result)
 
 
+def test_list_datastream_expanded_rows_match_model_serialization(django_assert_max_num_queries, get_principal):
+    DatastreamFileAttachment.objects.create(
+        datastream_id="27c70b41-e845-40ea-8cc7-d1b40f89816b",
+        name="Rating Curve",
+        file_attachment="datastreams/27c70b41-e845-40ea-8cc7-d1b40f89816b/rating-curve.csv",
+        file_attachment_type="Rating Curve",
+    )
+    principal = get_principal("owner")
+
+    with django_assert_max_num_queries(2):
+        datastreams = datastream_service.list(
+            principal=principal,
+            response=HttpResponse(),
+            order_by=["name"],
+            filtering={},
+            expand_related=True,
+        )
+
+    expected_datastreams = datastream_service.select_expanded_fields(
+        Datastream.objects.visible(principal=principal).order_by("name", "id").distinct()
+    )
+
+    assert [datastream.model_dump(by_alias=True) for datastream in datastreams] == [
+        DatastreamDetailResponse.model_validate(datastream).model_dump(by_alias=True)
+        for datastream in expected_datastreams
+    ]
+    assert any(datastream.datastream_file_attachments for datastream in datastreams)
+
+
+def test_add_file_attachment_rejects_oversized_file(settings, get_principal):
+    settings.FILE_ATTACHMENT_MAX_SIZE = 4
+
+    with pytest.raises(HttpError) as exc_info:
+        datastream_service.add_file_attachment(
+            principal=get_principal("owner"),
+            uid=uuid.UUID("27c70b41-e845-40ea-8cc7-d1b40f89816b"),
+            file=SimpleUploadedFile("large.csv", b"12345"),
+            data=FileAttachmentPostBody(name="large.csv", file_attachment_type="Other"),
+        )
+    assert exc_info.value.status_code == 413
+    assert not DatastreamFileAttachment.objects.filter(name="large.csv").exists()
+
+
+def test_replace_file_attachment_keeps_existing_file_when_oversized(settings, get_principal):
+    settings.FILE_ATTACHMENT_MAX_SIZE = 4
+    DatastreamFileAttachment.objects.create(
+        datastream_id="27c70b41-e845-40ea-8cc7-d1b40f89816b",
+        name="large.csv",
+        file_attachment="datastreams/27c70b41-e845-40ea-8cc7-d1b40f89816b/large.csv",
+        file_attachment_type="Other",
+    )
+
+    with pytest.raises(HttpError) as exc_info:
+        datastream_service.replace_file_attachment(
+            principal=get_principal("owner"),
+            uid=uuid.UUID("27c70b41-e845-40ea-8cc7-d1b40f89816b"),
+            file=SimpleUploadedFile("large.csv", b"12345"),
+            data=FileAttachmentPostBody(name="large.csv", file_attachment_type="Other"),
+        )
+    assert exc_info.value.status_code == 413
+    assert DatastreamFileAttachment.objects.filter(datastream_id="27c70b41-e845-40ea-8cc7-d1b40f89816b", name="large.csv").exists()
+
+
+def test_list_datastream_cursor_pagination(django_assert_max_num_queries, get_principal):
+    principal = get_principal("owner")
+    all_ids = [
+        datastream.id
+        for datastream in datastream_service.list(
+            principal=principal, response=HttpResponse(), filtering={}
+        )
+    ]
+    paged_ids = []
+    cursor = None
+
+    while True:
+        http_response = HttpResponse()
+        with django_assert_max_num_queries(4):
+            result = datastream_service.list(
+                principal=principal,
+                response=http_response,
+                page_size=2,
+                filtering={},
+                cursor=cursor,
+                count_mode="none",
+            )
+        paged_ids += [datastream.id for datastream in result]
+
+        assert not http_response.has_header("X-Total-Count")
+        if not http_response.has_header("X-Next-Cursor"):
+            break
+        cursor = uuid.UUID(http_response["X-Next-Cursor"])
+
+    assert paged_ids == all_ids
+
+
+def test_list_datastream_estimated_count(get_principal):
+    http_response = HttpResponse()
+    datastream_service.list(
+        principal=get_principal("owner"),
+        response=http_response,
+        filtering={},
+        count_mode="estimated",
+    )
+
+    assert http_response["X-Count-Mode"] == "estimated"
+    assert int(http_response["X-Total-Count"]) >= 0
+
+
+def test_list_datastream_cursor_requires_default_ordering(get_principal):
+    with pytest.raises(HttpError) as exc_info:
+        datastream_service.list(
+            principal=get_principal("owner"),
+            response=HttpResponse(),
+            order_by=["name"],
+            filtering={},
+            cursor=uuid.uuid4(),
+        )
+
+    assert exc_info.value.status_code == 400
+
+
 def test_list_datastream_visualization_bootstrap_returns_lean_metadata():
     bootstrap = datastream_service.list_visualization_bootstrap(principal=None)
 
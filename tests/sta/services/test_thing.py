@@ -1,10 +1,22 @@
 import pytest
 import uuid
+import orjson
 from collections import Counter
+from pydantic.alias_generators import to_camel
 from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from ninja.errors import HttpError
 from django.http import HttpResponse
-from domains.sta.models import Thing
+from domains.sta.cache import (
+    PUBLIC_THING_MARKERS_CACHE_PREFIX,
+    _file_attachment_links,
+    get_file_attachment_link,
+    get_file_attachment_links,
+    get_or_build_public_thing_markers,
+    get_public_thing_markers_cache_version,
+    invalidate_public_thing_markers_cache,
+)
+from domains.sta.models import Thing, ThingFileAttachment
 from domains.sta.services import ThingService
 from interfaces.api.schemas import (
     ThingPostBody,
@@ -14,6 +26,8 @@ from interfaces.api.schemas import (
     TagPostBody,
     TagDeleteBody,
     ThingSummaryResponse,
+    ThingDetailResponse,
+    FileAttachmentPostBody,
 )
 
 thing_service = ThingService()
@@ -85,6 +99,8 @@ thing_service = ThingService()
             6,
         ),
         ("owner", {"bbox": ["-111.794,41.739,-111.793,41.740"]}, ["Public Thing"], 6),
+        ("owner", {"near": "-111.7937,41.7397,0.5"}, ["Public Thing"], 6),
+        ("owner", {"near": "0,0,100"}, [], 6),
         ("owner", {"tag": ["Test Public Key:Test Public Value"]}, ["Public Thing"], 6),
         (
             "owner",
@@ -122,6 +138,157 @@ def test_list_thing(
         assert (ThingSummaryResponse.from_orm(thing) for thing in result)
 
 
+def test_list_thing_cursor_pagination(get_principal):
+    http_response = HttpResponse()
+    first_page = thing_service.list(
+        principal=get_principal("owner"),
+        response=http_response,
+        page_size=2,
+        filtering={},
+    )
+    next_page = thing_service.list(
+        principal=get_principal("owner"),
+        response=HttpResponse(),
+        page_size=2,
+        filtering={},
+        cursor=uuid.UUID(http_response["X-Next-Cursor"]),
+    )
+
+    assert http_response["X-Total-Count"] == "4"
+    assert [thing.id for thing in first_page + next_page] == sorted(
+        thing.id
+        for thing in thing_service.list(
+            principal=get_principal("owner"), response=HttpResponse(), filtering={}
+        )
+    )
+
+
+def test_list_thing_expanded_rows_match_model_serialization(django_assert_max_num_queries, get_principal):
+    ThingFileAttachment.objects.create(
+        thing_id="3b7818af-eff7-4149-8517-e5cad9dc22e1",
+        name="Site Photo",
+        file_attachment="things/3b7818af-eff7-4149-8517-e5cad9dc22e1/site-photo.png",
+        file_attachment_type="Photo",
+    )
+    principal = get_principal("owner")
+
+    with django_assert_max_num_queries(2):
+        things = thing_service.list(
+            principal=principal,
+            response=HttpResponse(),
+            filtering={},
+            expand_related=True,
+        )
+
+    expected_things = thing_service.select_expanded_fields(
+        Thing.objects.visible(principal=principal).order_by("id").distinct()
+    )
+
+    assert [thing.model_dump(by_alias=True) for thing in things] == [
+        ThingDetailResponse.model_validate(thing).model_dump(by_alias=True) for thing in expected_things
+    ]
+    assert things[0].thing_file_attachments[0].link.endswith("site-photo.png")
+
+
+def test_file_attachment_links_are_reused_until_near_expiry(settings, monkeypatch):
+    class SigningStorage:
+        signed_urls = []
+
+        def url(self, name, expire):
+            self.signed_urls.append(f"https://example.com/{name}?expire={expire}&signature={len(self.signed_urls)}")
+            return self.signed_urls[-1]
+
+    settings.FILE_ATTACHMENT_LINK_EXPIRE = 3600
+    storage = SigningStorage()
+    now = 1000.0
+    monkeypatch.setattr("domains.sta.cache.time.time", lambda: now)
+    cache.clear()
+
+    first_link = get_file_attachment_link(storage, "things/signed.pdf")
+    now += 3600 - 301
+    assert get_file_attachment_link(storage, "things/signed.pdf") == first_link
+
+    _file_attachment_links.clear()
+    assert get_file_attachment_links(storage, ["things/signed.pdf", "things/other.pdf"]) == {
+        "things/signed.pdf": first_link,
+        "things/other.pdf": "https://example.com/things/other.pdf?expire=3600&signature=1",
+    }
+
+    now += 2
+    assert get_file_attachment_link(storage, "things/signed.pdf") != first_link
+    assert len(storage.signed_urls) == 3
+
+
+def test_add_file_attachment_rejects_oversized_file(settings, get_principal):
+    settings.FILE_ATTACHMENT_MAX_SIZE = 4
+
+    with pytest.raises(HttpError) as exc_info:
+        thing_service.add_file_attachment(
+            principal=get_principal("owner"),
+            uid=uuid.UUID("3b7818af-eff7-4149-8517-e5cad9dc22e1"),
+            file=SimpleUploadedFile("large.csv", b"12345"),
+            data=FileAttachmentPostBody(name="large.csv", file_attachment_type="Other"),
+        )
+    assert exc_info.value.status_code == 413
+    assert not ThingFileAttachment.objects.filter(name="large.csv").exists()
+
+
+def test_replace_file_attachment_keeps_existing_file_when_oversized(settings, get_principal):
+    settings.FILE_ATTACHMENT_MAX_SIZE = 4
+    ThingFileAttachment.objects.create(
+        thing_id="3b7818af-eff7-4149-8517-e5cad9dc22e1",
+        name="large.csv",
+        file_attachment="things/3b7818af-eff7-4149-8517-e5cad9dc22e1/large.csv",
+        file_attachment_type="Other",
+    )
+
+    with pytest.raises(HttpError) as exc_info:
+        thing_service.replace_file_attachment(
+            principal=get_principal("owner"),
+            uid=uuid.UUID("3b7818af-eff7-4149-8517-e5cad9dc22e1"),
+            file=SimpleUploadedFile("large.csv", b"12345"),
+            data=FileAttachmentPostBody(name="large.csv", file_attachment_type="Other"),
+        )
+    assert exc_info.value.status_code == 413
+    assert ThingFileAttachment.objects.filter(thing_id="3b7818af-eff7-4149-8517-e5cad9dc22e1", name="large.csv").exists()
+
+
+def test_list_thing_near_orders_nearest_first(get_principal):
+    result = thing_service.list(
+        principal=get_principal("owner"),
+        response=HttpResponse(),
+        page=1,
+        page_size=100,
+        order_by=[],
+        filtering={"near": "-111.813924,41.740741,1.5"},
+    )
+
+    assert [thing.name for thing in result] == [
+        "Private Thing Public Workspace",
+        "Private Thing",
+        "Public Thing Private Workspace",
+    ]
+
+
+@pytest.mark.parametrize(
+    "near, message",
+    [
+        ("-111.8,41.7", "exactly 3 comma-separated values"),
+        ("-111.8,north,1", "only numeric values"),
+        ("-111.8,91,1", "Invalid near filter"),
+    ],
+)
+def test_list_thing_rejects_invalid_near_filter(get_principal, near, message):
+    with pytest.raises(HttpError, match=message) as exc_info:
+        thing_service.list(
+            principal=get_principal("owner"),
+            response=HttpResponse(),
+            filtering={"near": near},
+        )
+
+    assert exc_info.value.status_code == 400
+
+
 def test_list_thing_markers_returns_lean_payload_with_site_type(get_principal):
     cache.clear()
 
@@ -185,6 +352,52 @@ def test_list_thing_markers_invalidates_public_cache_on_update():
     assert [marker["name"] for marker in markers] == ["Updated Public Thing"]
 
 
+def test_public_thing_markers_rebuild_is_single_flight(monkeypatch):
+    cache.clear()
+    cache_key = f"{PUBLIC_THING_MARKERS_CACHE_PREFIX}:{get_public_thing_markers_cache_version()}"
+    cache.add(f"{cache_key}:lock", True, timeout=30)
+    builds = []
+
+    def finish_other_rebuild(seconds):
+        cache.set(cache_key, [{"name": "Rebuilt Elsewhere"}])
+
+    monkeypatch.setattr("domains.sta.cache.time.sleep", finish_other_rebuild)
+    markers = get_or_build_public_thing_markers(lambda: builds.append(True) or [])
+
+    assert markers == [{"name": "Rebuilt Elsewhere"}]
+    assert builds == []
+
+    invalidate_public_thing_markers_cache()
+    markers = get_or_build_public_thing_markers(lambda: builds.append(True) or [{"name": "Rebuilt Here"}])
+
+    assert markers == [{"name": "Rebuilt Here"}]
+    assert builds == [True]
+    assert cache.get(cache_key) == [{"name": "Rebuilt Elsewhere"}]
+
+
+@pytest.mark.parametrize(
+    "filtering",
+    [
+        {},
+        {"bbox": ["-111.794,41.739,-111.793,41.740"]},
+        {"bbox": ["-180,-90,180,90", "-111.794,41.739,-111.793,41.740"]},
+        {"bbox": ["0,0,1,1"]},
+        {"site_type": ["Public"]},
+    ],
+)
+def test_render_thing_markers_matches_listed_markers(settings, get_principal, filtering):
+    settings.PUBLIC_THING_MARKERS_TILE_SIZE = 0.1
+    cache.clear()
+
+    for principal in [None, get_principal("owner")]:
+        listed_markers = thing_service.list_markers(principal=principal, filtering=filtering)
+        rendered_markers = orjson.loads(thing_service.render_markers(principal=principal, filtering=filtering))
+
+        assert rendered_markers == [
+            {to_camel(field): value for field, value in marker.items()} for marker in listed_markers
+        ]
+
+
 def test_list_thing_site_summaries_returns_lean_payload_with_tags():
     site_summaries = thing_service.list_site_summaries(principal=None)
 
@@ -529,9 +742,9 @@ def test_edit_thing(get_principal, principal, thing, thing_fields, message, erro
     "principal, thing, message, error_code, max_queries",
     [
         # Test edit Thing
-        ("owner", "3b7818af-eff7-4149-8517-e5cad9dc22e1", None, None, 20),
-        ("editor", "3b7818af-eff7-4149-8517-e5cad9dc22e1", None, None, 20),
-        ("admin", "3b7818af-eff7-4149-8517-e5cad9dc22e1", None, None, 20),
+        ("owner", "3b7818af-eff7-4149-8517-e5cad9dc22e1", None, None, 21),
+        ("editor", "3b7818af-eff7-4149-8517-e5cad9dc22e1", None, None, 21),
+        ("admin", "3b7818af-eff7-4149-8517-e5cad9dc22e1", None, None, 21),
         # Test unauthorized attempts
         (
             "viewer",
@@ -0,0 +1,151 @@
+import struct
+import pytest
+from django.core.cache import cache
+from ninja.errors import HttpError
+from domains.sta.services import ThingService
+from domains.sta.tiles import (
+    TILE_EXTENT,
+    get_tile_bbox,
+    project_to_tile,
+    cluster_tile_features,
+    encode_tile,
+)
+
+thing_service = ThingService()
+
+PUBLIC_THING_TILE = (10, 194, 381)
+
+
+def read_varint(data, position):
+    value, shift = 0, 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def read_fields(data):
+    fields, position = [], 0
+    while position < len(data):
+        key, position = read_varint(data, position)
+        field_number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, position = read_varint(data, position)
+        elif wire_type == 1:
+            value, position = struct.unpack("<d", data[position:position + 8])[0], position + 8
+        else:
+            length, position = read_varint(data, position)
+            value, position = data[position:position + length], position + length
+        fields.append((field_number, value))
+    return fields
+
+
+def decode_tile(tile):
+    (layer_field, layer), = read_fields(tile)
+    assert layer_field == 3
+    layer_fields = read_fields(layer)
+    keys = [value.decode() for field, value in layer_fields if field == 3]
+    values = []
+    for field, value in layer_fields:
+        if field == 4:
+            (value_field, value), = read_fields(value)
+            if value_field == 1:
+                value = value.decode()
+            elif value_field == 6:
+                value = (value >> 1) ^ -(value & 1)
+            elif value_field == 7:
+                value = bool(value)
+            values.append(value)
+
+    features = []
+    for field, feature in layer_fields:
+        if field != 2:
+            continue
+        feature_fields = dict(read_fields(feature))
+        tags, position = [], 0
+        while position < len(feature_fields[2]):
+            tag, position = read_varint(feature_fields[2], position)
+            tags.append(tag)
+        geometry, position = [], 0
+        while position < len(feature_fields[4]):
+            value, position = read_varint(feature_fields[4], position)
+            geometry.append(value)
+        features.append({
+            "type": feature_fields[3],
+            "geometry": geometry,
+            "properties": {keys[tags[i]]: values[tags[i + 1]] for i in range(0, len(tags), 2)},
+        })
+
+    return dict(layer_fields)[1].decode(), features
+
+
+def test_project_to_tile_and_bbox():
+    min_lon, min_lat, max_lon, max_lat = get_tile_bbox(1, 0, 0, buffer=0)
+    assert (min_lon, max_lon) == (-180, 0)
+    assert min_lat == pytest.approx(0, abs=1e-9)
+    assert max_lat == pytest.approx(85.0511287798066)
+
+    assert project_to_tile(-90, 0, 1, 0, 0) == (TILE_EXTENT // 2, TILE_EXTENT)
+    assert project_to_tile(0, 0, 0, 0, 0) == (TILE_EXTENT // 2, TILE_EXTENT // 2)
+
+
+def test_cluster_tile_features():
+    features = cluster_tile_features([
+        (10, 10, {"name": "A"}),
+        (20, 30, {"name": "B"}),
+        (1000, 1000, {"name": "C"}),
+        (-10, 10, {"name": "Buffer"}),
+    ])
+
+    assert sorted(features, key=lambda feature: feature[0]) == [
+        (15, 20, {"cluster": True, "pointCount": 2}),
+        (1000, 1000, {"name": "C"}),
+    ]
+
+
+def test_encode_tile():
+    layer_name, features = decode_tile(
+        encode_tile("things", [(5, -3, {"name": "A", "isPrivate": False, "count": 2, "missing": None})])
+    )
+
+    assert layer_name == "things"
+    assert features == [{
+        "type": 1,
+        "geometry": [9, 10, 5],
+        "properties": {"name": "A", "isPrivate": False, "count": 2},
+    }]
+
+
+def test_render_marker_tile(settings, django_assert_num_queries):
+    settings.THING_TILE_CLUSTER_MAX_ZOOM = 0
+    cache.clear()
+
+    _, features = decode_tile(thing_service.render_marker_tile(None, *PUBLIC_THING_TILE))
+    assert [feature["properties"]["name"] for feature in features] == ["Public Thing"]
+    assert set(features[0]["properties"]) == {"id", "workspaceId", "name", "siteType", "isPrivate"}
+
+    with django_assert_num_queries(0):
+        thing_service.render_marker_tile(None, *PUBLIC_THING_TILE)
+
+    _, features = decode_tile(thing_service.render_marker_tile(None, 10, 0, 0))
+    assert features == []
+
+    with pytest.raises(HttpError) as exc_info:
+        thing_service.render_marker_tile(None, 1, 2, 0)
+    assert exc_info.value.status_code == 404
+
+
+def test_render_marker_tile_clusters_at_low_zoom(settings, get_principal):
+    settings.THING_TILE_CLUSTER_MAX_ZOOM = 10
+    cache.clear()
+
+    principal = get_principal("owner")
+    _, features = decode_tile(thing_service.render_marker_tile(principal, 0, 0, 0))
+
+    assert sum(feature["properties"].get("pointCount", 1) for feature in features) == len(
+        thing_service.list_markers(principal)
+    )
+    assert any(feature["properties"].get("cluster") for feature in features)
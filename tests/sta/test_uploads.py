@@ -0,0 +1,77 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import StopUpload
+from django.http import Http404, HttpRequest
+from django.test import RequestFactory
+from domains.sta.models import ThingFileAttachment
+from domains.sta.uploads import FileAttachmentUploadHandler
+from interfaces.web.views import media
+
+
+def test_file_attachment_upload_handler_stops_reading_past_max_size(settings):
+    settings.FILE_ATTACHMENT_MAX_SIZE = 8
+    request = HttpRequest()
+    handler = FileAttachmentUploadHandler(request)
+    handler.new_file("file", "data.csv", "text/csv", 12)
+
+    handler.receive_data_chunk(b"1234", 0)
+    handler.receive_data_chunk(b"5678", 4)
+    with pytest.raises(StopUpload) as exc_info:
+        handler.receive_data_chunk(b"9012", 8)
+
+    assert exc_info.value.connection_reset
+    assert request.file_attachment_too_large
+    handler.file.close()
+
+
+def test_add_file_attachment_over_max_size_returns_413(settings, client, get_principal):
+    settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 0
+    settings.FILE_ATTACHMENT_MAX_SIZE = 4
+    client.force_login(get_principal("owner"))
+
+    response = client.post(
+        "/api/data/things/3b7818af-eff7-4149-8517-e5cad9dc22e1/file-attachments",
+        {"file": SimpleUploadedFile("large.csv", b"12345"), "file_attachment_type": "Other"},
+    )
+
+    assert response.status_code == 413
+    assert not ThingFileAttachment.objects.filter(name="large.csv").exists()
+
+
+@pytest.mark.parametrize(
+    "serve_mode, header, expected",
+    [
+        ("x-accel-redirect", "X-Accel-Redirect", "/protected-media/things/site%20photo.png"),
+        ("x-sendfile", "X-Sendfile", "things/site photo.png"),
+    ],
+)
+def test_media_offloads_file_to_web_server(settings, tmp_path, serve_mode, header, expected):
+    (tmp_path / "things").mkdir()
+    (tmp_path / "things" / "site photo.png").write_bytes(b"png")
+    settings.STORAGES = {**settings.STORAGES, "default": {**settings.STORAGES["default"], "OPTIONS": {
+        "location": str(tmp_path)
+    }}}
+    settings.MEDIA_SERVE_MODE = serve_mode
+
+    response = media(RequestFactory().get("/media/things/site photo.png"), "things/site photo.png")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response["Content-Type"] == "image/png"
+    assert response[header].endswith(expected)
+
+    with pytest.raises(Http404):
+        media(RequestFactory().get("/media/things/missing.png"), "things/missing.png")
+
+
+def test_media_streams_file_in_django_mode(settings, tmp_path):
+    (tmp_path / "data.csv").write_bytes(b"a,b\n1,2\n")
+    settings.STORAGES = {**settings.STORAGES, "default": {**settings.STORAGES["default"], "OPTIONS": {
+        "location": str(tmp_path)
+    }}}
+    settings.MEDIA_SERVE_MODE = "django"
+
+    response = media(RequestFactory().get("/media/data.csv"), "data.csv")
+
+    assert response.streaming
+    assert b"".join(response.streaming_content) == b"a,b\n1,2\n"